@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import os
 import subprocess
@@ -7,6 +8,12 @@ from typing import Any
 
 from temporalio import activity
 
+try:
+    # orjson parses large JSON files several times faster when it is installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import Pydantic models for type safety
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import contextlib
@@ -17,6 +24,14 @@ from models import AnalyzeWithClaudeInput, AnalyzeWithClaudeOutput, PromptContex
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@functools.cache
+def _get_claude_response_cache() -> Any:
+    """Return the ClaudeResponseCache shared by every Claude analysis in this worker process."""
+    from investigator.core.claude_analyzer import ClaudeResponseCache
+
+    return ClaudeResponseCache()
+
+
 @activity.defn
 async def update_repos_list() -> dict[str, Any]:
     """
@@ -95,16 +110,26 @@ async def update_repos_list() -> dict[str, Any]:
         return {"status": "failed", "error": error_msg}
 
 
+@functools.lru_cache(maxsize=1)
+def _load_repos_config(path: str, _mtime_ns: int, _size: int) -> dict[str, Any]:
+    """Parse repos.json; mtime and size are only part of the cache key so edits are picked up."""
+    with open(path, "rb") as f:
+        repos_data: dict[str, Any] = _json_loads(f.read())
+    activity.logger.info(
+        f"Successfully read repos.json with {len(repos_data.get('repositories', {}))} repositories"
+    )
+    return repos_data
+
+
 @activity.defn
 async def read_repos_config() -> dict[str, Any]:
     """
     Activity to read the repositories configuration from repos.json.
 
     Returns:
-        Dictionary containing the repositories configuration
+        Dictionary containing the repositories configuration. The parsed file is
+        reused while its mtime and size are unchanged; callers must not mutate it.
     """
-    import os
-
     activity.logger.info("Reading repositories configuration")
 
     repos_file_path = os.path.join(
@@ -114,14 +139,8 @@ async def read_repos_config() -> dict[str, Any]:
     )
 
     try:
-        with open(repos_file_path) as f:
-            repos_data = json.load(f)
-            activity.logger.info(
-                f"Successfully read repos.json with {len(repos_data.get('repositories', {}))} repositories"
-            )
-            # Explicitly cast to dict[str, Any] to satisfy mypy
-            result: dict[str, Any] = repos_data
-            return result
+        stat = os.stat(repos_file_path)
+        return _load_repos_config(repos_file_path, stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         activity.logger.error("Failed to read repos.json: %s", e)
         return {"error": str(e), "repositories": {}}
@@ -532,7 +551,7 @@ async def analyze_with_claude_context(
         sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         import logging
 
-        from activities.investigation_cache import InvestigationCache
+        from activities.investigation_cache import get_investigation_cache, prompt_storage_key
         from investigator.core.claude_analyzer import ClaudeAnalyzer
         from utils.dynamodb_client import get_dynamodb_client
         from utils.prompt_context import create_prompt_context_from_dict
@@ -572,7 +591,7 @@ async def analyze_with_claude_context(
                     from utils.dynamodb_client import get_dynamodb_client
 
                     storage_client = get_dynamodb_client()
-                cache = InvestigationCache(storage_client)
+                cache = get_investigation_cache(storage_client)
 
                 # Check if this prompt needs analysis for this commit AND version
                 cache_check = cache.check_prompt_needs_analysis(
@@ -590,15 +609,12 @@ async def analyze_with_claude_context(
                 result_key = cache_check.get("cached_result_key")
                 if not result_key:
                     # Generate the cache key if not provided
-                    from utils.storage_keys import KeyNameCreator
-
-                    cache_key_obj = KeyNameCreator.create_prompt_cache_key(
-                        repo_name=repo_name,
-                        step_name=step_name,
-                        commit_sha=latest_commit,
-                        prompt_version=context_dict.get("prompt_version", "1"),
+                    result_key = prompt_storage_key(
+                        repo_name,
+                        step_name,
+                        latest_commit,
+                        context_dict.get("prompt_version", "1"),
                     )
-                    result_key = cache_key_obj.to_storage_key()
 
                 activity.logger.info("Using cached result with key: %s", result_key)
 
@@ -647,11 +663,13 @@ async def analyze_with_claude_context(
                 "Claude API key not configured. Set ANTHROPIC_API_KEY environment variable."
             )
 
-        claude_analyzer = ClaudeAnalyzer(api_key, logger)
+        claude_analyzer = ClaudeAnalyzer(
+            api_key, logger, response_cache=_get_claude_response_cache()
+        )
 
         # Perform the analysis
         activity.logger.info("Calling Claude API for analysis")
-        result = claude_analyzer.analyze_with_context(
+        result = await claude_analyzer.analyze_with_context_async(
             prompt_content, repo_structure, context_to_use, config_overrides=config_overrides
         )
 
@@ -672,7 +690,7 @@ async def analyze_with_claude_context(
                 from utils.dynamodb_client import get_dynamodb_client
 
                 storage_client = get_dynamodb_client()
-            cache = InvestigationCache(storage_client)
+            cache = get_investigation_cache(storage_client)
 
             # Use commit SHA if available, otherwise use a placeholder
             commit_to_use = latest_commit if latest_commit else "no-commit"
@@ -687,20 +705,18 @@ async def analyze_with_claude_context(
                 ttl_days=90,
             )
 
-            if cache_save_result["status"] == "success":
+            if cache_save_result.status == "success":
                 # Use the cache key as the result key
-                result_key = cache_save_result["cache_key"]
+                result_key = cache_save_result.cache_key
                 activity.logger.info(
                     f"Successfully saved and cached prompt result with key: {result_key}"
                 )
             else:
                 # This should not happen, but log it
                 activity.logger.error(
-                    f"Failed to save prompt result: {cache_save_result.get('message', 'Unknown error')}"
+                    f"Failed to save prompt result: {cache_save_result.message or 'Unknown error'}"
                 )
-                raise Exception(
-                    f"Failed to save result: {cache_save_result.get('message')}"
-                ) from None
+                raise Exception(f"Failed to save result: {cache_save_result.message}") from None
         except Exception as e:
             activity.logger.error("Failed to save result: %s", e)
             raise
@@ -1264,7 +1280,7 @@ async def write_analysis_result_activity(repo_path: str, final_analysis: str) ->
         file_manager = FileManager(logger)
 
         # Write final analysis to file
-        arch_file_path = file_manager.write_analysis(repo_path, final_analysis)
+        arch_file_path = await file_manager.write_analysis_async(repo_path, final_analysis)
 
         activity.logger.info("Analysis written to: %s", arch_file_path)
 
@@ -1683,11 +1699,11 @@ async def cache_dependencies_activity(
 
             storage_client = get_dynamodb_client()
 
-        from activities.investigation_cache import InvestigationCache
+        from activities.investigation_cache import get_investigation_cache
         from utils.storage_keys import KeyNameCreator
 
         # Create cache instance
-        cache = InvestigationCache(storage_client)
+        cache = get_investigation_cache(storage_client)
 
         # Generate a unique key for dependencies
         deps_key = KeyNameCreator.create_dependencies_key(repo_name)
@@ -1698,17 +1714,15 @@ async def cache_dependencies_activity(
             repo_name=repo_name, dependencies_data=dependencies_data, reference_key=reference_key
         )
 
-        if result["status"] == "success":
+        if result.status == "success":
             activity.logger.info("Successfully cached dependencies for %s", repo_name)
-            return {"status": "success", "deps_reference_key": result["reference_key"]}
+            return {"status": "success", "deps_reference_key": result.cache_key}
         else:
-            activity.logger.error(
-                f"Failed to cache dependencies: {result.get('error', 'Unknown error')}"
-            )
+            activity.logger.error(f"Failed to cache dependencies: {result.message}")
             return {
                 "status": "failed",
                 "deps_reference_key": None,
-                "error": result.get("error", "Unknown error"),
+                "error": result.message or "Unknown error",
             }
 
     except Exception as e:
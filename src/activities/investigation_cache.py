@@ -6,7 +6,14 @@ investigations, determining when a repository needs re-investigation and
 managing the storage of investigation metadata.
 """
 
+import functools
 import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from typing import Any
 
@@ -16,13 +23,181 @@ from models.investigation import (
     InvestigationMetadata,
     PromptMetadata,
     RepositoryState,
+    validate_investigation_metadata,
 )
+from utils.cache_ttl import adaptive_ttl_days, ttl_days_to_minutes
 
 # Import the key name creator for consistent key generation
 from utils.storage_keys import KeyNameCreator
 
 logger = logging.getLogger(__name__)
 
+# How long a fetched investigation record is reused before storage is consulted again
+LAST_INVESTIGATION_MEMO_TTL_SECONDS = 60
+
+# Prompt results kept in-process after a save or read, so the next check skips storage
+PROMPT_RESULT_CACHE_MAX_ENTRIES = 1024
+
+# Dependencies entries kept in-process after a save or read
+DEPENDENCIES_CACHE_MAX_ENTRIES = 4096
+
+# How long an entry read from storage is served in-process; saves use their own TTL
+LOCAL_READ_TTL_SECONDS = 300
+
+# Attributes the investigation check actually reads; analysis_data is left in storage
+LAST_INVESTIGATION_ATTRIBUTES = [
+    "repository_name",
+    "latest_commit",
+    "branch_name",
+    "analysis_timestamp",
+    "analysis_timestamp_iso",
+    "prompt_metadata",
+    "stable_streak",
+]
+
+
+@functools.lru_cache(maxsize=256)
+def _validated_prompt_metadata(prompt_versions: tuple[tuple[str, str], ...]) -> dict[str, Any]:
+    """Validate and serialize prompt metadata, memoized per distinct prompt set."""
+    return asdict(PromptMetadata(count=len(prompt_versions), versions=dict(prompt_versions)))
+
+
+def _dump_prompt_metadata(prompt_versions: dict[str, str]) -> dict[str, Any]:
+    """
+    Serialize prompt metadata, validating each distinct prompt set only once.
+
+    The result is placed in caller-owned analysis data, so every call gets its own copy.
+    """
+    metadata = _validated_prompt_metadata(tuple(sorted(prompt_versions.items())))
+    return {**metadata, "versions": dict(metadata["versions"])}
+
+
+@functools.lru_cache(maxsize=8192)
+def prompt_storage_key(
+    repo_name: str, step_name: str, commit_sha: str, prompt_version: str
+) -> str:
+    """Build the prompt cache storage key, memoized per (repo, step, commit, version)."""
+    return KeyNameCreator.create_prompt_cache_key(
+        repo_name=repo_name,
+        step_name=step_name,
+        commit_sha=commit_sha,
+        prompt_version=prompt_version,
+    ).to_storage_key()
+
+
+def _normalize_prompt_metadata(prompt_metadata: Any) -> PromptMetadata | None:
+    """Coerce stored prompt metadata (model, raw dict or missing) into a PromptMetadata."""
+    if not prompt_metadata:
+        return None
+    if isinstance(prompt_metadata, PromptMetadata):
+        return prompt_metadata
+    # Stored data was validated when it was saved; don't re-run validators on legacy dicts
+    return PromptMetadata.from_cache(
+        {
+            "count": prompt_metadata.get("count", 0),
+            "versions": prompt_metadata.get("versions", {}),
+        }
+    )
+
+
+class _ExpiringLru:
+    """Bounded in-process LRU whose entries also expire after a per-entry TTL."""
+
+    __slots__ = ("_entries", "_max_entries")
+
+    def __init__(self, max_entries: int):
+        # key -> (monotonic expiry, value)
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._max_entries = max_entries
+
+    def put(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store a value, evicting the least recently used entries beyond the bound."""
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Any | None:
+        """Return an unexpired value, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+
+@dataclass(slots=True, frozen=True)
+class CacheOpResult:
+    """
+    Outcome of a prompt result or dependencies save.
+
+    Supports result["status"] and result.get("message") so callers written
+    against the old dict envelope keep working.
+    """
+
+    status: str
+    message: str | None = None
+    cache_key: str | None = None
+    timestamp: Any = None
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a field by name, or default if there is no such field."""
+        return getattr(self, name, default)
+
+
+@dataclass(slots=True, frozen=True)
+class _LastInvestigationView:
+    """Fields of the last investigation the change checks compare against, read once."""
+
+    commit: str
+    branch: str
+    timestamp: float
+    date: str
+    prompt_count: int
+    prompt_versions: dict[str, str]
+    raw: Any
+
+    @classmethod
+    def from_record(cls, last_investigation: Any, raw: Any) -> "_LastInvestigationView":
+        """
+        Build a view from a raw stored dict or a validated InvestigationMetadata.
+
+        raw is the stored data returned on decisions, resolved once by the caller.
+        """
+        # Records are raw dicts unless the caller asked for validation
+        if isinstance(last_investigation, InvestigationMetadata):
+            commit = last_investigation.latest_commit or ""
+            branch = last_investigation.branch_name
+            timestamp = last_investigation.analysis_timestamp
+            timestamp_iso = last_investigation.analysis_timestamp_iso
+            prompt_metadata = last_investigation.prompt_metadata
+        else:
+            commit = last_investigation.get("latest_commit", "")
+            branch = last_investigation.get("branch_name", "")
+            timestamp = last_investigation.get("analysis_timestamp", 0)
+            timestamp_iso = last_investigation.get("analysis_timestamp_iso")
+            prompt_metadata = _normalize_prompt_metadata(last_investigation.get("prompt_metadata"))
+
+        return cls(
+            commit=commit,
+            branch=branch,
+            timestamp=timestamp,
+            # Rows saved before analysis_timestamp_iso existed only carry the numeric timestamp
+            date=timestamp_iso or datetime.fromtimestamp(timestamp, tz=UTC).isoformat(),
+            prompt_count=prompt_metadata.count if prompt_metadata else 0,
+            prompt_versions=prompt_metadata.versions if prompt_metadata else {},
+            raw=raw,
+        )
+
 
 class InvestigationCache:
     """
@@ -44,6 +219,41 @@ class InvestigationCache:
         """
         self.storage_client = storage_client
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # repo_name -> (expires_at, parsed last investigation)
+        self._last_investigation_memo: dict[str, tuple[float, Any]] = {}
+        # Latest known stable_streak per repo; widens prompt result TTLs for stable repos
+        self._stable_streaks: dict[str, int] = {}
+        # In-process tier in front of storage for prompt results and dependencies
+        self._prompt_results = _ExpiringLru(PROMPT_RESULT_CACHE_MAX_ENTRIES)
+        self._dependencies = _ExpiringLru(DEPENDENCIES_CACHE_MAX_ENTRIES)
+        # Dependencies reads in flight, so concurrent misses on a key share one storage call
+        self._inflight_dependencies: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def invalidate_last_investigation(self, repo_name: str | None = None) -> None:
+        """
+        Drop memoized investigation records so the next check reads from storage.
+
+        Args:
+            repo_name: Repository to invalidate, or None to clear every entry
+        """
+        if repo_name is None:
+            self._last_investigation_memo.clear()
+        else:
+            self._last_investigation_memo.pop(repo_name, None)
+
+    def _remember_prompt_result(
+        self,
+        prompt_cache_key: str,
+        result_content: str,
+        ttl_seconds: float = LOCAL_READ_TTL_SECONDS,
+    ) -> None:
+        """Keep a prompt result in process, evicting the least recently used."""
+        self._prompt_results.put(prompt_cache_key, result_content, ttl_seconds)
+
+    def _recall_prompt_result(self, prompt_cache_key: str) -> str | None:
+        """Return an unexpired in-process prompt result, or None."""
+        return self._prompt_results.get(prompt_cache_key)
 
     def _get_raw_investigation_data(self, investigation: Any) -> Any:
         """Get raw investigation data for backward compatibility with tests."""
@@ -72,35 +282,39 @@ class InvestigationCache:
 
         # Fetch last investigation from storage
         last_investigation = self._fetch_last_investigation(repo_name, current_state)
+        return self._decide_from_last_investigation(
+            repo_name, current_state, current_prompt_versions, last_investigation
+        )
+
+    def _decide_from_last_investigation(
+        self,
+        repo_name: str,
+        current_state: RepositoryState,
+        current_prompt_versions: dict[str, str] | None,
+        last_investigation: Any,
+    ) -> InvestigationDecision:
+        """Run the change checks against an already-fetched last investigation."""
         if isinstance(last_investigation, InvestigationDecision):
             return last_investigation  # Early return for errors or no previous investigation
 
         # Extract and log last investigation data
-        last_investigation_data = self._extract_last_investigation_data(last_investigation)
+        last = self._extract_last_investigation_data(last_investigation)
 
         # Run checks in order - each can return early if investigation is needed
-        decision = self._check_commit_changes(
-            current_state, last_investigation_data, last_investigation
-        )
+        decision = self._check_commit_changes(current_state, last)
         if decision:
             return decision
 
-        decision = self._check_branch_changes(
-            current_state, last_investigation_data, last_investigation
-        )
+        decision = self._check_branch_changes(current_state, last)
         if decision:
             return decision
 
-        decision = self._check_prompt_version_changes(
-            current_state, current_prompt_versions, last_investigation
-        )
+        decision = self._check_prompt_version_changes(current_state, current_prompt_versions, last)
         if decision:
             return decision
 
         # No changes detected - return no investigation needed
-        return self._create_no_investigation_decision(
-            repo_name, current_state, last_investigation_data, last_investigation
-        )
+        return self._create_no_investigation_decision(repo_name, current_state, last)
 
     def _log_initial_state(
         self,
@@ -117,177 +331,212 @@ class InvestigationCache:
         )
 
         if current_prompt_versions:
-            self.logger.info(
-                "📝 CURRENT PROMPTS: %s prompts - %s",
-                len(current_prompt_versions),
-                list(current_prompt_versions.keys()),
-            )
-            for name, version in current_prompt_versions.items():
-                self.logger.debug("   - %s: v%s", version, name)
+            # Only materialize the prompt name list when the line will be emitted
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "📝 CURRENT PROMPTS: %s prompts - %s",
+                    len(current_prompt_versions),
+                    list(current_prompt_versions),
+                )
+            self.logger.debug("   Prompt versions: %r", current_prompt_versions)
         else:
             self.logger.warning("⚠️  NO PROMPT VERSIONS provided - version checking disabled")
 
-    def _fetch_last_investigation(self, repo_name: str, current_state: RepositoryState) -> Any:
+    def _get_latest_investigation_record(self, repo_name: str) -> dict[str, Any] | None:
+        """Read the latest investigation, projected to the checked fields when supported."""
+        # Look the method up on the class so test doubles fall back to the full read
+        if hasattr(type(self.storage_client), "get_latest_investigation_projection"):
+            return self.storage_client.get_latest_investigation_projection(
+                repo_name, LAST_INVESTIGATION_ATTRIBUTES
+            )
+        return self.storage_client.get_latest_investigation(repo_name)
+
+    def _get_memoized_last_investigation(self, repo_name: str) -> Any:
+        """Return the memoized last investigation for repo_name, or None if absent or expired."""
+        memo = self._last_investigation_memo.get(repo_name)
+        if memo and memo[0] > time.monotonic():
+            self.logger.info("✅ STORAGE: Reusing previous investigation fetched in-process")
+            return memo[1]
+        return None
+
+    def _fetch_last_investigation(
+        self, repo_name: str, current_state: RepositoryState, validate: bool = False
+    ) -> Any:
         """
         Fetch the last investigation from storage.
 
+        Args:
+            repo_name: Name of the repository
+            current_state: Current state of the repository
+            validate: Parse the record into InvestigationMetadata instead of
+                returning the raw stored dict
+
         Returns:
-            Either the InvestigationMetadata, or an InvestigationDecision if
+            Either the stored record, or an InvestigationDecision if
             there's an error or no previous investigation found.
         """
+        memoized = self._get_memoized_last_investigation(repo_name)
+        if memoized is not None:
+            return memoized
+
         self.logger.info("🗃️  STORAGE: Looking up previous investigation for %s", repo_name)
         try:
-            raw_data = self.storage_client.get_latest_investigation(repo_name)
-            if raw_data:
-                self.logger.info("✅ STORAGE: Found previous investigation")
-                # Parse raw data into Pydantic model for validation
-                try:
-                    # Handle prompt_metadata conversion
-                    if raw_data.get("prompt_metadata"):
-                        prompt_meta_data = raw_data["prompt_metadata"]
-                        raw_data["prompt_metadata"] = PromptMetadata(**prompt_meta_data)
-
-                    last_investigation = InvestigationMetadata(**raw_data)
-                    # Store both the parsed model and raw data for backward compatibility
-                    last_investigation._raw_data = raw_data
-                    return last_investigation
-                except Exception as parse_error:
-                    self.logger.warning(
-                        "⚠️  Failed to parse investigation metadata: %s", parse_error
-                    )
-                    self.logger.warning("   Raw data: %s", raw_data)
-                    # Continue with raw data for backward compatibility
-                    return raw_data
-            else:
-                self.logger.info("❌ STORAGE: No previous investigation found")
-                self.logger.info(
-                    "🆕 DECISION: No previous investigation found for %s - NEEDS INVESTIGATION",
-                    repo_name,
-                )
-                return InvestigationDecision(
-                    needs_investigation=True,
-                    reason="No previous investigation found",
-                    latest_commit=current_state.commit_sha,
-                    branch_name=current_state.branch_name,
-                    last_investigation=None,
-                )
+            raw_data = self._get_latest_investigation_record(repo_name)
+            return self._resolve_last_investigation(repo_name, current_state, raw_data, validate)
         except Exception as e:
-            self.logger.error(
-                "💥 STORAGE ERROR: Failed to check storage for previous investigation: %s", e
+            return self._create_storage_error_decision(current_state, e)
+
+    def _resolve_last_investigation(
+        self,
+        repo_name: str,
+        current_state: RepositoryState,
+        raw_data: dict[str, Any] | None,
+        validate: bool = False,
+    ) -> Any:
+        """
+        Turn a stored investigation record into the value the checks consume.
+
+        The checks only read a few scalar fields through _LastInvestigationView,
+        so the raw dict is used as-is unless validate is set.
+
+        Returns:
+            Either the raw record (or InvestigationMetadata when validating),
+            or an InvestigationDecision if no previous investigation was found.
+        """
+        if not raw_data:
+            self.logger.info("❌ STORAGE: No previous investigation found")
+            self.logger.info(
+                "🆕 DECISION: No previous investigation found for %s - NEEDS INVESTIGATION",
+                repo_name,
             )
             return InvestigationDecision(
                 needs_investigation=True,
-                reason=f"Unable to check previous investigations (storage error: {e!s})",
+                reason="No previous investigation found",
                 latest_commit=current_state.commit_sha,
                 branch_name=current_state.branch_name,
                 last_investigation=None,
             )
 
-    def _extract_last_investigation_data(self, last_investigation: Any) -> dict[str, Any]:
+        self.logger.info("✅ STORAGE: Found previous investigation")
+        self._stable_streaks[repo_name] = int(raw_data.get("stable_streak") or 0)
+        last_investigation = self._parse_investigation_metadata(raw_data) if validate else raw_data
+
+        self._last_investigation_memo[repo_name] = (
+            time.monotonic() + LAST_INVESTIGATION_MEMO_TTL_SECONDS,
+            last_investigation,
+        )
+        return last_investigation
+
+    def _parse_investigation_metadata(self, raw_data: dict[str, Any]) -> Any:
+        """Validate a stored record as InvestigationMetadata, falling back to the raw dict."""
+        try:
+            # A nested prompt_metadata dict is validated into PromptMetadata here too
+            last_investigation = validate_investigation_metadata(raw_data)
+            # Store both the parsed model and raw data for backward compatibility
+            last_investigation._raw_data = raw_data
+            return last_investigation
+        except Exception as parse_error:
+            self.logger.warning("⚠️  Failed to parse investigation metadata: %s", parse_error)
+            self.logger.warning("   Raw data: %s", raw_data)
+            # Continue with raw data for backward compatibility
+            raw_data["prompt_metadata"] = _normalize_prompt_metadata(
+                raw_data.get("prompt_metadata")
+            )
+            return raw_data
+
+    def _create_storage_error_decision(
+        self, current_state: RepositoryState, error: Exception
+    ) -> InvestigationDecision:
+        """Create a decision requiring investigation because storage could not be read."""
+        self.logger.error(
+            "💥 STORAGE ERROR: Failed to check storage for previous investigation: %s", error
+        )
+        return InvestigationDecision(
+            needs_investigation=True,
+            reason=f"Unable to check previous investigations (storage error: {error!s})",
+            latest_commit=current_state.commit_sha,
+            branch_name=current_state.branch_name,
+            last_investigation=None,
+        )
+
+    def _extract_last_investigation_data(self, last_investigation: Any) -> _LastInvestigationView:
         """Extract and log data from the last investigation."""
-        # Handle both Pydantic model and raw dict for backward compatibility
-        if isinstance(last_investigation, InvestigationMetadata):
-            last_commit = last_investigation.latest_commit or ""
-            last_branch = last_investigation.branch_name
-            last_timestamp = last_investigation.analysis_timestamp
-            last_prompt_metadata = last_investigation.prompt_metadata
-        else:
-            # Fallback to dict access for backward compatibility
-            last_commit = last_investigation.get("latest_commit", "")
-            last_branch = last_investigation.get("branch_name", "")
-            last_timestamp = last_investigation.get("analysis_timestamp", 0)
-            last_prompt_metadata = last_investigation.get("prompt_metadata", {})
-
-        # Convert timestamp to datetime for logging
-        last_investigation_date = datetime.fromtimestamp(last_timestamp, tz=UTC)
-
-        self.logger.info("📜 LAST INVESTIGATION DETAILS:")
-        self.logger.info("   Date: %s", last_investigation_date.isoformat())
-        self.logger.info("   Branch: %s", last_branch)
-        self.logger.info("   Commit: %s", last_commit[:8] if last_commit else "unknown")
-
-        # Log prompt metadata from last investigation
-        if last_prompt_metadata:
-            if isinstance(last_prompt_metadata, PromptMetadata):
-                last_prompt_versions = last_prompt_metadata.versions
-                last_prompt_count = last_prompt_metadata.count
-            else:
-                # Fallback to dict access
-                last_prompt_versions = last_prompt_metadata.get("versions", {})
-                last_prompt_count = last_prompt_metadata.get("count", 0)
+        last = _LastInvestigationView.from_record(
+            last_investigation, self._get_raw_investigation_data(last_investigation)
+        )
 
-            self.logger.info("   Prompts: %s prompts in last investigation", last_prompt_count)
-            for name, version in last_prompt_versions.items():
-                self.logger.debug("      - %s: v%s", version, name)
-        else:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("📜 LAST INVESTIGATION DETAILS:")
+            self.logger.debug("   Date: %s", last.date)
+            self.logger.debug("   Branch: %s", last.branch)
+            self.logger.debug("   Commit: %s", last.commit[:8] if last.commit else "unknown")
+            if last.prompt_versions:
+                self.logger.debug(
+                    "   Prompts: %s prompts in last investigation", last.prompt_count
+                )
+                for name, version in last.prompt_versions.items():
+                    self.logger.debug("      - %s: v%s", name, version)
+
+        if not last.prompt_versions:
             self.logger.warning("   No prompt metadata found in last investigation")
 
-        return {
-            "commit": last_commit,
-            "branch": last_branch,
-            "timestamp": last_timestamp,
-            "date": last_investigation_date,
-            "prompt_metadata": last_prompt_metadata,
-        }
+        return last
 
     def _check_commit_changes(
-        self,
-        current_state: RepositoryState,
-        last_investigation_data: dict[str, Any],
-        last_investigation: Any,
+        self, current_state: RepositoryState, last: _LastInvestigationView
     ) -> InvestigationDecision | None:
         """Check if the commit has changed since the last investigation."""
-        last_investigated_commit = last_investigation_data["commit"]
-
-        self.logger.info("🔄 CHECKING: Commit changes...")
-        self.logger.info("   Current: %s", current_state.commit_sha[:8])
-        self.logger.info(
-            "   Last:    %s",
-            last_investigated_commit[:8] if last_investigated_commit else "unknown",
-        )
-
-        if current_state.commit_sha != last_investigated_commit:
+        # Bind model attributes to locals once; this runs on every cache check
+        commit = current_state.commit_sha
+        last_commit = last.commit
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("🔄 CHECKING: Commit changes...")
+            self.logger.debug("   Current: %s", commit[:8])
+            self.logger.debug("   Last:    %s", last_commit[:8] if last_commit else "unknown")
+
+        if commit != last_commit:
+            commit8 = commit[:8]
+            last_commit8 = last_commit[:8] if last_commit else "unknown"
             self.logger.info(
                 "✅ DECISION: Repository has new commits since last investigation - NEEDS INVESTIGATION"
             )
             return InvestigationDecision(
                 needs_investigation=True,
-                reason=f"New commits detected (current: {current_state.commit_sha[:8]}, "
-                f"last: {last_investigated_commit[:8] if last_investigated_commit else 'unknown'})",
-                latest_commit=current_state.commit_sha,
+                reason=f"New commits detected (current: {commit8}, last: {last_commit8})",
+                latest_commit=commit,
                 branch_name=current_state.branch_name,
-                last_investigation=self._get_raw_investigation_data(last_investigation),
+                last_investigation=last.raw,
             )
         else:
-            self.logger.info("✅ CHECK: Commit unchanged")
+            self.logger.debug("✅ CHECK: Commit unchanged")
             return None
 
     def _check_branch_changes(
-        self,
-        current_state: RepositoryState,
-        last_investigation_data: dict[str, Any],
-        last_investigation: Any,
+        self, current_state: RepositoryState, last: _LastInvestigationView
     ) -> InvestigationDecision | None:
         """Check if the branch has changed since the last investigation."""
-        last_branch = last_investigation_data["branch"]
+        branch = current_state.branch_name
+        last_branch = last.branch
 
-        self.logger.info("🔄 CHECKING: Branch changes...")
-        self.logger.info("   Current: %s", current_state.branch_name)
-        self.logger.info("   Last:    %s", last_branch)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("🔄 CHECKING: Branch changes...")
+            self.logger.debug("   Current: %s", branch)
+            self.logger.debug("   Last:    %s", last_branch)
 
-        if current_state.branch_name != last_branch:
+        if branch != last_branch:
             self.logger.info(
                 "✅ DECISION: Repository branch has changed since last investigation - NEEDS INVESTIGATION"
             )
             return InvestigationDecision(
                 needs_investigation=True,
-                reason=f"Branch changed (current: {current_state.branch_name}, last: {last_branch})",
+                reason=f"Branch changed (current: {branch}, last: {last_branch})",
                 latest_commit=current_state.commit_sha,
-                branch_name=current_state.branch_name,
-                last_investigation=self._get_raw_investigation_data(last_investigation),
+                branch_name=branch,
+                last_investigation=last.raw,
             )
         else:
-            self.logger.info("✅ CHECK: Branch unchanged")
+            self.logger.debug("✅ CHECK: Branch unchanged")
             return None
 
     def _check_prompt_version_changes(
@@ -296,8 +545,13 @@ class InvestigationCache:
         current_prompt_versions: dict[str, str] | None,
         last_investigation: Any,
     ) -> InvestigationDecision | None:
-        """Check if prompt versions have changed since the last investigation."""
-        self.logger.info("🔄 CHECKING: Prompt versions...")
+        """
+        Check if prompt versions have changed since the last investigation.
+
+        last_investigation may be a _LastInvestigationView, an InvestigationMetadata
+        or a raw stored dict.
+        """
+        self.logger.debug("🔄 CHECKING: Prompt versions...")
 
         if not current_prompt_versions:
             self.logger.warning(
@@ -305,107 +559,72 @@ class InvestigationCache:
             )
             return None
 
-        # Handle both Pydantic model and raw dict
-        if isinstance(last_investigation, InvestigationMetadata):
-            last_prompt_metadata = last_investigation.prompt_metadata
-            if last_prompt_metadata:
-                last_prompt_versions = last_prompt_metadata.versions
-                last_prompt_count = last_prompt_metadata.count
-            else:
-                last_prompt_versions = {}
-                last_prompt_count = 0
+        # Callers outside check_needs_investigation may pass the stored record directly
+        if isinstance(last_investigation, _LastInvestigationView):
+            last = last_investigation
         else:
-            # Fallback to dict access
-            last_prompt_metadata = last_investigation.get("prompt_metadata", {})
-            last_prompt_versions = (
-                last_prompt_metadata.get("versions", {}) if last_prompt_metadata else {}
+            last = _LastInvestigationView.from_record(
+                last_investigation, self._get_raw_investigation_data(last_investigation)
             )
-            last_prompt_count = last_prompt_metadata.get("count", 0) if last_prompt_metadata else 0
 
-        # Check if there's no prompt metadata from last investigation
-        decision = self._check_missing_prompt_metadata(
-            current_state, current_prompt_versions, last_prompt_metadata, last_investigation
-        )
-        if decision:
-            return decision
-
-            # Only check prompt count and versions if we have previous metadata to compare against
-        has_previous_versions = False
-        if isinstance(last_prompt_metadata, PromptMetadata):
-            has_previous_versions = bool(last_prompt_metadata.versions)
-        elif last_prompt_metadata:
-            has_previous_versions = bool(last_prompt_metadata.get("versions", {}))
-
-        if last_prompt_metadata and has_previous_versions:
-            # Check prompt count changes
-            decision = self._check_prompt_count_changes(
-                current_state, current_prompt_versions, last_prompt_count, last_investigation
-            )
-            if decision:
-                return decision
-
-            # Check individual prompt version changes
-            decision = self._check_individual_prompt_versions(
-                current_state, current_prompt_versions, last_prompt_versions, last_investigation
-            )
-            if decision:
-                return decision
+        # Without previous versions to compare against, only flag prompts past v1
+        if not last.prompt_versions:
+            return self._check_missing_prompt_metadata(current_state, current_prompt_versions, last)
 
-            # Check for removed prompts
-            decision = self._check_removed_prompts(
-                current_state, current_prompt_versions, last_prompt_versions, last_investigation
-            )
-            if decision:
-                return decision
+        # Common case: nothing changed, settled by one C-level dict comparison
+        if (
+            last.prompt_count == len(current_prompt_versions)
+            and current_prompt_versions == last.prompt_versions
+        ):
+            self.logger.debug("✅ CHECK: Prompt count and versions unchanged")
+            return None
 
-        return None
+        return self._diff_prompts(current_state, current_prompt_versions, last)
 
     def _check_missing_prompt_metadata(
         self,
         current_state: RepositoryState,
         current_prompt_versions: dict[str, str],
-        last_prompt_metadata: Any,
-        last_investigation: Any,
+        last: _LastInvestigationView,
     ) -> InvestigationDecision | None:
         """Check if prompts have been updated when no previous metadata exists."""
-        # Handle both Pydantic model and raw dict
-        has_versions = False
-        if isinstance(last_prompt_metadata, PromptMetadata):
-            has_versions = bool(last_prompt_metadata.versions)
-        elif last_prompt_metadata:
-            has_versions = bool(last_prompt_metadata.get("versions", {}))
-
-        if not last_prompt_metadata or not has_versions:
-            # Check if any current prompt has version > 1
-            for prompt_name, current_version in current_prompt_versions.items():
-                if current_version != "1":
-                    self.logger.info(
-                        "✅ DECISION: Prompt '%s' has version %s but no previous version tracking - NEEDS INVESTIGATION",
-                        prompt_name,
-                        current_version,
-                    )
-                    return InvestigationDecision(
-                        needs_investigation=True,
-                        reason=f"Prompt '{prompt_name}' updated to v{current_version} (no previous version tracking)",
-                        latest_commit=current_state.commit_sha,
-                        branch_name=current_state.branch_name,
-                        last_investigation=self._get_raw_investigation_data(last_investigation),
-                    )
-            self.logger.info(
-                "   No prompt metadata from last investigation, all current prompts are v1 - treating as unchanged"
-            )
+        # Check if any current prompt has version > 1
+        for prompt_name, current_version in current_prompt_versions.items():
+            if current_version != "1":
+                self.logger.info(
+                    "✅ DECISION: Prompt '%s' has version %s but no previous version tracking - NEEDS INVESTIGATION",
+                    prompt_name,
+                    current_version,
+                )
+                return InvestigationDecision(
+                    needs_investigation=True,
+                    reason=f"Prompt '{prompt_name}' updated to v{current_version} (no previous version tracking)",
+                    latest_commit=current_state.commit_sha,
+                    branch_name=current_state.branch_name,
+                    last_investigation=last.raw,
+                )
+        self.logger.debug(
+            "   No prompt metadata from last investigation, all current prompts are v1 - treating as unchanged"
+        )
         return None
 
-    def _check_prompt_count_changes(
+    def _diff_prompts(
         self,
         current_state: RepositoryState,
         current_prompt_versions: dict[str, str],
-        last_prompt_count: int,
-        last_investigation: Any,
+        last: _LastInvestigationView,
     ) -> InvestigationDecision | None:
-        """Check if the number of prompts has changed."""
+        """
+        Compare current prompts against the last investigation in a single pass.
+
+        Checks, in priority order, for a prompt count change, the first prompt whose
+        version differs (prompts not tracked before are assumed to be v1), and the
+        first prompt that was removed.
+        """
+        last_prompt_versions = last.prompt_versions
+        last_prompt_count = last.prompt_count
         current_prompt_count = len(current_prompt_versions)
-        self.logger.info(
+        self.logger.debug(
             "   Prompt count - Current: %s, Last: %s", current_prompt_count, last_prompt_count
         )
 
@@ -420,101 +639,69 @@ class InvestigationCache:
                 reason=f"Prompt count changed ({last_prompt_count} → {current_prompt_count})",
                 latest_commit=current_state.commit_sha,
                 branch_name=current_state.branch_name,
-                last_investigation=self._get_raw_investigation_data(last_investigation),
+                last_investigation=last.raw,
             )
-        else:
-            self.logger.info("✅ CHECK: Prompt count unchanged")
-            return None
-
-    def _check_individual_prompt_versions(
-        self,
-        current_state: RepositoryState,
-        current_prompt_versions: dict[str, str],
-        last_prompt_versions: dict[str, str],
-        last_investigation: Any,
-    ) -> InvestigationDecision | None:
-        """Check if individual prompt versions have changed."""
-        self.logger.info("   Checking individual prompt versions...")
 
-        for prompt_name, current_version in current_prompt_versions.items():
-            last_version = last_prompt_versions.get(prompt_name)
-            # If no last version exists (prompt wasn't tracked before), assume default version "1"
-            if last_version is None:
-                last_version = "1"
-                self.logger.debug(
-                    "      %s: v%s (no previous version, assuming v1)", prompt_name, current_version
-                )
-            else:
-                self.logger.debug(
-                    "      %s: v%s (was v%s)", last_version, current_version, prompt_name
-                )
-
-            if last_version != current_version:
-                self.logger.info(
-                    "✅ DECISION: Prompt '%s' version changed from %s to %s - NEEDS INVESTIGATION",
-                    prompt_name,
-                    last_version,
-                    current_version,
-                )
-                return InvestigationDecision(
-                    needs_investigation=True,
-                    reason=f"Prompt '{prompt_name}' version changed (v{last_version} → v{current_version})",
-                    latest_commit=current_state.commit_sha,
-                    branch_name=current_state.branch_name,
-                    last_investigation=self._get_raw_investigation_data(last_investigation),
-                )
-
-        self.logger.info("✅ CHECK: All prompt versions unchanged")
-        return None
-
-    def _check_removed_prompts(
-        self,
-        current_state: RepositoryState,
-        current_prompt_versions: dict[str, str],
-        last_prompt_versions: dict[str, str],
-        last_investigation: Any,
-    ) -> InvestigationDecision | None:
-        """Check if any prompts have been removed."""
-        self.logger.info("   Checking for removed prompts...")
+        changed = next(
+            (
+                (prompt_name, last_prompt_versions.get(prompt_name, "1"), current_version)
+                for prompt_name, current_version in current_prompt_versions.items()
+                if last_prompt_versions.get(prompt_name, "1") != current_version
+            ),
+            None,
+        )
+        if changed:
+            prompt_name, last_version, current_version = changed
+            self.logger.info(
+                "✅ DECISION: Prompt '%s' version changed from %s to %s - NEEDS INVESTIGATION",
+                prompt_name,
+                last_version,
+                current_version,
+            )
+            return InvestigationDecision(
+                needs_investigation=True,
+                reason=f"Prompt '{prompt_name}' version changed (v{last_version} → v{current_version})",
+                latest_commit=current_state.commit_sha,
+                branch_name=current_state.branch_name,
+                last_investigation=last.raw,
+            )
 
-        for prompt_name in last_prompt_versions:
-            if prompt_name not in current_prompt_versions:
-                self.logger.info(
-                    "✅ DECISION: Prompt '%s' was removed - NEEDS INVESTIGATION", prompt_name
-                )
-                return InvestigationDecision(
-                    needs_investigation=True,
-                    reason=f"Prompt '{prompt_name}' was removed",
-                    latest_commit=current_state.commit_sha,
-                    branch_name=current_state.branch_name,
-                    last_investigation=self._get_raw_investigation_data(last_investigation),
-                )
+        removed = last_prompt_versions.keys() - current_prompt_versions.keys()
+        if removed:
+            # Report the first removed prompt in the order it was originally tracked
+            prompt_name = next(name for name in last_prompt_versions if name in removed)
+            self.logger.info(
+                "✅ DECISION: Prompt '%s' was removed - NEEDS INVESTIGATION", prompt_name
+            )
+            return InvestigationDecision(
+                needs_investigation=True,
+                reason=f"Prompt '{prompt_name}' was removed",
+                latest_commit=current_state.commit_sha,
+                branch_name=current_state.branch_name,
+                last_investigation=last.raw,
+            )
 
-        self.logger.info("✅ CHECK: No prompts removed")
+        self.logger.debug("✅ CHECK: Prompt count and versions unchanged")
         return None
 
     def _create_no_investigation_decision(
-        self,
-        repo_name: str,
-        current_state: RepositoryState,
-        last_investigation_data: dict[str, Any],
-        last_investigation: Any,
+        self, repo_name: str, current_state: RepositoryState, last: _LastInvestigationView
     ) -> InvestigationDecision:
         """Create a decision indicating no investigation is needed."""
-        last_investigation_date = last_investigation_data["date"]
+        last_investigation_date = last.date
 
         self.logger.info(
             "🎯 FINAL DECISION: Repository %s hasn't changed since last investigation - SKIPPING INVESTIGATION",
             repo_name,
         )
-        self.logger.info("📅 Last investigation date: %s", last_investigation_date.isoformat())
+        self.logger.info("📅 Last investigation date: %s", last_investigation_date)
 
         return InvestigationDecision(
             needs_investigation=False,
-            reason=f"No changes since last investigation on {last_investigation_date.isoformat()}",
+            reason=f"No changes since last investigation on {last_investigation_date}",
             latest_commit=current_state.commit_sha,
             branch_name=current_state.branch_name,
-            last_investigation=self._get_raw_investigation_data(last_investigation),
+            last_investigation=last.raw,
         )
 
     def save_investigation_metadata(
@@ -551,8 +738,9 @@ class InvestigationCache:
 
         if prompt_versions:
             self.logger.info("   Including prompt metadata: %s prompts", len(prompt_versions))
-            for name, version in prompt_versions.items():
-                self.logger.debug("      - %s: v%s", version, name)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for name, version in prompt_versions.items():
+                    self.logger.debug("      - %s: v%s", name, version)
         else:
             self.logger.warning("   No prompt versions provided for metadata")
 
@@ -560,14 +748,17 @@ class InvestigationCache:
             # Prepare analysis data with prompt metadata using Pydantic models
             analysis_data = analysis_summary or {}
             if prompt_versions:
-                prompt_metadata = PromptMetadata(
-                    count=len(prompt_versions), versions=prompt_versions
-                )
-                analysis_data["prompt_metadata"] = prompt_metadata.dict()
+                analysis_data["prompt_metadata"] = _dump_prompt_metadata(prompt_versions)
                 self.logger.debug("   Prepared analysis_data with validated prompt_metadata")
 
-            # Save the investigation metadata
-            saved_item = self.storage_client.save_investigation_metadata(
+            # Skip the write when the client can tell nothing changed since the last save
+            save = self.storage_client.save_investigation_metadata
+            if hasattr(type(self.storage_client), "save_investigation_metadata_if_changed"):
+                save = self.storage_client.save_investigation_metadata_if_changed
+
+            # Save the investigation metadata; the memoized record is now stale
+            self.invalidate_last_investigation(repo_name)
+            saved_item = save(
                 repository_name=repo_name,
                 repository_url=repo_url,
                 latest_commit=commit_sha,
@@ -577,6 +768,23 @@ class InvestigationCache:
                 ttl_days=ttl_days,
             )
 
+            if saved_item.get("unchanged"):
+                self._stable_streaks[repo_name] = int(saved_item.get("stable_streak", 0))
+                self.logger.info(
+                    "✅ METADATA UNCHANGED: Investigation metadata for %s already up to date (commit: %s, branch: %s, stable streak: %s)",
+                    repo_name,
+                    commit_sha[:8],
+                    branch_name,
+                    self._stable_streaks[repo_name],
+                )
+                return {
+                    "status": "success",
+                    "message": f"Investigation metadata for {repo_name} unchanged, write skipped",
+                    "timestamp": saved_item.get("analysis_timestamp"),
+                    "unchanged": True,
+                }
+            self._stable_streaks[repo_name] = 0
+
             self.logger.info(
                 "✅ METADATA SAVED: Successfully saved investigation metadata for %s (commit: %s, branch: %s)",
                 repo_name,
@@ -618,62 +826,29 @@ class InvestigationCache:
                 - reason: Explanation of the decision
                 - version: Version of the cached result
         """
-        # Use KeyNameCreator to generate consistent key
-        cache_key_obj = KeyNameCreator.create_prompt_cache_key(
-            repo_name=repo_name,
-            step_name=step_name,
-            commit_sha=commit_sha,
-            prompt_version=prompt_version,
-        )
-        prompt_cache_key = cache_key_obj.to_storage_key()
+        # Use KeyNameCreator (memoized) to generate consistent key
+        prompt_cache_key = prompt_storage_key(repo_name, step_name, commit_sha, prompt_version)
 
-        self.logger.info(
-            "🔍 PROMPT CACHE: Checking cache for %s/%s at commit %s v%s",
-            repo_name,
-            step_name,
-            commit_sha[:8],
-            prompt_version,
-        )
-        self.logger.debug("   Cache key: %s", prompt_cache_key)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "🔍 PROMPT CACHE: Checking cache for %s/%s at commit %s v%s",
+                repo_name,
+                step_name,
+                commit_sha[:8],
+                prompt_version,
+            )
+            self.logger.debug("   Cache key: %s", prompt_cache_key)
 
         try:
             # Try to get cached result for this exact prompt+commit+version combination
-            cached_result = self.storage_client.get_analysis_result(prompt_cache_key)
-
-            if cached_result:
-                self.logger.info(
-                    "✅ PROMPT CACHE HIT: Found cached result for %s/%s at commit %s v%s",
-                    repo_name,
-                    step_name,
-                    commit_sha[:8],
-                    prompt_version,
-                )
-                self.logger.debug(
-                    "   Cached content length: %s characters",
-                    len(cached_result) if cached_result else 0,
-                )
-                return {
-                    "needs_analysis": False,
-                    "cached_result_key": prompt_cache_key,
-                    "cached_result": cached_result,
-                    "reason": f"Using cached result from commit {commit_sha[:8]} v{prompt_version}",
-                    "version": prompt_version,
-                }
-            else:
-                self.logger.info(
-                    "❌ PROMPT CACHE MISS: No cached result found for %s/%s at commit %s v%s",
-                    repo_name,
-                    step_name,
-                    commit_sha[:8],
-                    prompt_version,
-                )
-                return {
-                    "needs_analysis": True,
-                    "cached_result_key": None,
-                    "cached_result": None,
-                    "reason": f"No cached result for this prompt at commit {commit_sha[:8]} v{prompt_version}",
-                    "version": prompt_version,
-                }
+            cached_result = self._recall_prompt_result(prompt_cache_key)
+            if cached_result is None:
+                cached_result = self.storage_client.get_analysis_result(prompt_cache_key)
+                if cached_result:
+                    self._remember_prompt_result(prompt_cache_key, cached_result)
+            return self._create_prompt_cache_result(
+                repo_name, step_name, commit_sha, prompt_version, prompt_cache_key, cached_result
+            )
 
         except Exception as e:
             self.logger.error(
@@ -690,6 +865,50 @@ class InvestigationCache:
                 "reason": f"Cache check failed: {e!s}",
             }
 
+    def _create_prompt_cache_result(
+        self,
+        repo_name: str,
+        step_name: str,
+        commit_sha: str,
+        prompt_version: str,
+        prompt_cache_key: str,
+        cached_result: str | None,
+    ) -> dict[str, Any]:
+        """Build the hit or miss result for one prompt cache lookup."""
+        short_sha = commit_sha[:8]
+        if cached_result:
+            self.logger.info(
+                "✅ PROMPT CACHE HIT: Found cached result for %s/%s at commit %s v%s",
+                repo_name,
+                step_name,
+                short_sha,
+                prompt_version,
+            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("   Cached content length: %s characters", len(cached_result))
+            return {
+                "needs_analysis": False,
+                "cached_result_key": prompt_cache_key,
+                "cached_result": cached_result,
+                "reason": f"Using cached result from commit {short_sha} v{prompt_version}",
+                "version": prompt_version,
+            }
+
+        self.logger.info(
+            "❌ PROMPT CACHE MISS: No cached result found for %s/%s at commit %s v%s",
+            repo_name,
+            step_name,
+            short_sha,
+            prompt_version,
+        )
+        return {
+            "needs_analysis": True,
+            "cached_result_key": None,
+            "cached_result": None,
+            "reason": f"No cached result for this prompt at commit {short_sha} v{prompt_version}",
+            "version": prompt_version,
+        }
+
     def save_prompt_result(
         self,
         repo_name: str,
@@ -698,7 +917,7 @@ class InvestigationCache:
         result_content: str,
         prompt_version: str = "1",
         ttl_days: int = 90,
-    ) -> dict[str, Any]:
+    ) -> CacheOpResult:
         """
         Save the result of a prompt analysis for future cache hits.
 
@@ -711,72 +930,128 @@ class InvestigationCache:
             ttl_days: Time-to-live in days for the cached result
 
         Returns:
-            Dictionary with save status
+            CacheOpResult with the save status and cache key
         """
-        # Use KeyNameCreator to generate consistent key
-        cache_key_obj = KeyNameCreator.create_prompt_cache_key(
-            repo_name=repo_name,
-            step_name=step_name,
-            commit_sha=commit_sha,
-            prompt_version=prompt_version,
-        )
-        prompt_cache_key = cache_key_obj.to_storage_key()
+        return self.save_prompt_results(
+            repo_name, [(step_name, commit_sha, result_content, prompt_version)], ttl_days
+        )[0]
 
-        self.logger.info(
-            "💾 PROMPT CACHE: Saving result for %s/%s at commit %s v%s",
-            repo_name,
-            step_name,
-            commit_sha[:8],
-            prompt_version,
-        )
-        self.logger.debug("   Cache key: %s", prompt_cache_key)
-        self.logger.debug("   Content length: %s characters", len(result_content))
+    def save_prompt_results(
+        self,
+        repo_name: str,
+        results: list[tuple[str, str, str, str]],
+        ttl_days: int = 90,
+    ) -> list[CacheOpResult]:
+        """
+        Save several prompt analysis results, writing them in one storage call.
 
-        try:
-            # Convert TTL from days to minutes for the storage layer
-            ttl_minutes = ttl_days * 24 * 60
-
-            # Save the result using the existing analysis result storage
-            saved_item = self.storage_client.save_analysis_result(
-                reference_key=prompt_cache_key,
-                result_content=result_content,
-                step_name=step_name,
-                ttl_minutes=ttl_minutes,
-            )
+        Args:
+            repo_name: Name of the repository
+            results: (step_name, commit_sha, result_content, prompt_version) for each
+                result to save
+            ttl_days: Time-to-live in days for the cached results
 
-            self.logger.info(
-                "✅ PROMPT CACHE SAVED: Successfully cached prompt result for %s/%s at commit %s v%s",
-                repo_name,
-                step_name,
-                commit_sha[:8],
-                prompt_version,
+        Returns:
+            List with the same CacheOpResult that save_prompt_result returns, one
+            per result and in the same order
+        """
+        # Checked once per batch; the per-entry log arguments are skipped when filtered
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        entries = []
+        for step_name, commit_sha, result_content, prompt_version in results:
+            # Use KeyNameCreator (memoized) to generate consistent key
+            prompt_cache_key = prompt_storage_key(
+                repo_name, step_name, commit_sha, prompt_version
+            )
+            if log_info:
+                self.logger.info(
+                    "💾 PROMPT CACHE: Saving result for %s/%s at commit %s v%s",
+                    repo_name,
+                    step_name,
+                    commit_sha[:8],
+                    prompt_version,
+                )
+            if log_debug:
+                self.logger.debug("   Cache key: %s", prompt_cache_key)
+                self.logger.debug("   Content length: %s characters", len(result_content))
+            entries.append(
+                {
+                    "reference_key": prompt_cache_key,
+                    "result_content": result_content,
+                    "step_name": step_name,
+                }
             )
 
-            return {
-                "status": "success",
-                "message": f"Cached result for {step_name}",
-                "cache_key": prompt_cache_key,
-                "timestamp": saved_item.get("timestamp"),
-            }
+        try:
+            # Results for repos that keep coming back unchanged are kept longer
+            effective_ttl_days = adaptive_ttl_days(ttl_days, self._stable_streaks.get(repo_name, 0))
+            if effective_ttl_days != ttl_days:
+                self.logger.debug(
+                    "   Stable repository - TTL widened from %s to %s days",
+                    ttl_days,
+                    effective_ttl_days,
+                )
+
+            # Convert TTL from days to minutes for the storage layer
+            ttl_minutes = ttl_days_to_minutes(effective_ttl_days)
+
+            saved_items = self._save_analysis_results(entries, ttl_minutes)
 
         except Exception as e:
             self.logger.error(
-                "💥 PROMPT CACHE ERROR: Failed to cache prompt result for %s/%s: %s",
+                "💥 PROMPT CACHE ERROR: Failed to cache %s prompt results for %s: %s",
+                len(entries),
                 repo_name,
-                step_name,
                 e,
             )
             # Don't fail the workflow for cache save failures
-            return {
-                "status": "error",
-                "message": f"Failed to cache result: {e!s}",
-                "cache_key": None,
-                "timestamp": None,
-            }
+            failed = CacheOpResult(status="error", message=f"Failed to cache result: {e!s}")
+            return [failed] * len(entries)
+
+        saved = []
+        for (step_name, commit_sha, _, prompt_version), entry, saved_item in zip(
+            results, entries, saved_items, strict=True
+        ):
+            # File storage reports failures in the result instead of raising
+            if saved_item.get("status") == "success":
+                self._remember_prompt_result(
+                    entry["reference_key"], entry["result_content"], ttl_minutes * 60
+                )
+
+            if log_info:
+                self.logger.info(
+                    "✅ PROMPT CACHE SAVED: Successfully cached prompt result for %s/%s at commit %s v%s",
+                    repo_name,
+                    step_name,
+                    commit_sha[:8],
+                    prompt_version,
+                )
+            saved.append(
+                CacheOpResult(
+                    status="success",
+                    message=f"Cached result for {step_name}",
+                    cache_key=entry["reference_key"],
+                    timestamp=saved_item.get("timestamp"),
+                )
+            )
+        return saved
+
+    def _save_analysis_results(
+        self, entries: list[dict[str, str]], ttl_minutes: int
+    ) -> list[dict[str, Any]]:
+        """Write several analysis results, in one call when the client supports it."""
+        if len(entries) > 1 and hasattr(type(self.storage_client), "save_analysis_results_many"):
+            return self.storage_client.save_analysis_results_many(entries, ttl_minutes)
+        return [
+            self.storage_client.save_analysis_result(**entry, ttl_minutes=ttl_minutes)
+            for entry in entries
+        ]
 
     def save_dependencies(
         self, repo_name: str, dependencies_data: dict, reference_key: str, ttl_days: int = 90
-    ) -> dict[str, Any]:
+    ) -> CacheOpResult:
         """
         Save dependencies data to storage.
 
@@ -787,35 +1062,35 @@ class InvestigationCache:
             ttl_days: TTL in days
 
         Returns:
-            Dictionary with save status and reference key
+            CacheOpResult with the save status; cache_key is the reference key on
+            success and message holds the error on failure
         """
         try:
             # Convert TTL to minutes
-            ttl_minutes = ttl_days * 24 * 60
+            ttl_minutes = ttl_days_to_minutes(ttl_days)
 
             self.logger.info("💾 DEPENDENCIES: Caching dependencies for %s", repo_name)
             self.logger.debug("   Reference key: %s", reference_key)
-            self.logger.debug("   TTL: %s days (%s minutes)", ttl_minutes, ttl_days)
+            self.logger.debug("   TTL: %s days (%s minutes)", ttl_days, ttl_minutes)
 
             # Save using the storage client's abstracted method
             saved_item = self.storage_client.save_temporary_analysis_data(
                 reference_key=reference_key, data_content=dependencies_data, ttl_minutes=ttl_minutes
             )
+            self._dependencies.put(reference_key, dependencies_data, ttl_minutes * 60)
 
             self.logger.info(
                 "✅ DEPENDENCIES CACHED: Successfully cached dependencies for %s", repo_name
             )
 
-            return {
-                "status": "success",
-                "reference_key": reference_key,
-                "timestamp": saved_item.get("timestamp"),
-            }
+            return CacheOpResult(
+                status="success", cache_key=reference_key, timestamp=saved_item.get("timestamp")
+            )
         except Exception as e:
             self.logger.error(
                 "💥 DEPENDENCIES ERROR: Failed to cache dependencies for %s: %s", repo_name, e
             )
-            return {"status": "error", "reference_key": None, "error": str(e)}
+            return CacheOpResult(status="error", message=str(e))
 
     def get_dependencies(self, reference_key: str) -> dict[str, Any] | None:
         """
@@ -827,14 +1102,22 @@ class InvestigationCache:
         Returns:
             Dependencies data or None if not found
         """
+        cached = self._dependencies.get(reference_key)
+        if cached is not None:
+            self.logger.debug("✅ DEPENDENCIES FOUND: Served from in-process cache")
+            return cached
+
         try:
             self.logger.info("🔍 DEPENDENCIES: Retrieving dependencies with key: %s", reference_key)
-            data = self.storage_client.get_temporary_analysis_data(reference_key)
+            data = self._load_dependencies(reference_key)
 
             if data:
                 self.logger.info("✅ DEPENDENCIES FOUND: Successfully retrieved dependencies")
                 # Cast to proper type - get_temporary_analysis_data returns Any but should be dict
-                return data if isinstance(data, dict) else None
+                if not isinstance(data, dict):
+                    return None
+                self._dependencies.put(reference_key, data, LOCAL_READ_TTL_SECONDS)
+                return data
             else:
                 self.logger.warning(
                     "❌ DEPENDENCIES NOT FOUND: No dependencies found for key: %s", reference_key
@@ -844,3 +1127,47 @@ class InvestigationCache:
         except Exception as e:
             self.logger.error("💥 DEPENDENCIES ERROR: Failed to retrieve dependencies: %s", e)
             return None
+
+    def _load_dependencies(self, reference_key: str) -> Any:
+        """Read dependencies from storage, joining a read already in flight for the key."""
+        with self._inflight_lock:
+            future = self._inflight_dependencies.get(reference_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight_dependencies[reference_key] = future
+        if not owner:
+            return future.result()
+
+        try:
+            data = self.storage_client.get_temporary_analysis_data(reference_key)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight_dependencies.pop(reference_key, None)
+
+
+# Shared cache instances keyed by storage client, so memoized lookups survive
+# across activity invocations in the same worker process
+_shared_caches: "weakref.WeakKeyDictionary[Any, InvestigationCache]" = weakref.WeakKeyDictionary()
+
+
+def get_investigation_cache(storage_client: Any) -> InvestigationCache:
+    """
+    Get the shared InvestigationCache for a storage client.
+
+    Args:
+        storage_client: Client for storing/retrieving investigation metadata
+
+    Returns:
+        The InvestigationCache bound to that client, created on first use
+    """
+    cache = _shared_caches.get(storage_client)
+    if cache is None:
+        cache = InvestigationCache(storage_client)
+        _shared_caches[storage_client] = cache
+    return cache
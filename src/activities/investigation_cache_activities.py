@@ -17,7 +17,7 @@ from models.activities import (
 )
 from models.investigation import RepositoryState
 
-from .investigation_cache import InvestigationCache
+from .investigation_cache import get_investigation_cache
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -66,7 +66,7 @@ async def check_if_repo_needs_investigation(input_params: CacheCheckInput) -> Ca
         from utils.dynamodb_client import get_dynamodb_client
 
         dynamodb_client = get_dynamodb_client()
-        cache = InvestigationCache(dynamodb_client)
+        cache = get_investigation_cache(dynamodb_client)
 
         # Check if investigation is needed
         activity.logger.info("🔍 Calling cache.check_needs_investigation...")
@@ -153,7 +153,7 @@ async def save_investigation_metadata(input_params: SaveMetadataInput) -> SaveMe
 
         # Get DynamoDB client and create cache instance
         dynamodb_client = get_dynamodb_client()
-        cache = InvestigationCache(dynamodb_client)
+        cache = get_investigation_cache(dynamodb_client)
 
         # Save the investigation metadata
         activity.logger.info("💾 Calling cache.save_investigation_metadata...")
@@ -1,19 +1,18 @@
+import argparse
 import asyncio
+import functools
 import json
 import logging
 import os
+import re
 import sys
 import uuid
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 
 from temporalio.client import Client
 from temporalio.contrib.pydantic import pydantic_data_converter
 from temporalio.service import TLSConfig
 
-# pylint: disable=wrong-import-position
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-# pylint: enable=wrong-import-position
-
 from activities.investigate_activities import read_repos_config
 from models import ConfigOverrides, InvestigateReposRequest, InvestigateSingleRepoRequest
 from workflows.investigate_repos_workflow import InvestigateReposWorkflow
@@ -23,6 +22,24 @@ from workflows.investigate_single_repo_workflow import InvestigateSingleRepoWork
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Last path segment of a repository URL, ignoring trailing slashes and a .git suffix
+_URL_REPO_NAME_RE = re.compile(r"/([^/]+?)(?:\.git)?/*$")
+
+# Single-repo workflows in flight at once for investigate-many
+INVESTIGATE_MANY_MAX_CONCURRENCY = 32
+
+# Temporal connection settings, read once at import; defaults target a local dev server
+TEMPORAL_TASK_QUEUE = os.getenv("TEMPORAL_TASK_QUEUE", "investigate-task-queue")
+TEMPORAL_SERVER_URL = os.getenv("TEMPORAL_SERVER_URL", "localhost:7233")
+TEMPORAL_NAMESPACE = os.getenv("TEMPORAL_NAMESPACE", "default")
+TEMPORAL_API_KEY = os.getenv("TEMPORAL_API_KEY")
+
+
+@functools.cache
+def _available_repo_keys(repo_keys: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the sorted repository keys, skipping comment keys that start with underscore."""
+    return tuple(sorted(key for key in repo_keys if not key.startswith("_")))
+
 
 async def run_investigate_repos_workflow(
     client: Client,
@@ -42,11 +59,10 @@ async def run_investigate_repos_workflow(
         sleep_hours: Optional sleep hours override (supports fractional hours)
         chunk_size: Optional chunk size override (number of repos processed in parallel)
     """
-    task_queue = os.getenv("TEMPORAL_TASK_QUEUE", "investigate-task-queue")
+    task_queue = TEMPORAL_TASK_QUEUE
 
-    # Generate unique workflow ID with timestamp to avoid conflicts
-    timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-    workflow_id = f"investigate-repos-workflow-{timestamp}"
+    # Generate a unique workflow ID; a second-resolution timestamp could collide
+    workflow_id = f"investigate-repos-workflow-{uuid.uuid4().hex[:12]}"
 
     logger.info("Starting InvestigateReposWorkflow on task queue: %s", task_queue)
     logger.info("Using workflow ID: %s", workflow_id)
@@ -111,7 +127,7 @@ async def run_investigate_single_repo_workflow(
         repo_type: Optional repository type override
         force_section: Optional section name to force re-execution
     """
-    task_queue = os.getenv("TEMPORAL_TASK_QUEUE", "investigate-task-queue")
+    task_queue = TEMPORAL_TASK_QUEUE
 
     # Determine if repo_identifier is a URL or a name from repos.json
     repo_name = None
@@ -121,10 +137,9 @@ async def run_investigate_single_repo_workflow(
     if repo_identifier.startswith("http"):
         # Direct URL provided
         repo_url = repo_identifier
-        # Extract repo name from URL (last part after /)
-        repo_name = repo_url.rstrip("/").split("/")[-1]
-        if repo_name.endswith(".git"):
-            repo_name = repo_name[:-4]
+        # Extract repo name from URL (last part after /, without .git)
+        match = _URL_REPO_NAME_RE.search(repo_url)
+        repo_name = match.group(1) if match else repo_url
     else:
         # Repository name provided - look it up in repos.json
         try:
@@ -139,14 +154,14 @@ async def run_investigate_single_repo_workflow(
 
             repositories = repos_data.get("repositories", {})
 
-            if repo_identifier not in repositories:
-                # Filter out comment keys that start with underscore
-                available_repos = [key for key in repositories if not key.startswith("_")]
+            repo_info = repositories.get(repo_identifier)
+            if repo_info is None:
+                available_repos = _available_repo_keys(tuple(repositories))
 
                 # Create a user-friendly error message
                 error_msg = f"\n❌ Repository '{repo_identifier}' not found in repos.json\n"
                 error_msg += f"\n📋 Available repository keys ({len(available_repos)}):\n"
-                error_msg += "   " + ", ".join(sorted(available_repos))
+                error_msg += "   " + ", ".join(available_repos)
                 error_msg += "\n\n💡 Tip: You can also use a direct GitHub URL instead of a key"
                 error_msg += "\n    Example: mise investigate-one https://github.com/user/repo\n"
 
@@ -155,7 +170,6 @@ async def run_investigate_single_repo_workflow(
 
                 return {"status": "failed", "error": error_msg}
 
-            repo_info = repositories[repo_identifier]
             repo_name = repo_identifier
             repo_url = repo_info.get("url")
             detected_repo_type = repo_info.get("type", "generic")
@@ -226,12 +240,151 @@ async def run_investigate_single_repo_workflow(
     return result
 
 
+async def run_investigate_many_repos_workflows(
+    client: Client,
+    repo_identifiers: list[str],
+    force: bool = False,
+    claude_model: str | None = None,
+    max_tokens: int | None = None,
+    max_concurrency: int = INVESTIGATE_MANY_MAX_CONCURRENCY,
+) -> list:
+    """Run InvestigateSingleRepoWorkflow for several repositories over one client connection.
+
+    Args:
+        client: Temporal client instance shared by every workflow
+        repo_identifiers: Repository names (from repos.json) or direct URLs
+        force: If True, forces investigation ignoring cache
+        claude_model: Optional Claude model override
+        max_tokens: Optional max tokens override
+        max_concurrency: Maximum number of workflows running at once
+
+    Returns:
+        One result per repository, in input order; failed launches are returned
+        as the exception raised
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(repo_identifier: str):
+        async with semaphore:
+            return await run_investigate_single_repo_workflow(
+                client,
+                repo_identifier,
+                force=force,
+                claude_model=claude_model,
+                max_tokens=max_tokens,
+            )
+
+    logger.info(
+        "Starting %s single-repo workflows (max %s at once)",
+        len(repo_identifiers),
+        max_concurrency,
+    )
+    results = await asyncio.gather(
+        *(run_one(repo_identifier) for repo_identifier in repo_identifiers),
+        return_exceptions=True,
+    )
+
+    failures = 0
+    for repo_identifier, result in zip(repo_identifiers, results, strict=True):
+        if isinstance(result, BaseException):
+            failures += 1
+            logger.error("Workflow for %s failed: %s", repo_identifier, result)
+    logger.info("Finished %s single-repo workflows (%s failed)", len(repo_identifiers), failures)
+    return results
+
+
+def _read_repo_identifiers(repos_file: str) -> list[str]:
+    """
+    Read the repositories to investigate from a JSON file containing a list.
+
+    Args:
+        repos_file: Path to a JSON file with a list of repository names or URLs
+
+    Returns:
+        The repository identifiers
+
+    Raises:
+        ValueError: If the file does not contain a list of strings
+    """
+    with open(repos_file) as f:
+        repo_identifiers = json.load(f)
+    if not isinstance(repo_identifiers, list) or not all(
+        isinstance(repo_identifier, str) for repo_identifier in repo_identifiers
+    ):
+        raise ValueError(f"{repos_file} must contain a JSON list of repository names or URLs")
+    return repo_identifiers
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the investigate and investigate-single workflows."""
+    parser = argparse.ArgumentParser(
+        prog="python client.py",
+        description="Start investigation workflows. Runs investigate when no workflow is given.",
+    )
+    workflows = parser.add_subparsers(dest="workflow", metavar="WORKFLOW")
+
+    investigate = workflows.add_parser(
+        "investigate", help="Investigate all repositories, running continuously every X hours"
+    )
+    investigate.add_argument(
+        "--force", action="store_true", help="Ignore the cache on the first iteration"
+    )
+    investigate.add_argument("--claude-model", metavar="MODEL", help="Claude model override")
+    investigate.add_argument("--max-tokens", type=int, metavar="NUM", help="Max tokens override")
+    investigate.add_argument(
+        "--sleep-hours", type=float, metavar="NUM", help="Hours to sleep between iterations"
+    )
+    investigate.add_argument(
+        "--chunk-size", type=int, metavar="NUM", help="Repositories processed in parallel"
+    )
+
+    single = workflows.add_parser("investigate-single", help="Investigate one repository")
+    single.add_argument(
+        "repo_identifier", metavar="REPO_NAME_OR_URL", help="Key from repos.json or a direct URL"
+    )
+    single.add_argument("--force", action="store_true", help="Investigate regardless of cache")
+    single.add_argument("--claude-model", metavar="MODEL", help="Claude model override")
+    single.add_argument("--max-tokens", type=int, metavar="NUM", help="Max tokens override")
+    # scripts/single.sh passes the type as --type=TYPE
+    single.add_argument(
+        "--repo-type", "--type", dest="repo_type", metavar="TYPE", help="Repository type override"
+    )
+    single.add_argument("--force-section", metavar="SECTION", help="Section to force re-running")
+
+    many = workflows.add_parser(
+        "investigate-many", help="Investigate several repositories over one connection"
+    )
+    many.add_argument(
+        "repos_file", metavar="REPOS_FILE", help="JSON file with a list of repo names or URLs"
+    )
+    many.add_argument("--force", action="store_true", help="Investigate regardless of cache")
+    many.add_argument("--claude-model", metavar="MODEL", help="Claude model override")
+    many.add_argument("--max-tokens", type=int, metavar="NUM", help="Max tokens override")
+
+    return parser
+
+
 async def main():
     """Main function to run the workflow client."""
-    # Get Temporal configuration from environment variables or use local defaults
-    temporal_server_url = os.getenv("TEMPORAL_SERVER_URL", "localhost:7233")
-    temporal_namespace = os.getenv("TEMPORAL_NAMESPACE", "default")
-    temporal_api_key = os.getenv("TEMPORAL_API_KEY")
+    # Parse before connecting so usage errors don't wait on the Temporal server
+    argv = sys.argv[1:]
+    if argv:
+        # Workflow names have always been matched case-insensitively
+        argv[0] = argv[0].lower()
+    parser = _build_arg_parser()
+    args = parser.parse_args(argv)
+
+    repo_identifiers = []
+    if args.workflow == "investigate-many":
+        try:
+            repo_identifiers = _read_repo_identifiers(args.repos_file)
+        except (json.JSONDecodeError, OSError, ValueError) as e:
+            parser.error(f"Error reading {args.repos_file}: {e}")
+
+    # Temporal configuration comes from environment variables or local defaults
+    temporal_server_url = TEMPORAL_SERVER_URL
+    temporal_namespace = TEMPORAL_NAMESPACE
+    temporal_api_key = TEMPORAL_API_KEY
 
     logger.info("Connecting to Temporal server: %s", temporal_server_url)
     logger.info("Using namespace: %s", temporal_namespace)
@@ -262,108 +415,33 @@ async def main():
             data_converter=pydantic_data_converter,
         )
 
-    # Get command line arguments
-    if len(sys.argv) > 1:
-        workflow_name = sys.argv[1].lower()
-
-        if workflow_name == "investigate":
-            # Parse configuration overrides from command line
-            force = "--force" in sys.argv
-            claude_model = None
-            max_tokens = None
-            sleep_hours = None
-            chunk_size = None
-
-            for arg in sys.argv[2:]:
-                if arg.startswith("--claude-model="):
-                    claude_model = arg.split("=", 1)[1]
-                elif arg.startswith("--max-tokens="):
-                    try:
-                        max_tokens = int(arg.split("=", 1)[1])
-                    except ValueError:
-                        logger.error(
-                            "Invalid max-tokens value: %s. Must be an integer.",
-                            arg.split("=", 1)[1],
-                        )
-                        return
-                elif arg.startswith("--sleep-hours="):
-                    try:
-                        sleep_hours = float(arg.split("=", 1)[1])
-                    except ValueError:
-                        logger.error(
-                            "Invalid sleep-hours value: %s. Must be a number.", arg.split("=", 1)[1]
-                        )
-                        return
-                elif arg.startswith("--chunk-size="):
-                    try:
-                        chunk_size = int(arg.split("=", 1)[1])
-                    except ValueError:
-                        logger.error(
-                            "Invalid chunk-size value: %s. Must be an integer.",
-                            arg.split("=", 1)[1],
-                        )
-                        return
-
-            await run_investigate_repos_workflow(
-                client,
-                force=force,
-                claude_model=claude_model,
-                max_tokens=max_tokens,
-                sleep_hours=sleep_hours,
-                chunk_size=chunk_size,
-            )
-        elif workflow_name == "investigate-single":
-            # Parse repository identifier and configuration overrides
-            if len(sys.argv) < 3:
-                logger.error("Repository name or URL is required for investigate-single")
-                logger.info(
-                    "Usage: python client.py investigate-single REPO_NAME_OR_URL "
-                    "[--force] [--claude-model=MODEL] [--max-tokens=NUM] [--repo-type=TYPE]"
-                )
-                return
-
-            repo_identifier = sys.argv[2]
-            force = "--force" in sys.argv
-            claude_model = None
-            max_tokens = None
-            repo_type = None
-            force_section = None
-
-            for arg in sys.argv[3:]:
-                if arg.startswith("--claude-model="):
-                    claude_model = arg.split("=", 1)[1]
-                elif arg.startswith("--max-tokens="):
-                    try:
-                        max_tokens = int(arg.split("=", 1)[1])
-                    except ValueError:
-                        logger.error(
-                            "Invalid max-tokens value: %s. Must be an integer.",
-                            arg.split("=", 1)[1],
-                        )
-                        return
-                elif arg.startswith("--repo-type="):
-                    repo_type = arg.split("=", 1)[1]
-                elif arg.startswith("--force-section="):
-                    force_section = arg.split("=", 1)[1]
-
-            await run_investigate_single_repo_workflow(
-                client,
-                repo_identifier,
-                force=force,
-                claude_model=claude_model,
-                max_tokens=max_tokens,
-                repo_type=repo_type,
-                force_section=force_section,
-            )
-        else:
-            logger.error("Unknown workflow: %s", workflow_name)
-            logger.info("Available workflows: investigate, investigate-single")
-            logger.info(
-                "Usage: python client.py investigate [--force] "
-                "[--claude-model=MODEL] [--max-tokens=NUM] "
-                "[--sleep-hours=NUM] [--chunk-size=NUM]"
-            )
-            logger.info("Usage: python client.py investigate-single REPO_NAME_OR_URL [options]")
+    if args.workflow == "investigate":
+        await run_investigate_repos_workflow(
+            client,
+            force=args.force,
+            claude_model=args.claude_model,
+            max_tokens=args.max_tokens,
+            sleep_hours=args.sleep_hours,
+            chunk_size=args.chunk_size,
+        )
+    elif args.workflow == "investigate-single":
+        await run_investigate_single_repo_workflow(
+            client,
+            args.repo_identifier,
+            force=args.force,
+            claude_model=args.claude_model,
+            max_tokens=args.max_tokens,
+            repo_type=args.repo_type,
+            force_section=args.force_section,
+        )
+    elif args.workflow == "investigate-many":
+        await run_investigate_many_repos_workflows(
+            client,
+            repo_identifiers,
+            force=args.force,
+            claude_model=args.claude_model,
+            max_tokens=args.max_tokens,
+        )
     else:
         # Default to investigate workflow
         logger.info("No arguments provided. Running investigate workflow.")
@@ -1,133 +1,241 @@
 import asyncio
+import atexit
+import functools
+import io
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import threading
-import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-# Immediate startup logging
-print("=" * 60, flush=True)
-print("INVESTIGATE WORKER STARTING UP", flush=True)
-print(f"Python executable: {sys.executable}", flush=True)
-print(f"Python version: {sys.version}", flush=True)
-print(f"Current working directory: {os.getcwd()}", flush=True)
-print(f"Script path: {os.path.abspath(__file__)}", flush=True)
-print("Environment variables:", flush=True)
-print(
-    f"  PROMPT_CONTEXT_STORAGE: {os.environ.get('PROMPT_CONTEXT_STORAGE', 'NOT SET')}", flush=True
-)
-print(f"  SKIP_DYNAMODB_CHECK: {os.environ.get('SKIP_DYNAMODB_CHECK', 'NOT SET')}", flush=True)
-print(f"  LOCAL_TESTING: {os.environ.get('LOCAL_TESTING', 'NOT SET')}", flush=True)
-print("=" * 60, flush=True)
-
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Buffer size of the stream the log listener writes to
+LOG_STREAM_BUFFER_BYTES = 64 * 1024
+
+
+class _BatchedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that flushes once the log queue is drained instead of after every record.
+
+    A burst of records becomes one buffered write, while a lone record is still flushed
+    straight away because the queue is empty right after it.
+    """
+
+    def __init__(self, stream: Any, log_queue: queue.Queue):
+        super().__init__(stream)
+        self._log_queue = log_queue
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if self._log_queue.empty():
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _open_log_stream() -> Any:
+    """Open a large-buffered text stream on stdout's file descriptor, or fall back to stdout."""
+    try:
+        # Left open: the stream lives for the whole process
+        return open(
+            sys.stdout.fileno(),
+            "w",
+            buffering=LOG_STREAM_BUFFER_BYTES,
+            encoding=sys.stdout.encoding,
+            errors="backslashreplace",
+            closefd=False,
+        )
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return sys.stdout
+
+
+def _start_queued_logging() -> logging.handlers.QueueListener:
+    """
+    Route all log records through a queue drained by a single background writer thread.
+
+    Callers, including activities on the event loop, only enqueue records; the
+    listener thread does the blocking stdout writes.
+
+    Returns:
+        The started listener, to be passed to _stop_queued_logging
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    stdout_handler = _BatchedStreamHandler(_open_log_stream(), log_queue)
+    stdout_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(logging.INFO)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stdout_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(_stop_queued_logging, listener)
+    return listener
+
+
+def _stop_queued_logging(listener: logging.handlers.QueueListener) -> None:
+    """Write out any queued log records and stop the listener thread."""
+    # Stopping twice would fail, so the exit hook is dropped once this has run
+    atexit.unregister(_stop_queued_logging)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+
+
 # Configure logging immediately
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+_log_listener = _start_queued_logging()
 logger = logging.getLogger(__name__)
 
-logger.info("Starting imports...")
-try:
-    from temporalio.client import Client
+# Immediate startup logging
+logger.info(
+    "\n".join(
+        [
+            "=" * 60,
+            "INVESTIGATE WORKER STARTING UP",
+            f"Python executable: {sys.executable}",
+            f"Python version: {sys.version}",
+            f"Current working directory: {os.getcwd()}",
+            f"Script path: {os.path.abspath(__file__)}",
+            "Environment variables:",
+            f"  PROMPT_CONTEXT_STORAGE: {os.environ.get('PROMPT_CONTEXT_STORAGE', 'NOT SET')}",
+            f"  SKIP_DYNAMODB_CHECK: {os.environ.get('SKIP_DYNAMODB_CHECK', 'NOT SET')}",
+            f"  LOCAL_TESTING: {os.environ.get('LOCAL_TESTING', 'NOT SET')}",
+            "=" * 60,
+        ]
+    )
+)
 
-    logger.info("  ✓ Imported temporalio.client.Client")
-except ImportError as e:
-    logger.error("  ✗ Failed to import temporalio.client.Client: %s", e)
-    raise
 
-try:
-    from temporalio.worker import Worker
+@dataclass(frozen=True)
+class _WorkerDeps:
+    """Temporal classes, workflows and activities the worker needs, imported on demand."""
 
-    logger.info("  ✓ Imported temporalio.worker.Worker")
-except ImportError as e:
-    logger.error("  ✗ Failed to import temporalio.worker.Worker: %s", e)
-    raise
+    client_cls: Any
+    worker_cls: Any
+    tls_config: Any
+    data_converter: Any
+    rpc_error_cls: type[Exception]
+    fatal_rpc_statuses: frozenset[Any]
+    workflows: tuple[Any, ...]
+    activities: tuple[Any, ...]
+    workflow_names: tuple[str, ...]
+    activity_names: tuple[str, ...]
 
-try:
-    from temporalio.service import TLSConfig
 
-    logger.info("  ✓ Imported temporalio.service.TLSConfig")
-except ImportError as e:
-    logger.error("  ✗ Failed to import temporalio.service.TLSConfig: %s", e)
-    raise
+@dataclass
+class _ClientHolder:
+    """Connected Temporal client, shared by every worker run in this process."""
 
-try:
-    from temporalio.contrib.pydantic import pydantic_data_converter
+    client: Any | None = None
 
-    logger.info("  ✓ Imported temporalio.contrib.pydantic.pydantic_data_converter")
-except ImportError as e:
-    logger.error("  ✗ Failed to import temporalio.contrib.pydantic.pydantic_data_converter: %s", e)
-    raise
 
-try:
-    from workflows.investigate_repos_workflow import InvestigateReposWorkflow
+_shared_client = _ClientHolder()
+_client_lock = asyncio.Lock()
 
-    logger.info("  ✓ Imported InvestigateReposWorkflow")
-except ImportError as e:
-    logger.error("  ✗ Failed to import InvestigateReposWorkflow: %s", e)
-    raise
+# How often, and after what pause, worker.run() is restarted on a non-fatal RPC error
+WORKER_MAX_RESTARTS = 5
+WORKER_RESTART_DELAY_SECONDS = 5
 
-try:
-    from workflows.investigate_single_repo_workflow import InvestigateSingleRepoWorkflow
 
-    logger.info("  ✓ Imported InvestigateSingleRepoWorkflow")
-except ImportError as e:
-    logger.error("  ✗ Failed to import InvestigateSingleRepoWorkflow: %s", e)
-    raise
+@functools.cache
+def _import_worker_deps() -> _WorkerDeps:
+    """
+    Import the Temporal SDK, workflows and activities the first time they are needed.
 
+    Keeping these out of module import shortens cold start; the bundle is cached so a
+    reconnect does not import again.
 
-try:
-    from activities.investigate_activities import (
-        analyze_repository_structure_activity,
+    Returns:
+        The cached dependency bundle
+    """
+    logger.info("Importing Temporal SDK, workflows and activities...")
+    try:
+        from temporalio.client import Client
+        from temporalio.contrib.pydantic import pydantic_data_converter
+        from temporalio.service import RPCError, RPCStatusCode, TLSConfig
+        from temporalio.worker import Worker
+
+        from activities.dynamodb_health_check_activity import (
+            check_dynamodb_health,
+            cleanup_old_health_checks,
+        )
+        from activities.investigate_activities import (
+            analyze_repository_structure_activity,
+            analyze_with_claude_context,
+            cache_dependencies_activity,
+            cleanup_repository_activity,
+            clone_repository_activity,
+            get_prompts_config_activity,
+            read_dependencies_activity,
+            read_prompt_file_activity,
+            read_repos_config,
+            retrieve_all_results_activity,
+            save_prompt_context_activity,
+            save_to_arch_hub,
+            update_repos_list,
+            write_analysis_result_activity,
+        )
+        from activities.investigation_cache_activities import (
+            check_if_repo_needs_investigation,
+            save_investigation_metadata,
+        )
+        from workflows.investigate_repos_workflow import InvestigateReposWorkflow
+        from workflows.investigate_single_repo_workflow import InvestigateSingleRepoWorkflow
+    except ImportError as e:
+        logger.error("  ✗ Failed to import worker dependencies: %s", e)
+        raise
+
+    workflows = (InvestigateReposWorkflow, InvestigateSingleRepoWorkflow)
+    activities = (
+        save_to_arch_hub,
+        read_repos_config,
+        update_repos_list,
+        save_prompt_context_activity,
         analyze_with_claude_context,
-        cache_dependencies_activity,
-        cleanup_repository_activity,
+        retrieve_all_results_activity,
         clone_repository_activity,
+        analyze_repository_structure_activity,
         get_prompts_config_activity,
-        read_dependencies_activity,
         read_prompt_file_activity,
-        read_repos_config,
-        retrieve_all_results_activity,
-        save_prompt_context_activity,
-        save_to_arch_hub,
-        update_repos_list,
         write_analysis_result_activity,
-    )
-
-    logger.info("  ✓ Imported investigate activities")
-except ImportError as e:
-    logger.error("  ✗ Failed to import investigate activities: %s", e)
-    raise
-
-try:
-    from activities.investigation_cache_activities import (
+        cleanup_repository_activity,
         check_if_repo_needs_investigation,
         save_investigation_metadata,
-    )
-
-    logger.info("  ✓ Imported investigation cache activities")
-except ImportError as e:
-    logger.error("  ✗ Failed to import investigation cache activities: %s", e)
-    raise
-
-try:
-    from activities.dynamodb_health_check_activity import (
         check_dynamodb_health,
         cleanup_old_health_checks,
+        read_dependencies_activity,
+        cache_dependencies_activity,
     )
+    deps = _WorkerDeps(
+        client_cls=Client,
+        worker_cls=Worker,
+        tls_config=TLSConfig(),
+        data_converter=pydantic_data_converter,
+        rpc_error_cls=RPCError,
+        fatal_rpc_statuses=frozenset(
+            (RPCStatusCode.UNAUTHENTICATED, RPCStatusCode.PERMISSION_DENIED)
+        ),
+        workflows=workflows,
+        activities=activities,
+        workflow_names=tuple(w.__name__ for w in workflows),
+        activity_names=tuple(a.__name__ for a in activities),
+    )
+    logger.info("  ✓ Imported worker dependencies")
+    return deps
 
-    logger.info("  ✓ Imported DynamoDB health check activities")
-except ImportError as e:
-    logger.error("  ✗ Failed to import DynamoDB health check activities: %s", e)
-    raise
-
-logger.info("All imports successful!")
 
 # Health check file for ECS
 HEALTH_FILE = Path("/tmp/worker_health")
@@ -142,12 +250,17 @@ def update_health_file():
         logger.error("Failed to update health file: %s", e)
 
 
-def health_check_thread():
-    """Background thread that updates the health file periodically."""
+def health_check_thread(stop_event: threading.Event):
+    """
+    Background thread that updates the health file periodically.
+
+    A thread rather than an asyncio task, so the file is still touched while an activity
+    blocks the event loop (e.g. a long synchronous git clone).
+    """
     logger.info("Starting health check thread...")
-    while True:
+    while not stop_event.is_set():
         update_health_file()
-        time.sleep(10)  # Update every 10 seconds
+        stop_event.wait(10)  # Update every 10 seconds
 
 
 def get_temporal_config():
@@ -177,18 +290,44 @@ def get_temporal_config():
     return config
 
 
-async def main():
-    """Main function to run the Temporal worker for investigation workflows."""
-    logger.info("=" * 60)
-    logger.info("STARTING TEMPORAL WORKER")
-    logger.info("Python version: {sys.version}")
-    logger.info("Current directory: {os.getcwd()}")
-    logger.info("Script location: %s", os.path.abspath(__file__))
-    logger.info("=" * 60)
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the event loop the worker runs on.
 
+    Uses uvloop when it is installed, and eager task execution so coroutines that
+    finish without suspending skip a trip through the scheduler.
+
+    Returns:
+        A new, not yet running event loop
+    """
     try:
-        logger.info("Step 1: Getting Temporal configuration...")
-        config = get_temporal_config()
+        import uvloop
+
+        loop = uvloop.new_event_loop()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        loop = asyncio.new_event_loop()
+
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+
+async def _get_or_create_client(config: dict[str, Any], deps: _WorkerDeps) -> Any:
+    """
+    Connect to Temporal once per process and hand back the same client afterwards.
+
+    Args:
+        config: Temporal configuration from get_temporal_config()
+        deps: Imported worker dependencies
+
+    Returns:
+        The connected Temporal client
+    """
+    async with _client_lock:
+        if _shared_client.client is not None:
+            return _shared_client.client
 
         logger.info("Step 2: Preparing connection parameters...")
         logger.info("  Connecting to: %s", config["server_url"])
@@ -201,12 +340,9 @@ async def main():
 
         if not is_localhost and config["api_key"]:
             logger.info("Step 3: Configuring TLS for Temporal Cloud...")
-            logger.info("  Creating TLS configuration...")
-            tls_config = TLSConfig()
-            logger.info("  TLS configuration created successfully")
             connection_kwargs = {
                 "api_key": config["api_key"],
-                "tls": tls_config,
+                "tls": deps.tls_config,
             }
             logger.info("  Connection parameters configured for Temporal Cloud")
         else:
@@ -222,68 +358,84 @@ async def main():
         logger.info("  Namespace: %s", config["namespace"])
         logger.info("  Identity: %s", config["identity"])
 
-        client = await Client.connect(
+        client = await deps.client_cls.connect(
             config["server_url"],
             namespace=config["namespace"],
             identity=config["identity"],
-            data_converter=pydantic_data_converter,
+            data_converter=deps.data_converter,
             **connection_kwargs,
         )
         logger.info("✓ Successfully connected to Temporal server!")
+        _shared_client.client = client
+        return client
+
 
-        # Start health check thread after successful connection
+async def main():
+    """Main function to run the Temporal worker for investigation workflows."""
+    logger.info("=" * 60)
+    logger.info("STARTING TEMPORAL WORKER")
+    logger.info("Python version: {sys.version}")
+    logger.info("Current directory: {os.getcwd()}")
+    logger.info("Script location: %s", os.path.abspath(__file__))
+    logger.info("=" * 60)
+
+    try:
+        logger.info("Step 1: Getting Temporal configuration...")
+        config = get_temporal_config()
+        deps = _import_worker_deps()
+
+        client = await _get_or_create_client(config, deps)
+
+        # Start health check thread after successful connection; its first pass creates the file
         logger.info("Starting health check mechanism...")
-        health_thread = threading.Thread(target=health_check_thread, daemon=True)
-        health_thread.start()
-        update_health_file()  # Create initial health file
+        health_stop = threading.Event()
+        threading.Thread(
+            target=health_check_thread, args=(health_stop,), name="health-check", daemon=True
+        ).start()
         logger.info("✓ Health check mechanism started")
 
         # Run the worker for investigation workflows
         logger.info("Step 5: Creating worker instance...")
         logger.info("  Task queue: %s", config["task_queue"])
-        workflow_names = [
-            w.__name__ for w in [InvestigateReposWorkflow, InvestigateSingleRepoWorkflow]
-        ]
-        logger.info("  Workflows: %s", workflow_names)
-        all_activities = [
-            save_to_arch_hub,
-            read_repos_config,
-            update_repos_list,
-            save_prompt_context_activity,
-            analyze_with_claude_context,
-            retrieve_all_results_activity,
-            clone_repository_activity,
-            analyze_repository_structure_activity,
-            get_prompts_config_activity,
-            read_prompt_file_activity,
-            write_analysis_result_activity,
-            cleanup_repository_activity,
-            check_if_repo_needs_investigation,
-            save_investigation_metadata,
-            check_dynamodb_health,
-            cleanup_old_health_checks,
-            read_dependencies_activity,
-            cache_dependencies_activity,
-        ]
-        activity_names = [a.__name__ for a in all_activities]
-        logger.info("  Activities: %s", activity_names)
-
-        worker = Worker(
-            client,
-            task_queue=config["task_queue"],
-            workflows=[InvestigateReposWorkflow, InvestigateSingleRepoWorkflow],
-            activities=all_activities,
-        )
-        logger.info("✓ Worker instance created successfully!")
-
-        logger.info("Step 6: Starting worker run loop...")
-        logger.info("=" * 60)
-        logger.info("TEMPORAL WORKER IS RUNNING")
-        logger.info("Listening on task queue: %s", config["task_queue"])
-        logger.info("Waiting for workflows...")
-        logger.info("=" * 60)
-
-        await worker.run()
+        logger.info("  Workflows: %s", deps.workflow_names)
+        logger.info("  Activities: %s", deps.activity_names)
+
+        try:
+            restarts = 0
+            while True:
+                worker = deps.worker_cls(
+                    client,
+                    task_queue=config["task_queue"],
+                    workflows=deps.workflows,
+                    activities=deps.activities,
+                )
+                logger.info("✓ Worker instance created successfully!")
+
+                logger.info("Step 6: Starting worker run loop...")
+                logger.info("=" * 60)
+                logger.info("TEMPORAL WORKER IS RUNNING")
+                logger.info("Listening on task queue: %s", config["task_queue"])
+                logger.info("Waiting for workflows...")
+                logger.info("=" * 60)
+
+                try:
+                    await worker.run()
+                    break
+                except deps.rpc_error_cls as e:
+                    # Transient RPC failures restart the worker on the already connected client
+                    if e.status in deps.fatal_rpc_statuses or restarts >= WORKER_MAX_RESTARTS:
+                        raise
+                    restarts += 1
+                    logger.warning(
+                        "Worker stopped on RPC error (%s), restarting in %ss (%s/%s)",
+                        e,
+                        WORKER_RESTART_DELAY_SECONDS,
+                        restarts,
+                        WORKER_MAX_RESTARTS,
+                    )
+                    await asyncio.sleep(WORKER_RESTART_DELAY_SECONDS)
+        finally:
+            health_stop.set()
 
     except ImportError as e:
         logger.error("Import error - missing dependency: %s", e, exc_info=True)
@@ -301,15 +453,14 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        print(f"Starting worker from __main__ at {os.getcwd()}", flush=True)
-        asyncio.run(main())
+        logger.info("Starting worker from __main__ at %s", os.getcwd())
+        with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
-        print("Worker stopped by user", flush=True)
+        logger.info("Worker stopped by user")
         sys.exit(0)
     except (ConnectionError, RuntimeError, OSError) as e:
-        print(f"FATAL ERROR: {e}", flush=True)
-        print(f"Error type: {type(e).__name__}", flush=True)
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("FATAL ERROR: %s (%s)", e, type(e).__name__)
         sys.exit(1)
+    finally:
+        _stop_queued_logging(_log_listener)
@@ -6,14 +6,35 @@ results from multiple processing steps, ensuring all required sections are
 included in the final output.
 """
 
+import functools
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+VERSION_HEADER_PREFIX = "version="
 
-@dataclass
+
+@functools.lru_cache(maxsize=256)
+def _parse_version_header(first_line: str) -> str | None:
+    """
+    Parse the version declared on a prompt's first line.
+
+    Args:
+        first_line: First line of the prompt content
+
+    Returns:
+        The version string ("" when the header has no value), or None without a header
+    """
+    if not first_line.startswith(VERSION_HEADER_PREFIX):
+        return None
+    return first_line[len(VERSION_HEADER_PREFIX) :].partition("=")[0].strip()
+
+
+@dataclass(slots=True)
 class StepResult:
     """Represents a single analysis step result."""
 
@@ -28,6 +49,14 @@ class StepResult:
     cache_timestamp: str | None = None
 
 
+class PreparedStep(NamedTuple):
+    """A processing_order entry reduced to the fields the collector reads."""
+
+    name: str
+    description: str
+    required: bool
+
+
 class AnalysisResultsCollector:
     """
     Collects and manages analysis results from multiple processing steps.
@@ -37,6 +66,9 @@ class AnalysisResultsCollector:
     and validating completeness.
     """
 
+    # The missing-config warning is only logged for the first collector in the process
+    _warned_missing_config = False
+
     def __init__(self, repo_name: str, base_prompts_config: dict | None = None):
         """
         Initialize the collector.
@@ -47,20 +79,25 @@ class AnalysisResultsCollector:
         """
         self.repo_name = repo_name
         self.step_results: dict[str, StepResult] = {}
+        # Live view of the tracked step names; O(1) membership without rebuilding a set
+        self._tracked_names = self.step_results.keys()
         self.processing_order: list[dict] = []
+        self._prepared_source: list[dict] | None = None
+        self._prepared_order: tuple[PreparedStep, ...] = ()
         self.base_prompts_config = base_prompts_config or {}
-        self._extract_base_sections()
-
-    def _extract_base_sections(self) -> None:
-        """Extract base sections from the provided configuration."""
-        if self.base_prompts_config and "processing_order" in self.base_prompts_config:
-            self.base_sections = [
-                step["name"] for step in self.base_prompts_config.get("processing_order", [])
-            ]
+
+        # Ordered list for reporting, frozenset for membership checks
+        if base_prompts_config and "processing_order" in base_prompts_config:
+            self.base_sections = [step["name"] for step in base_prompts_config["processing_order"]]
+            self._base_sections_set = frozenset(self.base_sections)
             logger.info("Extracted %s base sections from config", len(self.base_sections))
         else:
-            logger.warning("No base prompts configuration provided")
             self.base_sections = []
+            self._base_sections_set = frozenset()
+            cls = type(self)
+            if not cls._warned_missing_config:
+                cls._warned_missing_config = True
+                logger.warning("No base prompts configuration provided")
 
     def track_step(
         self,
@@ -87,23 +124,55 @@ class AnalysisResultsCollector:
             required=required,
             context_dependencies=context_dependencies or [],
         )
-        logger.debug("Tracked step: %s with key: %s", result_key, step_name)
+        logger.debug("Tracked step: %s with key: %s", step_name, result_key)
+
+    def prepare_processing_order(
+        self, processing_order: list[dict] | tuple[PreparedStep, ...]
+    ) -> tuple[PreparedStep, ...]:
+        """
+        Reduce processing_order to (name, description, required) records.
+
+        The result is remembered for the list it was built from, so validation and
+        combining over the same list walk its dicts only once. Steps without a name
+        are dropped.
+
+        Args:
+            processing_order: The processing order configuration, or an already prepared one
+
+        Returns:
+            Tuple of prepared steps in processing order
+        """
+        if isinstance(processing_order, tuple):
+            return processing_order
+        if processing_order is self._prepared_source:
+            return self._prepared_order
+
+        prepared = tuple(
+            PreparedStep(name, step.get("description", ""), step.get("required", True))
+            for step in processing_order
+            if (name := step.get("name")) is not None
+        )
+        self._prepared_source = processing_order
+        self._prepared_order = prepared
+        return prepared
 
-    def validate_required_sections(self, processing_order: list[dict]) -> tuple[bool, list[str]]:
+    def validate_required_sections(
+        self, processing_order: list[dict] | tuple[PreparedStep, ...]
+    ) -> tuple[bool, list[str]]:
         """
         Validate that all required sections are present.
 
         Args:
-            processing_order: The processing order configuration
+            processing_order: The processing order configuration, or a prepared one
 
         Returns:
             Tuple of (is_valid, missing_sections)
         """
         required_sections = [
-            step["name"] for step in processing_order if step.get("required", True)
+            step.name for step in self.prepare_processing_order(processing_order) if step.required
         ]
 
-        tracked_sections = set(self.step_results.keys())
+        tracked_sections = self._tracked_names
         missing_sections = [
             section for section in required_sections if section not in tracked_sections
         ]
@@ -126,7 +195,7 @@ class AnalysisResultsCollector:
             logger.warning("No base sections loaded for validation")
             return True, []
 
-        tracked_sections = set(self.step_results.keys())
+        tracked_sections = self._tracked_names
         missing_base_sections = [
             section for section in self.base_sections if section not in tracked_sections
         ]
@@ -139,7 +208,7 @@ class AnalysisResultsCollector:
             logger.info("All %s base sections are present", len(self.base_sections))
 
         # Special check for monitoring section
-        if "monitoring" in self.base_sections and "monitoring" not in tracked_sections:
+        if "monitoring" in self._base_sections_set and "monitoring" not in tracked_sections:
             logger.error("CRITICAL: Monitoring section is missing from results!")
 
         return all_present, missing_base_sections
@@ -147,7 +216,7 @@ class AnalysisResultsCollector:
     def combine_results(
         self,
         results_map: dict[str, str],
-        processing_order: list[dict],
+        processing_order: list[dict] | tuple[PreparedStep, ...],
         cached_results_map: dict[str, dict] | None = None,
         prompt_versions: dict[str, str] | None = None,
     ) -> list[dict[str, Any]]:
@@ -157,7 +226,7 @@ class AnalysisResultsCollector:
 
         Args:
             results_map: Map of step names to their newly executed content
-            processing_order: The order in which to combine results
+            processing_order: The order in which to combine results, or a prepared one
             cached_results_map: Optional map of step names to cached results with version info
             prompt_versions: Optional map of step names to current prompt versions
 
@@ -167,98 +236,122 @@ class AnalysisResultsCollector:
         combined_results = []
         cached_results_map = cached_results_map or {}
         prompt_versions = prompt_versions or {}
+        result_names: set[str] = set()
+
+        # Bind lookups once; they run for every step in processing_order
+        cached_get = cached_results_map.get
+        versions_get = prompt_versions.get
+        step_results_get = self.step_results.get
+        append_result = combined_results.append
+        add_result_name = result_names.add
 
         # Statistics for logging
         cached_count = 0
         new_count = 0
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        # Steps without content, reported once after the loop
+        missing_required: list[str] = []
+        missing_optional: list[str] = []
 
         # Process in the order specified by processing_order
-        for step_config in processing_order:
-            step_name = step_config.get("name")
-            if step_name is None:
-                continue
+        for step_name, description, required in self.prepare_processing_order(processing_order):
+            current_version = versions_get(step_name, "1")
 
-            current_version = prompt_versions.get(step_name, "1")
-
-            # Check if we have a cached result with matching version
-            cached_result = cached_results_map.get(step_name, {})
-            cached_version = cached_result.get("version")
-            cached_content = cached_result.get("content")
+            cached_result = cached_get(step_name)
+            if cached_result is None:
+                cached_version = cached_content = None
+            else:
+                cached_version = cached_result.get("version")
+                cached_content = cached_result.get("content")
 
-            # Decide whether to use cached or new result
+            # A new result always wins; otherwise fall back to the cached one, even when
+            # its version is outdated (better than nothing)
             use_cached = False
             content = None
 
-            if (
-                cached_content
-                and cached_version == current_version
-                and step_name not in results_map
-            ):
-                # Use cached result if versions match and no new result available
-                content = cached_content
-                use_cached = True
-                cached_count += 1
-                logger.info("Using cached result for step: %s (v%s)", current_version, step_name)
-            elif step_name in results_map:
-                # Use new result if available
+            if step_name in results_map:
                 content = results_map[step_name]
                 new_count += 1
-                logger.info("Using new result for step: %s (v%s)", current_version, step_name)
             elif cached_content:
-                # Fallback to cached even if version mismatch (better than nothing)
                 content = cached_content
                 use_cached = True
                 cached_count += 1
-                logger.warning(
-                    f"Using outdated cached result for step: {step_name} "
-                    f"(cached v{cached_version} != current v{current_version})"
-                )
+                if cached_version != current_version:
+                    logger.warning(
+                        "Using outdated cached result for step: %s (cached v%s != current v%s)",
+                        step_name,
+                        cached_version,
+                        current_version,
+                    )
 
             if content:  # Only include if there's actual content
                 # Get the tracked step info if available
-                step_info = self.step_results.get(step_name)
-
-                result_dict = {
-                    "name": step_name,
-                    "description": step_config.get("description", ""),
-                    "content": content,
-                    "version": current_version,
-                    "cached": use_cached,
-                }
-
-                # Add additional metadata if available
-                if step_info:
-                    result_dict["result_key"] = step_info.result_key
-                    result_dict["required"] = step_info.required
-
-                if use_cached and cached_result:
+                step_info = step_results_get(step_name)
+
+                # Build each shape in one literal so the dict is sized once, not grown
+                if step_info is None:
+                    result_dict = {
+                        "name": step_name,
+                        "description": description,
+                        "content": content,
+                        "version": current_version,
+                        "cached": use_cached,
+                    }
+                else:
+                    result_dict = {
+                        "name": step_name,
+                        "description": description,
+                        "content": content,
+                        "version": current_version,
+                        "cached": use_cached,
+                        "result_key": step_info.result_key,
+                        "required": step_info.required,
+                    }
+
+                if use_cached:
                     result_dict["cache_timestamp"] = cached_result.get("timestamp")
 
-                combined_results.append(result_dict)
-                logger.debug(
-                    f"Added {'cached' if use_cached else 'new'} result for step: {step_name} ({len(content)} chars)"
-                )
+                append_result(result_dict)
+                add_result_name(step_name)
+                if log_debug:
+                    logger.debug(
+                        "Using %s result for step: %s (v%s, %s chars)",
+                        "cached" if use_cached else "new",
+                        step_name,
+                        current_version,
+                        len(content),
+                    )
+            elif required:
+                missing_required.append(step_name)
             else:
-                # Check if this was a required step
-                if step_config.get("required", True):
-                    logger.error("Missing required step in results: %s", step_name)
-                else:
-                    logger.info("Optional step not in results: %s", step_name)
+                missing_optional.append(step_name)
 
         logger.info(
-            f"Combined {len(combined_results)} results from {len(processing_order)} steps "
-            f"(cached: {cached_count}, new: {new_count})"
+            "Combined %s results from %s steps (cached: %s, new: %s)",
+            len(combined_results),
+            len(processing_order),
+            cached_count,
+            new_count,
         )
+        if missing_required:
+            logger.error(
+                "Missing required steps in results (%s): %s",
+                len(missing_required),
+                missing_required,
+            )
+        if missing_optional:
+            logger.info(
+                "Optional steps not in results (%s): %s", len(missing_optional), missing_optional
+            )
 
         # Validate all base sections are present
         if self.base_sections:
-            result_names = {r["name"] for r in combined_results}
             missing_base = [s for s in self.base_sections if s not in result_names]
             if missing_base:
                 logger.error("Base sections missing from combined results: %s", missing_base)
 
             # Special validation for monitoring section
-            if "monitoring" in self.base_sections and "monitoring" not in result_names:
+            if "monitoring" in self._base_sections_set and "monitoring" not in result_names:
                 raise ValueError("Critical: Monitoring section missing from final results!")
 
         return combined_results
@@ -277,29 +370,36 @@ class AnalysisResultsCollector:
             logger.warning("No results to generate final analysis")
             return ""
 
-        sections = []
+        # Collect the pieces and join once so large section contents are copied a single time
+        parts: list[str] = []
+        append = parts.append
+        section_names = set()
         for result in results:
-            section = f"# {result['name']}\n\n"
+            name = result["name"]
+            section_names.add(name)
+            append("# ")
+            append(name)
+            append("\n\n")
 
-            if result.get("description"):
-                section += f"{result['description']}\n\n"
+            description = result.get("description")
+            if description:
+                append(description)
+                append("\n\n")
 
-            section += result["content"]
-            sections.append(section)
+            append(result["content"])
+            append("\n\n")
+        parts.pop()  # No separator after the last section
 
-        final_analysis = "\n\n".join(sections)
+        final_analysis = "".join(parts)
 
         logger.info(
-            f"Generated final analysis with {len(sections)} sections, "
-            f"total length: {len(final_analysis)} characters"
+            "Generated final analysis with %s sections, total length: %s characters",
+            len(results),
+            len(final_analysis),
         )
 
         # Final validation - ensure monitoring section is in the output
-        if (
-            self.base_sections
-            and "monitoring" in self.base_sections
-            and "# monitoring\n" not in final_analysis.lower()
-        ):
+        if "monitoring" in self._base_sections_set and "monitoring" not in section_names:
             logger.error("WARNING: Monitoring section not found in final analysis output!")
 
         return final_analysis
@@ -314,25 +414,26 @@ class AnalysisResultsCollector:
         Returns:
             List of missing section names
         """
-        tracked = set(self.step_results.keys())
-        available = set(results_map.keys())
-        return list(tracked - available)
+        return list(self._tracked_names - results_map.keys())
 
-    def get_statistics(self) -> dict[str, Any]:
+    def get_statistics(self) -> Mapping[str, Any]:
         """
         Get statistics about the collected results.
 
         Returns:
-            Dictionary with statistics
+            Read-only mapping with statistics; "tracked_sections" and "base_sections"
+            are tuples captured at call time
         """
-        return {
-            "repo_name": self.repo_name,
-            "total_steps_tracked": len(self.step_results),
-            "base_sections_expected": len(self.base_sections),
-            "has_monitoring": "monitoring" in self.step_results,
-            "tracked_sections": list(self.step_results.keys()),
-            "base_sections": self.base_sections,
-        }
+        return MappingProxyType(
+            {
+                "repo_name": self.repo_name,
+                "total_steps_tracked": len(self.step_results),
+                "base_sections_expected": len(self.base_sections),
+                "has_monitoring": "monitoring" in self.step_results,
+                "tracked_sections": tuple(self.step_results),
+                "base_sections": tuple(self.base_sections),
+            }
+        )
 
     @staticmethod
     def extract_prompt_version(prompt_content: str) -> str:
@@ -351,19 +452,16 @@ class AnalysisResultsCollector:
         if not prompt_content:
             raise ValueError("Prompt content is empty")
 
-        lines = prompt_content.split("\n")
-        if lines and lines[0].startswith("version="):
-            try:
-                version = lines[0].split("=")[1].strip()
-                if not version:
-                    raise ValueError(f"Version is empty in prompt: {prompt_content}")
-                return version
-            except (IndexError, ValueError) as err:
-                raise ValueError(
-                    f"Invalid version format in prompt (line missing?): {prompt_content}"
-                ) from err
+        # Only the first line matters, so avoid splitting the whole prompt
+        newline = prompt_content.find("\n")
+        first_line = prompt_content if newline == -1 else prompt_content[:newline]
 
-        raise ValueError(f"No version found in prompt: {prompt_content}")
+        version = _parse_version_header(first_line)
+        if version is None:
+            raise ValueError(f"No version found in prompt: {prompt_content}")
+        if not version:
+            raise ValueError(f"Invalid version format in prompt (line missing?): {prompt_content}")
+        return version
 
     def track_prompt_versions(self, prompts_content: dict[str, str]) -> dict[str, str]:
         """
@@ -376,8 +474,11 @@ class AnalysisResultsCollector:
             Map of prompt names to their versions
         """
         versions = {}
+        log_debug = logger.isEnabledFor(logging.DEBUG)
         for name, content in prompts_content.items():
-            versions[name] = self.extract_prompt_version(content)
-            logger.debug("Prompt %s has version {versions[name]}", name)
+            version = self.extract_prompt_version(content)
+            versions[name] = version
+            if log_debug:
+                logger.debug("Prompt %s has version %s", name, version)
 
         return versions
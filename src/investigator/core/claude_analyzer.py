@@ -6,28 +6,211 @@ Supports two modes:
 2. CLI mode: Uses Claude CLI with subscription auth (subclaude technique)
 """
 
-from anthropic import Anthropic
+import asyncio
+import atexit
+import functools
+import hashlib
+import importlib.util
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
 
 from .config import Config
 
+REPO_STRUCTURE_PLACEHOLDER = "{repo_structure}"
+PREVIOUS_CONTEXT_PLACEHOLDER = "{previous_context}"
+
+# Stand-ins left in the system prompt where the dynamic sections used to be inlined
+REPO_STRUCTURE_REFERENCE = "(The repository structure is provided in the user message.)"
+PREVIOUS_CONTEXT_REFERENCE = "(Previous analysis context is provided in the user message.)"
+
+# Matches either placeholder, so a template is substituted in a single scan
+_PLACEHOLDER_RE = re.compile(
+    f"{re.escape(REPO_STRUCTURE_PLACEHOLDER)}|{re.escape(PREVIOUS_CONTEXT_PLACEHOLDER)}"
+)
+
+# Marks a content block as the end of a cacheable prompt prefix
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Upper bound on analyses kept by a ClaudeResponseCache
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+# HTTP/2 needs the optional h2 package; without it the shared pool stays on HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Async connections belong to the event loop that opened them, so there is one pool per loop;
+# each entry is removed again when its loop shuts down
+_shared_async_http_clients: dict[asyncio.AbstractEventLoop, DefaultAsyncHttpxClient] = {}
+# Strong references to the tasks that close those pools (the loop only keeps weak ones)
+_async_http_client_closers: set[asyncio.Task] = set()
+
+
+@functools.cache
+def _get_shared_http_client() -> DefaultHttpxClient:
+    """
+    Return the process-wide HTTP client for sync Anthropic clients, creating it on first use.
+
+    The pool is shared by every analyzer in the process, so API calls reuse TLS connections.
+    The SDK's default clients already carry generous pool limits and timeouts.
+    """
+    client = DefaultHttpxClient(http2=HTTP2_AVAILABLE)
+    atexit.register(client.close)
+    return client
+
+
+def _usage_tokens(usage, name: str) -> int:
+    """Read a token count from SDK usage objects or CLI usage dicts, 0 when absent."""
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _get_shared_async_http_client() -> DefaultAsyncHttpxClient:
+    """
+    Return the HTTP client for async Anthropic clients on the running event loop.
+
+    The client is closed when the loop shuts down: asyncio.run() cancels the task
+    started here, which then closes the pool.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_async_http_clients.get(loop)
+    if client is None:
+        client = DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+        _shared_async_http_clients[loop] = client
+        closer = loop.create_task(_close_async_http_client_on_shutdown(loop, client))
+        _async_http_client_closers.add(closer)
+        closer.add_done_callback(_async_http_client_closers.discard)
+    return client
+
+
+async def _close_async_http_client_on_shutdown(
+    loop: asyncio.AbstractEventLoop, client: DefaultAsyncHttpxClient
+) -> None:
+    """Wait until cancelled at loop shutdown, then close the loop's shared HTTP client."""
+    try:
+        await asyncio.Event().wait()
+    finally:
+        _shared_async_http_clients.pop(loop, None)
+        await client.aclose()
+
+
+def normalize_for_cache(text: str) -> str:
+    """
+    Drop whitespace differences that do not change what a prompt asks for.
+
+    Trailing whitespace on each line and blank lines are removed; indentation is kept
+    because it carries the nesting of the repository structure.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Normalized text used for cache keys
+    """
+    return "\n".join(line.rstrip() for line in text.splitlines() if line.strip())
+
 
 class ClaudeCLIError(Exception):
     """Raised when Claude CLI invocation fails."""
 
 
+@dataclass(slots=True, frozen=True)
+class _CachedAnalysis:
+    """A cached analysis, with the same timing fields as the AnalysisResult cache model."""
+
+    result_content: str
+    timestamp: float
+    ttl_minutes: int
+
+
+class ClaudeResponseCache:
+    """Bounded in-process cache of Claude analyses keyed by a hash of the whole request."""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_minutes: int | None = None,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Least recently used entries beyond this are evicted
+            ttl_minutes: Lifetime of an entry, defaults to Config.CLAUDE_RESPONSE_CACHE_TTL_MINUTES
+        """
+        self._entries: OrderedDict[str, _CachedAnalysis] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_minutes = (
+            ttl_minutes if ttl_minutes is not None else Config.CLAUDE_RESPONSE_CACHE_TTL_MINUTES
+        )
+
+    @staticmethod
+    def key_for(request_kwargs: dict) -> str:
+        """
+        Build the cache key for a messages.create request.
+
+        Args:
+            request_kwargs: Keyword arguments built by ClaudeAnalyzer._build_request
+
+        Returns:
+            SHA-256 hex digest of model, max_tokens and the normalized system text
+            and user message
+        """
+        system_text = "".join(block["text"] for block in request_kwargs.get("system", ()))
+        user_text = request_kwargs["messages"][0]["content"]
+        material = (
+            f"{request_kwargs['model']}|{request_kwargs['max_tokens']}|"
+            f"{normalize_for_cache(system_text)}|{normalize_for_cache(user_text)}"
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached analysis for a key if it has not expired, otherwise None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry.timestamp >= entry.ttl_minutes * 60:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.result_content
+
+    def put(self, key: str, analysis_text: str) -> None:
+        """Store an analysis, evicting the least recently used entries beyond the bound."""
+        self._entries[key] = _CachedAnalysis(analysis_text, time.time(), self._ttl_minutes)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
 class ClaudeAnalyzer:
     """Handles Claude API interactions for analysis."""
 
-    def __init__(self, api_key: str | None = None, logger=None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        logger=None,
+        response_cache: ClaudeResponseCache | None = None,
+    ):
         """
         Initialize the Claude analyzer with either API or CLI mode.
 
         Args:
             api_key: Anthropic API key (required if USE_CLAUDE_CLI=false, ignored in CLI mode)
             logger: Logger instance for output
+            response_cache: Cache of previous analyses to share between analyzers;
+                a private one is created when omitted
         """
         self.logger = logger
+        self.response_cache = (
+            response_cache if response_cache is not None else ClaudeResponseCache()
+        )
         self.use_cli = Config.USE_CLAUDE_CLI
+        self._api_key = api_key
+        self._async_client: AsyncAnthropic | None = None
 
         if self.use_cli:
             # CLI mode - import and use the CLI adapter
@@ -47,13 +230,13 @@ class ClaudeAnalyzer:
                     "ANTHROPIC_API_KEY required when USE_CLAUDE_CLI=false. "
                     "Set ANTHROPIC_API_KEY environment variable or set USE_CLAUDE_CLI=true to use subscription mode."
                 )
-            self.client = Anthropic(api_key=api_key)
+            self.client = Anthropic(api_key=api_key, http_client=_get_shared_http_client())
             self.mode = "API"
             if logger:
                 logger.info("Using Anthropic API for Claude requests")
 
         if logger:
-            logger.info("Claude Analyzer initialized in {self.mode} mode")
+            logger.info("Claude Analyzer initialized in %s mode", self.mode)
 
     def clean_prompt(self, prompt_template: str) -> str:
         """
@@ -89,15 +272,74 @@ class ClaudeAnalyzer:
             # No version line found, return as-is
             return prompt_template
 
-    def analyze_with_context(
+    def build_prompt_parts(
+        self, cleaned_template: str, repo_structure: str, context_section: str
+    ) -> tuple[list[dict], str]:
+        """
+        Split a prompt into static system instructions and a dynamic user message.
+
+        The template is identical for every repository, so it goes first as a system
+        prompt marked for caching, with its placeholders pointing at the user message.
+        The repository structure and previous context make up the user message.
+
+        Args:
+            cleaned_template: Prompt template with version header removed
+            repo_structure: Repository structure string
+            context_section: Formatted previous-context section, or "" when there is none
+
+        Returns:
+            Tuple of (system content blocks, user message text); the blocks list is empty
+            when the template has no instructions
+        """
+        references = {
+            REPO_STRUCTURE_PLACEHOLDER: REPO_STRUCTURE_REFERENCE,
+            PREVIOUS_CONTEXT_PLACEHOLDER: PREVIOUS_CONTEXT_REFERENCE if context_section else "",
+        }
+        instructions = _PLACEHOLDER_RE.sub(lambda m: references[m.group()], cleaned_template)
+
+        system_blocks = []
+        if instructions.strip():
+            system_blocks.append(
+                {"type": "text", "text": instructions, "cache_control": EPHEMERAL_CACHE_CONTROL}
+            )
+
+        user_message = f"## Repository Structure\n\n{repo_structure}{context_section}"
+        return system_blocks, user_message
+
+    def build_prompt(
+        self, prompt_template: str, repo_structure: str, previous_context: str | None
+    ) -> tuple[list[dict], str]:
+        """
+        Build the system blocks and user message sent to Claude for one analysis.
+
+        Args:
+            prompt_template: Prompt template to use
+            repo_structure: Repository structure string
+            previous_context: Previous analysis results to include as context
+
+        Returns:
+            Tuple of (system content blocks, user message text), as from build_prompt_parts
+        """
+        # Clean the prompt template first (remove version lines, etc.)
+        cleaned_template = self.clean_prompt(prompt_template)
+
+        # Add previous context if available, otherwise the placeholder is just removed
+        context_section = (
+            f"\n\n## Previous Analysis Context\n\n{previous_context}\n\n"
+            if previous_context
+            else ""
+        )
+        return self.build_prompt_parts(cleaned_template, repo_structure, context_section)
+
+    def _build_request(
         self,
         prompt_template: str,
         repo_structure: str,
-        previous_context: str | None = None,
-        config_overrides: dict | None = None,
-    ) -> str:
+        previous_context: str | None,
+        config_overrides: dict | None,
+    ) -> dict:
         """
-        Analyze using Claude with optional context from previous analyses.
+        Build the messages.create keyword arguments for one analysis.
 
         Args:
             prompt_template: Prompt template to use
@@ -106,67 +348,211 @@ class ClaudeAnalyzer:
             config_overrides: Optional dict with claude_model, max_tokens overrides
 
         Returns:
-            Analysis result from Claude
+            Keyword arguments for messages.create
         """
         if config_overrides is None:
             config_overrides = {}
 
-        # Clean the prompt template first (remove version lines, etc.)
-        cleaned_template = self.clean_prompt(prompt_template)
+        system_blocks, user_message = self.build_prompt(
+            prompt_template, repo_structure, previous_context
+        )
 
-        # Replace placeholders in the cleaned prompt
-        prompt = cleaned_template.replace("{repo_structure}", repo_structure)
+        # Sizing and previewing a large prompt is only worth it when debug output is on
+        if self.logger and self.logger.isEnabledFor(logging.DEBUG):
+            prompt_length = len(user_message) + sum(len(block["text"]) for block in system_blocks)
+            self.logger.debug("Prompt created (%s characters)", prompt_length)
+            self.logger.debug("Prompt preview (first 1000 chars): %s...", user_message[:1000])
 
-        # Add previous context if available
-        if previous_context:
-            context_section = f"\n\n## Previous Analysis Context\n\n{previous_context}\n\n"
-            prompt = prompt.replace("{previous_context}", context_section)
-        else:
-            # Remove the placeholder if no context
-            prompt = prompt.replace("{previous_context}", "")
+        # Use config overrides or defaults
+        claude_model = config_overrides.get("claude_model") or Config.CLAUDE_MODEL
+        max_tokens = config_overrides.get("max_tokens") or Config.MAX_TOKENS
 
+        # Log the mode being used
         if self.logger:
-            self.logger.debug("Prompt created ({len(prompt)} characters)")
-            self.logger.debug("Prompt preview (first 1000 chars): {prompt[:1000]}...")
-
-        try:
-            # Use config overrides or defaults
-            claude_model = config_overrides.get("claude_model") or Config.CLAUDE_MODEL
-            max_tokens = config_overrides.get("max_tokens") or Config.MAX_TOKENS
+            self.logger.info(
+                "[%s MODE] Sending analysis request via Claude %s", self.mode, self.mode
+            )
+            self.logger.debug("Using model: %s, max_tokens: %s", claude_model, max_tokens)
+
+        request_kwargs: dict = {
+            "model": claude_model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+        if system_blocks:
+            request_kwargs["system"] = system_blocks
+        return request_kwargs
+
+    def _read_analysis_text(self, response) -> str:
+        """
+        Extract the analysis text from a Claude response.
 
-            # Log the mode being used
-            if self.logger:
-                self.logger.info(
-                    f"[{self.mode} MODE] Sending analysis request via Claude {'CLI' if self.use_cli else 'API'}"
-                )
-                self.logger.debug("Using model: %s, max_tokens: %s", claude_model, max_tokens)
+        Args:
+            response: Response from messages.create
 
-            response = self.client.messages.create(
-                model=claude_model,
-                max_tokens=max_tokens,
-                messages=[{"role": "user", "content": prompt}],
-            )
+        Returns:
+            Text of the first content block
+        """
+        self._log_cache_usage(response)
 
-            # Type assertion: response.content is a list with at least one text block
-            content_block = response.content[0]
-            analysis_text: str = getattr(content_block, "text", str(content_block))
+        # Type assertion: response.content is a list with at least one text block
+        content_block = response.content[0]
+        analysis_text: str = getattr(content_block, "text", str(content_block))
 
-            if self.logger:
-                self.logger.info(
-                    f"[{self.mode} MODE] Received analysis from Claude {'CLI' if self.use_cli else 'API'} "
-                    f"({len(analysis_text)} characters)"
-                )
+        if self.logger:
+            self.logger.info(
+                "[%s MODE] Received analysis from Claude %s (%s characters)",
+                self.mode,
+                self.mode,
+                len(analysis_text),
+            )
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     "Analysis preview (first 1000 chars): %s...", analysis_text[:1000]
                 )
 
-            return analysis_text
+        return analysis_text
+
+    def _log_cache_usage(self, response) -> None:
+        """
+        Log how much of the prompt was served from Anthropic's prompt cache.
+
+        A falling hit ratio means the cached prefix changed between requests, for example
+        dynamic text leaking into the system prompt.
 
+        Args:
+            response: Response from messages.create
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None or not self.logger:
+            return
+
+        cache_read = _usage_tokens(usage, "cache_read_input_tokens")
+        cache_created = _usage_tokens(usage, "cache_creation_input_tokens")
+        uncached = _usage_tokens(usage, "input_tokens")
+        total_input = cache_read + cache_created + uncached
+        if not total_input:
+            # The CLI reports no usage
+            return
+
+        hit_ratio = cache_read / total_input
+        self.logger.info(
+            "[%s MODE] Prompt cache: hit_ratio=%.2f read=%s created=%s uncached=%s",
+            self.mode,
+            hit_ratio,
+            cache_read,
+            cache_created,
+            uncached,
+            extra={
+                "event": "claude_cache",
+                "hit_ratio": hit_ratio,
+                "read": cache_read,
+                "create": cache_created,
+            },
+        )
+
+    def _request_failed(self, error: Exception) -> Exception:
+        """Log a failed Claude request and build the exception to raise for it."""
+        error_prefix = f"[{self.mode} MODE] "
+        if self.logger:
+            self.logger.error("%sClaude request failed: %s", error_prefix, error)
+        return Exception(f"{error_prefix}Failed to get analysis from Claude: {error!s}")
+
+    def _cached_analysis(self, cache_key: str) -> str | None:
+        """Return a cached analysis for an identical earlier request, if there is one."""
+        analysis_text = self.response_cache.get(cache_key)
+        if analysis_text is not None and self.logger:
+            self.logger.info(
+                "[%s MODE] Reusing cached analysis for identical request (%s characters)",
+                self.mode,
+                len(analysis_text),
+            )
+        return analysis_text
+
+    def _get_async_client(self) -> AsyncAnthropic:
+        """Create the async Anthropic client on first use (API mode only)."""
+        if self._async_client is None:
+            self._async_client = AsyncAnthropic(
+                api_key=self._api_key, http_client=_get_shared_async_http_client()
+            )
+        return self._async_client
+
+    def analyze_with_context(
+        self,
+        prompt_template: str,
+        repo_structure: str,
+        previous_context: str | None = None,
+        config_overrides: dict | None = None,
+    ) -> str:
+        """
+        Analyze using Claude with optional context from previous analyses.
+
+        Args:
+            prompt_template: Prompt template to use
+            repo_structure: Repository structure string
+            previous_context: Previous analysis results to include as context
+            config_overrides: Optional dict with claude_model, max_tokens overrides
+
+        Returns:
+            Analysis result from Claude
+        """
+        request_kwargs = self._build_request(
+            prompt_template, repo_structure, previous_context, config_overrides
+        )
+        cache_key = self.response_cache.key_for(request_kwargs)
+        cached = self._cached_analysis(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self.client.messages.create(**request_kwargs)
+            analysis_text = self._read_analysis_text(response)
         except (ConnectionError, RuntimeError, OSError) as e:
-            error_prefix = f"[{self.mode} MODE] "
-            if self.logger:
-                self.logger.error("%sClaude request failed: {str(e)}", error_prefix)
-            raise Exception(f"{error_prefix}Failed to get analysis from Claude: {e!s}") from e
+            raise self._request_failed(e) from e
+
+        self.response_cache.put(cache_key, analysis_text)
+        return analysis_text
+
+    async def analyze_with_context_async(
+        self,
+        prompt_template: str,
+        repo_structure: str,
+        previous_context: str | None = None,
+        config_overrides: dict | None = None,
+    ) -> str:
+        """
+        Async variant of analyze_with_context, so independent analyses can run concurrently.
+
+        API mode awaits AsyncAnthropic; CLI mode runs the CLI as an asyncio subprocess.
+
+        Args:
+            prompt_template: Prompt template to use
+            repo_structure: Repository structure string
+            previous_context: Previous analysis results to include as context
+            config_overrides: Optional dict with claude_model, max_tokens overrides
+
+        Returns:
+            Analysis result from Claude
+        """
+        request_kwargs = self._build_request(
+            prompt_template, repo_structure, previous_context, config_overrides
+        )
+        cache_key = self.response_cache.key_for(request_kwargs)
+        cached = self._cached_analysis(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            if self.use_cli:
+                response = await self.client.create_async(**request_kwargs)
+            else:
+                response = await self._get_async_client().messages.create(**request_kwargs)
+            analysis_text = self._read_analysis_text(response)
+        except (ConnectionError, RuntimeError, OSError) as e:
+            raise self._request_failed(e) from e
+
+        self.response_cache.put(cache_key, analysis_text)
+        return analysis_text
 
     def analyze_structure(self, repo_structure: str, prompt_template: str) -> str:
         """
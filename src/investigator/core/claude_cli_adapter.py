@@ -5,10 +5,29 @@ This module provides a CLI-based alternative to the Anthropic Python SDK,
 allowing the investigator to use the official Claude CLI binary instead of API calls.
 """
 
+import asyncio
 import json
+import logging
 import os
 import shutil
 import subprocess
+from functools import cached_property
+
+CLI_BINARY_NAME = "claude"
+
+# 15 minutes, the same as the activity timeout
+CLI_REQUEST_TIMEOUT_SECONDS = 900
+
+# Verified CLI paths keyed by binary name. Detection walks PATH and verification
+# spawns ``claude --version``; both only need to happen once per process.
+_VERIFIED_CLI_PATHS: dict[str, str] = {}
+
+
+def _blocks_to_text(content: str | list) -> str:
+    """Join the text of Anthropic-style content blocks; plain strings pass through."""
+    if isinstance(content, list):
+        return "".join(block.get("text", "") for block in content)
+    return content
 
 
 class ClaudeCLIAdapter:
@@ -25,10 +44,16 @@ class ClaudeCLIAdapter:
             RuntimeError: If Claude CLI binary is not found or not executable
         """
         self.logger = logger
-        self.cli_path = self._detect_cli_binary()
 
-        # Verify the CLI works
-        self._verify_cli()
+        cached_path = _VERIFIED_CLI_PATHS.get(CLI_BINARY_NAME)
+        if cached_path:
+            self.cli_path = cached_path
+        else:
+            self.cli_path = self._detect_cli_binary()
+
+            # Verify the CLI works
+            self._verify_cli()
+            _VERIFIED_CLI_PATHS[CLI_BINARY_NAME] = self.cli_path
 
         self.logger.info("Claude CLI adapter initialized using: %s", self.cli_path)
 
@@ -43,7 +68,7 @@ class ClaudeCLIAdapter:
             RuntimeError: If CLI binary is not found
         """
         # Try to find the claude CLI in PATH
-        cli_path = shutil.which("claude")
+        cli_path = shutil.which(CLI_BINARY_NAME)
 
         if not cli_path:
             error_msg = (
@@ -103,23 +128,20 @@ class ClaudeCLIAdapter:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
-    def create_message(self, model: str, max_tokens: int, messages: list) -> dict:
+    def _prepare_request(
+        self, model: str, max_tokens: int, messages: list, system: str | list | None
+    ) -> tuple[list[str], str]:
         """
-        Create a message using the Claude CLI.
-
-        This method mimics the Anthropic SDK's messages.create() interface
-        but uses the CLI under the hood.
+        Validate the messages and build the CLI command and the prompt to pipe to it.
 
         Args:
             model: The Claude model to use
             max_tokens: Maximum tokens in the response
             messages: List of message dicts with 'role' and 'content'
+            system: Optional system prompt, as text or a list of text blocks
 
         Returns:
-            dict: Response object with structure similar to Anthropic SDK
-
-        Raises:
-            Exception: If the CLI call fails
+            Tuple of (command argv, prompt text)
         """
         # Extract the user prompt (assuming single user message for simplicity)
         if not messages or len(messages) == 0:
@@ -129,77 +151,131 @@ class ClaudeCLIAdapter:
         if user_message.get("role") != "user":
             raise ValueError("First message must be from user")
 
-        prompt = user_message.get("content", "")
+        # The CLI takes one plain-text prompt; cache_control markers only matter to the API
+        prompt = _blocks_to_text(user_message.get("content", ""))
+        if system:
+            prompt = f"{_blocks_to_text(system)}\n\n{prompt}"
 
         self.logger.info("Sending request to Claude CLI")
         self.logger.debug("Model: %s, max_tokens: %s", model, max_tokens)
-        self.logger.debug("Prompt length: {len(prompt)} characters")
+        self.logger.debug("Prompt length: %s characters", len(prompt))
+
+        # The Claude CLI accepts prompts via stdin or as arguments
+        # We'll use stdin for large prompts
+        cmd = [
+            self.cli_path,
+            "prompt",
+            "--model",
+            model,
+            "--max-tokens",
+            str(max_tokens),
+            "--format",
+            "json",  # Request JSON output for easier parsing
+        ]
+        self.logger.debug("Running CLI command: %s", " ".join(cmd))
+        return cmd, prompt
+
+    def _build_response(self, model: str, returncode: int, stdout: str, stderr: str) -> dict:
+        """
+        Turn the CLI's exit status and output into an SDK-shaped response dict.
 
-        try:
-            # Prepare the CLI command
-            # The Claude CLI accepts prompts via stdin or as arguments
-            # We'll use stdin for large prompts
-            cmd = [
-                self.cli_path,
-                "prompt",
-                "--model",
-                model,
-                "--max-tokens",
-                str(max_tokens),
-                "--format",
-                "json",  # Request JSON output for easier parsing
-            ]
+        Args:
+            model: The Claude model that was requested
+            returncode: CLI exit code
+            stdout: Decoded standard output
+            stderr: Decoded standard error
 
-            self.logger.debug("Running CLI command: %s", " ".join(cmd))
+        Returns:
+            dict: Response object with structure similar to Anthropic SDK
 
-            # Execute the CLI with the prompt as stdin
-            result = subprocess.run(
-                cmd,
-                check=False,
-                input=prompt,
-                capture_output=True,
-                text=True,
-                timeout=900,  # 15 minutes timeout (same as activity timeout)
+        Raises:
+            Exception: If the CLI exited with an error
+        """
+        if returncode != 0:
+            error_msg = (
+                f"Claude CLI failed with exit code {returncode}.\n"
+                f"Error: {stderr}\n"
+                f"Output: {stdout}"
             )
+            self.logger.error(error_msg)
+            raise Exception(error_msg)
 
-            if result.returncode != 0:
-                error_msg = (
-                    f"Claude CLI failed with exit code {result.returncode}.\n"
-                    f"Error: {result.stderr}\n"
-                    f"Output: {result.stdout}"
-                )
-                self.logger.error(error_msg)
-                raise Exception(error_msg)
+        # Parse the CLI output
+        # The CLI might return JSON or plain text depending on the format flag
+        response_text = stdout.strip()
 
-            # Parse the CLI output
-            # The CLI might return JSON or plain text depending on the format flag
-            response_text = result.stdout.strip()
+        usage = {
+            "input_tokens": 0,  # CLI doesn't provide this
+            "output_tokens": 0,  # CLI doesn't provide this
+        }
 
-            # Try to parse as JSON first
+        # Only a JSON object can carry a "response" field, so plain text skips the parse
+        if response_text.startswith("{"):
             try:
                 response_data = json.loads(response_text)
                 # If it's a JSON response from the CLI, extract the text
                 if isinstance(response_data, dict) and "response" in response_data:
                     response_text = response_data["response"]
+                    # Pass through token and prompt cache counts if the CLI reports them
+                    if isinstance(response_data.get("usage"), dict):
+                        usage.update(response_data["usage"])
             except json.JSONDecodeError:
                 # Not JSON, use the raw text
                 pass
 
-            self.logger.info(
-                "Received response from Claude CLI (%s characters)", len(response_text)
-            )
+        self.logger.info("Received response from Claude CLI (%s characters)", len(response_text))
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Response preview: %s...", response_text[:200])
 
-            # Return a response object that mimics the Anthropic SDK structure
-            return {
-                "content": [{"type": "text", "text": response_text}],
-                "model": model,
-                "stop_reason": "end_turn",
-                "usage": {
-                    "input_tokens": 0,  # CLI doesn't provide this
-                    "output_tokens": 0,  # CLI doesn't provide this
-                },
-            }
+        # Return a response object that mimics the Anthropic SDK structure
+        return {
+            "content": [{"type": "text", "text": response_text}],
+            "model": model,
+            "stop_reason": "end_turn",
+            "usage": usage,
+        }
+
+    def create_message(
+        self, model: str, max_tokens: int, messages: list, system: str | list | None = None
+    ) -> dict:
+        """
+        Create a message using the Claude CLI.
+
+        This method mimics the Anthropic SDK's messages.create() interface
+        but uses the CLI under the hood.
+
+        Args:
+            model: The Claude model to use
+            max_tokens: Maximum tokens in the response
+            messages: List of message dicts with 'role' and 'content'
+            system: Optional system prompt, as text or a list of text blocks
+
+        Returns:
+            dict: Response object with structure similar to Anthropic SDK
+
+        Raises:
+            Exception: If the CLI call fails
+        """
+        cmd, prompt = self._prepare_request(model, max_tokens, messages, system)
+
+        # Each request runs its own CLI process: the CLI has no persistent request/response
+        # mode to keep alive between calls, and binary detection and verification are
+        # already done once per process (_VERIFIED_CLI_PATHS)
+        try:
+            # Execute the CLI with the prompt as stdin; pipes carry bytes, decoded once here
+            result = subprocess.run(
+                cmd,
+                check=False,
+                input=prompt.encode("utf-8"),
+                capture_output=True,
+                timeout=CLI_REQUEST_TIMEOUT_SECONDS,
+            )
+            return self._build_response(
+                model,
+                result.returncode,
+                result.stdout.decode("utf-8", errors="replace"),
+                result.stderr.decode("utf-8", errors="replace"),
+            )
 
         except subprocess.TimeoutExpired as err:
             error_msg = "Claude CLI request timed out after 15 minutes"
@@ -210,6 +286,61 @@ class ClaudeCLIAdapter:
             self.logger.error(error_msg)
             raise Exception(error_msg) from e
 
+    async def create_message_async(
+        self, model: str, max_tokens: int, messages: list, system: str | list | None = None
+    ) -> dict:
+        """
+        Create a message using the Claude CLI without blocking the event loop.
+
+        Same contract as create_message, but the CLI runs as an asyncio subprocess so
+        several requests can be in flight at once.
+
+        Args:
+            model: The Claude model to use
+            max_tokens: Maximum tokens in the response
+            messages: List of message dicts with 'role' and 'content'
+            system: Optional system prompt, as text or a list of text blocks
+
+        Returns:
+            dict: Response object with structure similar to Anthropic SDK
+
+        Raises:
+            Exception: If the CLI call fails
+        """
+        cmd, prompt = self._prepare_request(model, max_tokens, messages, system)
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(prompt.encode("utf-8")), timeout=CLI_REQUEST_TIMEOUT_SECONDS
+                )
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            return self._build_response(
+                model,
+                proc.returncode,
+                stdout.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace"),
+            )
+
+        except TimeoutError as err:
+            error_msg = "Claude CLI request timed out after 15 minutes"
+            self.logger.error(error_msg)
+            raise Exception(error_msg) from err
+        except Exception as e:
+            error_msg = f"Failed to execute Claude CLI: {e!s}"
+            self.logger.error(error_msg)
+            raise Exception(error_msg) from e
+
 
 class ClaudeCLIClient:
     """
@@ -229,7 +360,9 @@ class ClaudeCLIClient:
         self.adapter = ClaudeCLIAdapter(logger)
         self.messages = self  # Allow client.messages.create() syntax
 
-    def create(self, model: str, max_tokens: int, messages: list) -> "ClaudeCLIResponse":
+    def create(
+        self, model: str, max_tokens: int, messages: list, system: str | list | None = None
+    ) -> "ClaudeCLIResponse":
         """
         Create a message using the Claude CLI.
 
@@ -237,11 +370,32 @@ class ClaudeCLIClient:
             model: The Claude model to use
             max_tokens: Maximum tokens in the response
             messages: List of message dicts
+            system: Optional system prompt, as text or a list of text blocks
 
         Returns:
             ClaudeCLIResponse: Response object with SDK-compatible interface
         """
-        response_data = self.adapter.create_message(model, max_tokens, messages)
+        response_data = self.adapter.create_message(model, max_tokens, messages, system=system)
+        return ClaudeCLIResponse(response_data)
+
+    async def create_async(
+        self, model: str, max_tokens: int, messages: list, system: str | list | None = None
+    ) -> "ClaudeCLIResponse":
+        """
+        Create a message using the Claude CLI without blocking the event loop.
+
+        Args:
+            model: The Claude model to use
+            max_tokens: Maximum tokens in the response
+            messages: List of message dicts
+            system: Optional system prompt, as text or a list of text blocks
+
+        Returns:
+            ClaudeCLIResponse: Response object with SDK-compatible interface
+        """
+        response_data = await self.adapter.create_message_async(
+            model, max_tokens, messages, system=system
+        )
         return ClaudeCLIResponse(response_data)
 
 
@@ -256,10 +410,26 @@ class ClaudeCLIResponse:
             response_data: Raw response data from the CLI adapter
         """
         self._data = response_data
-        self.content = [ClaudeCLIContent(item) for item in response_data.get("content", [])]
-        self.model = response_data.get("model", "")
-        self.stop_reason = response_data.get("stop_reason", "")
-        self.usage = response_data.get("usage", {})
+
+    @cached_property
+    def content(self) -> list["ClaudeCLIContent"]:
+        """Content blocks, wrapped on first access."""
+        return [ClaudeCLIContent(item) for item in self._data.get("content", [])]
+
+    @property
+    def model(self) -> str:
+        """Model that produced the response."""
+        return self._data.get("model", "")
+
+    @property
+    def stop_reason(self) -> str:
+        """Why generation stopped."""
+        return self._data.get("stop_reason", "")
+
+    @property
+    def usage(self) -> dict:
+        """Token usage reported for the request."""
+        return self._data.get("usage", {})
 
 
 class ClaudeCLIContent:
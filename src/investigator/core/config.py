@@ -5,6 +5,19 @@ Configuration constants for the Claude Investigator.
 import os
 from typing import ClassVar
 
+# Accepted spellings for an enabled boolean environment flag
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
+
+
+def parse_use_cli(value: str | None) -> bool:
+    """Return True when a USE_CLAUDE_CLI value enables CLI mode."""
+    return bool(value) and value.strip().lower() in _TRUTHY
+
+
+def _env_flag(name: str) -> bool:
+    """Read a boolean flag from the environment, accepting the same spellings as USE_CLAUDE_CLI."""
+    return parse_use_cli(os.getenv(name))
+
 
 class Config:
     """Configuration constants for the investigator."""
@@ -15,8 +28,14 @@ class Config:
 
     # Claude CLI settings (for subscription-based usage via subclaude technique)
     # When True, uses Claude CLI instead of API (requires authenticated CLI)
-    USE_CLAUDE_CLI: bool = os.getenv("USE_CLAUDE_CLI", "false").lower() == "true"
+    USE_CLAUDE_CLI: bool = _env_flag("USE_CLAUDE_CLI")
     CLAUDE_CLI_TIMEOUT: int = int(os.getenv("CLAUDE_CLI_TIMEOUT", "300"))  # 5 minutes default
+    # Independent analysis steps sent to Claude at the same time
+    ANALYSIS_STEP_CONCURRENCY: int = int(os.getenv("ANALYSIS_STEP_CONCURRENCY", "4"))
+    # How long an identical Claude request may be answered from the in-process cache
+    CLAUDE_RESPONSE_CACHE_TTL_MINUTES: int = int(
+        os.getenv("CLAUDE_RESPONSE_CACHE_TTL_MINUTES", "60")
+    )
 
     # Valid Claude model names for validation (4.x models only)
     # See: https://platform.claude.com/docs/en/about-claude/models/overview
@@ -33,6 +52,8 @@ class Config:
 
     # File settings
     ANALYSIS_FILE: str = "arch.md"
+    # Skip fsync on output writes; they stay atomic but may be lost on power failure
+    FAST_WRITES: bool = _env_flag("FAST_WRITES")
 
     # Logging format
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -2,25 +2,82 @@
 File operations for the Claude Investigator.
 """
 
+import asyncio
+import contextlib
+import copy
+import functools
 import json
 import os
+import re
 from datetime import UTC, datetime
 from typing import Any
 
+from .config import Config
+
+# [[repository name]] marker written by the hl_overview step
+_RE_REPO_NAME = re.compile(r"\[\[([^\]]+)\]\]")
+# Characters not allowed in the generated file name
+_RE_SANITIZE = re.compile(r"[^\w\-_.]")
+
+# The marker sits in the overview at the top, so look there before scanning everything
+REPO_NAME_SCAN_PREFIX_CHARS = 4096
+
+# Buffer size for output file writes, large enough for a whole analysis in one call
+WRITE_BUFFER_BYTES = 1 << 20
+
+
+def _write_atomic(path: str, content: str) -> None:
+    """
+    Write content to path via a temporary file and rename, so readers never see a partial file.
+
+    Args:
+        path: Destination file path
+        content: Text to write, encoded as UTF-8
+    """
+    data = content.encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb", buffering=WRITE_BUFFER_BYTES) as f:
+            f.write(data)
+            if not Config.FAST_WRITES:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_config(path: str, _mtime_ns: int) -> Any:
+    """Parse a JSON config file; _mtime_ns is only part of the cache key so edits are picked up."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_json_config(path: str) -> Any:
+    """Return the parsed JSON config at path, reparsing only when the file has changed."""
+    return _load_json_config(path, os.stat(path).st_mtime_ns)
+
 
 class FileManager:
     """Handles file operations."""
 
     def __init__(self, logger):
         self.logger = logger
+        # Prompt file path -> (st_mtime_ns, content)
+        self._prompt_cache: dict[str, tuple[int, str]] = {}
+        # Repositories whose arch-docs folder this manager has already created
+        self._arch_docs_ready: set[str] = set()
 
     def read_prompts_config(self, prompts_dir: str) -> dict[str, Any]:
         """Read the prompts configuration from prompts.json with inheritance support."""
         prompts_config_path = os.path.join(prompts_dir, "prompts.json")
 
         try:
-            with open(prompts_config_path, encoding="utf-8") as f:
-                config = json.load(f)
+            # Parsed configs are shared through the cache; copy before handing out
+            config = _read_json_config(prompts_config_path)
 
             # Check if this config extends another config
             if "extends" in config:
@@ -28,11 +85,10 @@ class FileManager:
                 base_config_path = os.path.normpath(os.path.join(prompts_dir, config["extends"]))
                 self.logger.debug("Loading base config from: %s", base_config_path)
 
-                with open(base_config_path, encoding="utf-8") as f:
-                    base_config = json.load(f)
+                base_config = _read_json_config(base_config_path)
 
                 # Start with base processing order
-                processing_order = base_config.get("processing_order", []).copy()
+                processing_order = copy.deepcopy(base_config.get("processing_order", []))
 
                 # Add any additional prompts from the domain config
                 if "additional_prompts" in config:
@@ -42,7 +98,7 @@ class FileManager:
                         if not prompt["file"].startswith("../"):
                             # It's a domain-specific file, keep as is
                             pass
-                        processing_order.append(prompt)
+                        processing_order.append(copy.deepcopy(prompt))
                     self.logger.debug(
                         f"Added {len(config['additional_prompts'])} domain-specific prompts"
                     )
@@ -51,7 +107,9 @@ class FileManager:
             else:
                 # No inheritance, return config as-is
                 # Cast to dict[str, Any] since json.load returns Any
-                return config if isinstance(config, dict) else {"processing_order": []}
+                if not isinstance(config, dict):
+                    return {"processing_order": []}
+                return copy.deepcopy(config)
 
         except FileNotFoundError as e:
             self.logger.error("Prompts config file not found: %s", prompts_config_path)
@@ -63,26 +121,85 @@ class FileManager:
             self.logger.error("Failed to read prompts config: {str(e)}")
             raise Exception(f"Failed to read prompts config: {e!s}") from e
 
-    def read_prompt_file(self, prompts_dir: str, filename: str) -> str | None:
-        """Read a specific prompt file."""
+    @staticmethod
+    def _resolve_prompt_path(prompts_dir: str, filename: str) -> str:
+        """Return the path of a prompt file referenced from prompts_dir."""
         # Handle relative paths properly
         if filename.startswith("../"):
             # Resolve relative path from prompts_dir
-            prompt_path = os.path.normpath(os.path.join(prompts_dir, filename))
-        else:
-            prompt_path = os.path.join(prompts_dir, filename)
+            return os.path.normpath(os.path.join(prompts_dir, filename))
+        return os.path.join(prompts_dir, filename)
+
+    def preload_prompts(self, prompts_dir: str, processing_order: list[dict[str, Any]]) -> int:
+        """
+        Read every prompt file referenced by processing_order into memory.
+
+        Each directory holding referenced prompts is scanned once, so missing files cost
+        no extra syscalls; read_prompt_file then serves the preloaded content.
 
-        if not os.path.exists(prompt_path):
+        Args:
+            prompts_dir: Directory the processing order was read from
+            processing_order: Steps from read_prompts_config
+
+        Returns:
+            Number of prompt files loaded
+        """
+        paths_by_dir: dict[str, set[str]] = {}
+        for step in processing_order:
+            filename = step.get("file")
+            if filename:
+                prompt_path = self._resolve_prompt_path(prompts_dir, filename)
+                paths_by_dir.setdefault(os.path.dirname(prompt_path), set()).add(prompt_path)
+
+        loaded = 0
+        for directory, paths in paths_by_dir.items():
+            try:
+                with os.scandir(directory or ".") as entries:
+                    found = {
+                        os.path.join(directory, entry.name): entry
+                        for entry in entries
+                        if entry.is_file()
+                    }
+            except OSError:
+                self.logger.warning("Prompt directory not readable: %s", directory)
+                continue
+
+            for prompt_path in paths & found.keys():
+                try:
+                    mtime_ns = found[prompt_path].stat().st_mtime_ns
+                    with open(prompt_path, encoding="utf-8") as f:
+                        self._prompt_cache[prompt_path] = (mtime_ns, f.read())
+                    loaded += 1
+                except OSError as e:
+                    self.logger.warning("Failed to preload prompt file %s: %s", prompt_path, e)
+
+        self.logger.debug("Preloaded %s prompt files", loaded)
+        return loaded
+
+    def read_prompt_file(self, prompts_dir: str, filename: str) -> str | None:
+        """Read a specific prompt file, serving unchanged files from memory."""
+        prompt_path = self._resolve_prompt_path(prompts_dir, filename)
+
+        try:
+            mtime_ns = os.stat(prompt_path).st_mtime_ns
+        except OSError:
             self.logger.warning("Prompt file not found: %s", prompt_path)
             return None
 
+        cached = self._prompt_cache.get(prompt_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
             with open(prompt_path, encoding="utf-8") as f:
-                return f.read()
+                content = f.read()
         except Exception:
             self.logger.error("Failed to read prompt file %s: {str(e)}", filename)
             return None
 
+        self._prompt_cache[prompt_path] = (mtime_ns, content)
+        return content
+
     def cleanup_arch_docs(self, repo_path: str) -> None:
         """
         Remove existing arch-docs folder if it exists to prevent stale output.
@@ -91,6 +208,7 @@ class FileManager:
             repo_path: Path to the repository
         """
         arch_docs_path = os.path.join(repo_path, "arch-docs")
+        self._arch_docs_ready.discard(repo_path)
 
         if os.path.exists(arch_docs_path):
             try:
@@ -103,17 +221,32 @@ class FileManager:
         else:
             self.logger.debug("No existing arch-docs folder found at: %s", arch_docs_path)
 
+    def ensure_arch_docs_dir(self, repo_path: str) -> str:
+        """
+        Create the arch-docs folder for a repository once per manager.
+
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            Path to the arch-docs folder
+        """
+        arch_docs_path = os.path.join(repo_path, "arch-docs")
+        if repo_path not in self._arch_docs_ready:
+            os.makedirs(arch_docs_path, exist_ok=True)
+            self._arch_docs_ready.add(repo_path)
+        return arch_docs_path
+
     def extract_repository_name_from_analysis(self, analysis: str) -> str:
         """Extract repository name from hl_overview section using [[name]] format."""
-        import re
-
-        # Look for [[repository name]] pattern in the analysis
-        match = re.search(r"\[\[([^\]]+)\]\]", analysis)
+        # Look for [[repository name]] pattern in the analysis, starting with the overview
+        match = _RE_REPO_NAME.search(analysis, 0, REPO_NAME_SCAN_PREFIX_CHARS)
+        if match is None and len(analysis) > REPO_NAME_SCAN_PREFIX_CHARS:
+            # A marker straddling the prefix boundary is found here too
+            match = _RE_REPO_NAME.search(analysis)
         if match:
-            repo_name = match.group(1).strip()
             # Clean up the name for filename use
-            repo_name = re.sub(r"[^\w\-_.]", "_", repo_name)
-            return repo_name
+            return _RE_SANITIZE.sub("_", match.group(1).strip())
         return "unknown_repo"
 
     def write_analysis(self, repo_path: str, analysis: str) -> str:
@@ -131,8 +264,7 @@ class FileManager:
         repo_name = self.extract_repository_name_from_analysis(analysis)
 
         # Create arch-docs folder in the repository
-        arch_docs_path = os.path.join(repo_path, "arch-docs")
-        os.makedirs(arch_docs_path, exist_ok=True)
+        arch_docs_path = self.ensure_arch_docs_dir(repo_path)
 
         # Use repository name in filename
         filename = f"{repo_name}-arch.md"
@@ -143,8 +275,7 @@ class FileManager:
         full_content = header + analysis
 
         try:
-            with open(arch_file_path, "w", encoding="utf-8") as f:
-                f.write(full_content)
+            _write_atomic(arch_file_path, full_content)
 
             self.logger.info("Architecture analysis written to: %s", arch_file_path)
             self.logger.debug("File size: %s characters", len(full_content))
@@ -157,14 +288,12 @@ class FileManager:
     def write_prompt_file(self, repo_path: str, step_name: str, prompt_content: str) -> str:
         """Write prompt content to a file in the arch-docs folder."""
         # Create arch-docs folder in the repository
-        arch_docs_path = os.path.join(repo_path, "arch-docs")
-        os.makedirs(arch_docs_path, exist_ok=True)
+        arch_docs_path = self.ensure_arch_docs_dir(repo_path)
 
         output_path = os.path.join(arch_docs_path, f"{step_name}_prompt.md")
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(prompt_content)
+            _write_atomic(output_path, prompt_content)
 
             self.logger.debug("Prompt file written to: %s", output_path)
             return output_path
@@ -176,14 +305,12 @@ class FileManager:
     def write_intermediate_result(self, repo_path: str, step_name: str, content: str) -> str:
         """Write intermediate analysis result to a file in the arch-docs folder."""
         # Create arch-docs folder in the repository
-        arch_docs_path = os.path.join(repo_path, "arch-docs")
-        os.makedirs(arch_docs_path, exist_ok=True)
+        arch_docs_path = self.ensure_arch_docs_dir(repo_path)
 
         output_path = os.path.join(arch_docs_path, f"{step_name}_result.md")
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            _write_atomic(output_path, content)
 
             self.logger.debug("Intermediate result written to: %s", output_path)
             return output_path
@@ -192,6 +319,26 @@ class FileManager:
             self.logger.error("Failed to write intermediate result: {str(e)}")
             raise Exception(f"Failed to write intermediate result: {e!s}") from e
 
+    async def write_analysis_async(self, repo_path: str, analysis: str) -> str:
+        """Async write_analysis; the file I/O runs in a worker thread, off the event loop."""
+        return await asyncio.to_thread(self.write_analysis, repo_path, analysis)
+
+    async def write_prompt_file_async(
+        self, repo_path: str, step_name: str, prompt_content: str
+    ) -> str:
+        """Async write_prompt_file; the file I/O runs in a worker thread, off the event loop."""
+        return await asyncio.to_thread(
+            self.write_prompt_file, repo_path, step_name, prompt_content
+        )
+
+    async def write_intermediate_result_async(
+        self, repo_path: str, step_name: str, content: str
+    ) -> str:
+        """Async write_intermediate_result; the file I/O runs in a worker thread."""
+        return await asyncio.to_thread(
+            self.write_intermediate_result, repo_path, step_name, content
+        )
+
     def _create_analysis_header(self) -> str:
         """Create the header for the analysis file."""
         return f"""# Repository Architecture Analysis
@@ -2,8 +2,10 @@
 Main Claude Investigator module for repository analysis.
 """
 
+import asyncio
 import logging
 import os
+from collections.abc import Awaitable, Callable
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
@@ -101,6 +103,30 @@ class ClaudeInvestigator:
     # ---------------------------------
     # Temporal activity heartbeat utils
     # ---------------------------------
+    async def _write_output(
+        self,
+        write: Callable[..., str],
+        write_async: Callable[..., Awaitable[str]],
+        *args: str,
+    ) -> str:
+        """
+        Write an output file without blocking the event loop where that is allowed.
+
+        Workflow code may not start threads, so in a Temporal workflow context the
+        synchronous writer is used.
+
+        Args:
+            write: Synchronous FileManager writer
+            write_async: Its threaded async counterpart
+            *args: Arguments for the writer
+
+        Returns:
+            Path of the written file
+        """
+        if self.activity_wrapper.is_temporal_context():
+            return write(*args)
+        return await write_async(*args)
+
     @staticmethod
     def _heartbeat_safe(details: str | None = None) -> None:
         """Attempt to heartbeat if running inside a Temporal activity.
@@ -210,7 +236,12 @@ class ClaudeInvestigator:
 
             # Step 4: Write final analysis to file
             self.logger.info("Step 4: Writing analysis to {repository-name}-arch.md")
-            arch_file_path = self.file_manager.write_analysis(repo_path, final_analysis)
+            arch_file_path = await self._write_output(
+                self.file_manager.write_analysis,
+                self.file_manager.write_analysis_async,
+                repo_path,
+                final_analysis,
+            )
             self._heartbeat_safe("final_analysis_written")
 
             self.logger.info(
@@ -297,28 +328,29 @@ class ClaudeInvestigator:
     ) -> str:
         """
         Build the exact prompt that will be sent to Claude.
-        This replicates the logic from ClaudeAnalyzer.analyze_with_context()
+
+        Uses ClaudeAnalyzer.build_prompt, so the saved file shows both parts of the request:
+        the cached system prompt (the template) and the user message (repository structure
+        and previous context).
 
         Args:
             prompt_template: The prompt template with placeholders
-            repo_structure: The repository structure to insert
+            repo_structure: The repository structure to send
             previous_context: Any previous context to include
 
         Returns:
-            The exact prompt string that will be sent to Claude
+            The system prompt and user message, each under its own heading
         """
-        # Replace placeholders in the prompt
-        prompt = prompt_template.replace("{repo_structure}", repo_structure)
+        system_blocks, user_message = self.claude_analyzer.build_prompt(
+            prompt_template, repo_structure, previous_context
+        )
+        system_prompt = "".join(block["text"] for block in system_blocks)
 
-        # Add previous context if available
-        if previous_context:
-            context_section = f"\n\n## Previous Analysis Context\n\n{previous_context}\n\n"
-            prompt = prompt.replace("{previous_context}", context_section)
-        else:
-            # Remove the placeholder if no context
-            prompt = prompt.replace("{previous_context}", "")
-
-        return prompt
+        sections = []
+        if system_prompt:
+            sections.append(f"# System Prompt\n\n{system_prompt}")
+        sections.append(f"# User Message\n\n{user_message}")
+        return "\n\n".join(sections)
 
     async def _process_analysis_step(
         self, step: dict, prompts_dir: str, repo_structure: str, step_results: dict[str, str]
@@ -368,8 +400,12 @@ class ClaudeInvestigator:
             # Save the exact prompt that's being sent to Claude
             if self.temp_dir is None:
                 raise ValueError("temp_dir must be set before processing analysis steps")
-            prompt_path = self.file_manager.write_prompt_file(
-                self.temp_dir, step_name, exact_prompt
+            prompt_path = await self._write_output(
+                self.file_manager.write_prompt_file,
+                self.file_manager.write_prompt_file_async,
+                self.temp_dir,
+                step_name,
+                exact_prompt,
             )
             self.logger.debug("Exact prompt saved to: %s", prompt_path)
 
@@ -399,15 +435,19 @@ class ClaudeInvestigator:
                 )
             else:
                 # Fallback to direct execution when not in Temporal context
-                result = self.claude_analyzer.analyze_with_context(
+                result = await self.claude_analyzer.analyze_with_context_async(
                     prompt_content, repo_structure, context_to_use
                 )
 
             # Save intermediate result
             if self.temp_dir is None:
                 raise ValueError("temp_dir must be set before processing analysis steps")
-            result_path = self.file_manager.write_intermediate_result(
-                self.temp_dir, step_name, result
+            result_path = await self._write_output(
+                self.file_manager.write_intermediate_result,
+                self.file_manager.write_intermediate_result_async,
+                self.temp_dir,
+                step_name,
+                result,
             )
             self.logger.debug("Intermediate result saved to: %s", result_path)
             # Heartbeat after finishing the step
@@ -443,27 +483,74 @@ class ClaudeInvestigator:
         # Sort by order field
         processing_order.sort(key=lambda x: x.get("order", 999))
 
+        # Read all referenced prompt files up front instead of one by one per step
+        self.file_manager.preload_prompts(prompts_dir, processing_order)
+
         # Initialize results storage
         step_results: dict[str, str] = {}
         all_results = []
+        semaphore = asyncio.Semaphore(Config.ANALYSIS_STEP_CONCURRENCY)
 
-        for step in processing_order:
-            result = await self._process_analysis_step(
-                step, prompts_dir, repo_structure, step_results
-            )
+        async def process_step(step: dict) -> dict | None:
+            async with semaphore:
+                return await self._process_analysis_step(
+                    step, prompts_dir, repo_structure, step_results
+                )
 
-            if result:
-                # Store result for potential context use
-                step_results[result["name"]] = result["content"]
-                all_results.append(result)
-            # Heartbeat after each loop iteration regardless of result
-            self._heartbeat_safe("sequential_step_progress")
+        # Steps run concurrently in batches; a step that needs context from a step in
+        # the current batch starts a new batch, so results keep their dependencies
+        for batch in self._batch_independent_steps(processing_order):
+            batch_results = await asyncio.gather(*(process_step(step) for step in batch))
+
+            for result in batch_results:
+                if result:
+                    # Store result for potential context use
+                    step_results[result["name"]] = result["content"]
+                    all_results.append(result)
+                # Heartbeat after each step regardless of result
+                self._heartbeat_safe("sequential_step_progress")
 
         # Format all results into a comprehensive document
         final_analysis = self._format_final_analysis(all_results)
         self._heartbeat_safe("sequential_analysis_formatted")
         return final_analysis
 
+    @staticmethod
+    def _batch_independent_steps(processing_order: list[dict]) -> list[list[dict]]:
+        """
+        Group consecutive steps that do not take context from each other.
+
+        Args:
+            processing_order: Steps in processing order
+
+        Returns:
+            Batches of steps, in order; every step only depends on earlier batches
+        """
+        batches: list[list[dict]] = []
+        current: list[dict] = []
+        current_names: set[str] = set()
+
+        for step in processing_order:
+            context_config = step.get("context") or []
+            context_items = context_config if isinstance(context_config, list) else [context_config]
+            depends_on = {
+                item.get("val")
+                for item in context_items
+                if isinstance(item, dict) and item.get("type") == "step"
+            }
+
+            if depends_on & current_names:
+                batches.append(current)
+                current = []
+                current_names = set()
+
+            current.append(step)
+            current_names.add(step.get("name", "unknown"))
+
+        if current:
+            batches.append(current)
+        return batches
+
     def _format_final_analysis(self, all_results: list[dict]) -> str:
         """Format all analysis results into a comprehensive document."""
         sections = []
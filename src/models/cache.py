@@ -7,12 +7,19 @@ and prompt outputs at various levels.
 
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .investigation import NonEmptyStr
+
+# Cache models are immutable values, so they can be shared between caches and used as keys
+_CACHE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class AnalysisResult(BaseModel):
     """Structure for cached analysis results."""
 
+    model_config = _CACHE_MODEL_CONFIG
+
     reference_key: str = Field(..., description="Unique reference key for the result")
     result_content: str = Field(..., description="The analysis result content")
     step_name: str | None = Field(None, description="Name of the analysis step")
@@ -35,46 +42,26 @@ class AnalysisResult(BaseModel):
 class CacheCheckResult(BaseModel):
     """Result of checking if a repository needs investigation."""
 
+    model_config = _CACHE_MODEL_CONFIG
+
     needs_investigation: bool = Field(..., description="Whether investigation is needed")
-    reason: str = Field(..., description="Reason for the decision")
+    reason: NonEmptyStr = Field(..., description="Reason for the decision")
     latest_commit: str | None = Field(None, description="Current commit SHA")
     branch_name: str | None = Field(None, description="Current branch name")
     last_investigation: dict[str, Any] | None = Field(
         None, description="Previous investigation metadata"
     )
 
-    @field_validator("reason")
-    @classmethod
-    def validate_reason(cls, v):
-        """Ensure reason is a non-empty string."""
-        if not v or not v.strip():
-            raise ValueError("Reason must be a non-empty string")
-        return v.strip()
-
 
 class PromptCacheResult(BaseModel):
     """Result of checking prompt-level cache."""
 
+    model_config = _CACHE_MODEL_CONFIG
+
     needs_analysis: bool = Field(..., description="Whether the prompt needs to be analyzed")
     cached_result_key: str | None = Field(
         None, description="Reference key to cached result if available"
     )
     cached_result: str | None = Field(None, description="The cached content if available")
-    reason: str = Field(..., description="Explanation of the decision")
-    version: str = Field(default="1", description="Version of the cached result")
-
-    @field_validator("reason")
-    @classmethod
-    def validate_reason(cls, v):
-        """Ensure reason is a non-empty string."""
-        if not v or not v.strip():
-            raise ValueError("Reason must be a non-empty string")
-        return v.strip()
-
-    @field_validator("version")
-    @classmethod
-    def validate_version(cls, v):
-        """Ensure version is a non-empty string."""
-        if not v or not v.strip():
-            raise ValueError("Version must be a non-empty string")
-        return v.strip()
+    reason: NonEmptyStr = Field(..., description="Explanation of the decision")
+    version: NonEmptyStr = Field(default="1", description="Version of the cached result")
@@ -6,37 +6,73 @@ the investigation system for tracking repository state, decisions,
 and metadata.
 """
 
-from typing import Any
-
-from pydantic import BaseModel, Field, field_validator
-
-
-class PromptMetadata(BaseModel):
-    """Metadata about prompts used in an investigation."""
-
-    count: int = Field(..., ge=0, description="Number of prompts used")
-    versions: dict[str, str] = Field(
-        default_factory=dict, description="Mapping of prompt names to versions"
-    )
+from dataclasses import dataclass, field
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+
+# Non-empty after surrounding whitespace is stripped, checked by pydantic-core without a validator
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+def _strip_non_empty(value: str, field_name: str) -> str:
+    """Return value stripped, raising ValueError if nothing is left."""
+    # str.strip returns the same object when there is nothing to strip, so clean
+    # input costs one call and no allocation
+    stripped = value.strip() if value else ""
+    if not stripped:
+        raise ValueError(f"{field_name} must be a non-empty string")
+    return stripped
+
+
+@dataclass(slots=True, frozen=True)
+class PromptMetadata:
+    """
+    Metadata about prompts used in an investigation.
+
+    A plain dataclass rather than a pydantic model: it is built inside every
+    InvestigationMetadata. Pydantic still validates it (including __post_init__) when a
+    nested dict is validated as part of InvestigationMetadata.
+    """
+
+    # Number of prompts used
+    count: int
+    # Mapping of prompt names to versions
+    versions: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Ensure count is non-negative and all version values are non-empty strings."""
+        if self.count < 0:
+            raise ValueError("Prompt count must be non-negative")
+        for prompt_name, version in self.versions.items():
+            if type(version) is not str or not version or version.isspace():
+                raise ValueError(f"Version for prompt '{prompt_name}' must be a non-empty string")
 
-    @field_validator("versions")
     @classmethod
-    def validate_versions(cls, v):
-        """Ensure all version values are non-empty strings."""
-        for prompt_name, version in v.items():
-            if not isinstance(version, str) or not version.strip():
-                raise ValueError(f"Version for prompt '{prompt_name}' must be a non-empty string")
-        return v
+    def from_cache(cls, data: dict[str, Any]) -> "PromptMetadata":
+        """Rebuild from stored data that was validated when it was saved, skipping validation."""
+        metadata = object.__new__(cls)
+        object.__setattr__(metadata, "count", data.get("count", 0))
+        object.__setattr__(metadata, "versions", data.get("versions") or {})
+        return metadata
 
 
 class InvestigationMetadata(BaseModel):
     """Complete investigation metadata stored in the cache."""
 
-    latest_commit: str | None = Field(None, description="SHA of the latest commit investigated")
-    branch_name: str = Field(..., description="Name of the branch investigated")
+    latest_commit: NonEmptyStr | None = Field(
+        None, description="SHA of the latest commit investigated"
+    )
+    branch_name: NonEmptyStr = Field(..., description="Name of the branch investigated")
     analysis_timestamp: float = Field(
         ..., description="Unix timestamp of when the analysis was performed"
     )
+    analysis_timestamp_iso: str | None = Field(
+        None, description="ISO-8601 form of analysis_timestamp, precomputed on save"
+    )
+    stable_streak: int = Field(
+        default=0, ge=0, description="Consecutive saves that found this state unchanged"
+    )
     repository_name: str | None = Field(None, description="Name of the repository")
     repository_url: str | None = Field(None, description="URL of the repository")
     analysis_type: str = Field(default="investigation", description="Type of analysis performed")
@@ -45,22 +81,6 @@ class InvestigationMetadata(BaseModel):
         default_factory=dict, description="Additional analysis data"
     )
 
-    @field_validator("latest_commit")
-    @classmethod
-    def validate_commit_sha(cls, v):
-        """Ensure commit SHA is a non-empty string if provided."""
-        if v is not None and (not v or not v.strip()):
-            raise ValueError("Commit SHA must be a non-empty string if provided")
-        return v.strip() if v else v
-
-    @field_validator("branch_name")
-    @classmethod
-    def validate_branch_name(cls, v):
-        """Ensure branch name is a non-empty string."""
-        if not v or not v.strip():
-            raise ValueError("Branch name must be a non-empty string")
-        return v.strip()
-
     @field_validator("analysis_timestamp")
     @classmethod
     def validate_timestamp(cls, v):
@@ -69,44 +89,85 @@ class InvestigationMetadata(BaseModel):
             raise ValueError("Analysis timestamp must be non-negative")
         return v
 
+    @classmethod
+    def from_cache(cls, data: dict[str, Any]) -> "InvestigationMetadata":
+        """
+        Rebuild from a stored record that was validated when it was saved, skipping validation.
 
-class InvestigationDecision(BaseModel):
-    """Result of checking if a repository needs investigation."""
+        model_construct does not build nested models, so prompt_metadata is constructed here.
 
-    needs_investigation: bool = Field(..., description="Whether investigation is needed")
-    reason: str = Field(..., description="Reason for the decision")
-    latest_commit: str | None = Field(None, description="Latest commit SHA")
-    branch_name: str | None = Field(None, description="Branch name")
-    last_investigation: Any | None = Field(None, description="Previous investigation metadata")
+        Args:
+            data: Stored investigation record
 
-    @field_validator("reason")
-    @classmethod
-    def validate_reason(cls, v):
+        Returns:
+            InvestigationMetadata with the record's fields; unknown keys are ignored
+        """
+        prompt_metadata = data.get("prompt_metadata")
+        if isinstance(prompt_metadata, dict):
+            data = {**data, "prompt_metadata": PromptMetadata.from_cache(prompt_metadata)}
+        return cls.model_construct(**data)
+
+
+@dataclass(slots=True, frozen=True)
+class InvestigationDecision:
+    """
+    Result of checking if a repository needs investigation.
+
+    A plain dataclass rather than a pydantic model: decisions are built on every cache
+    check and never cross a serialization boundary themselves.
+    """
+
+    needs_investigation: bool
+    reason: str
+    latest_commit: str | None = None
+    branch_name: str | None = None
+    # Previous investigation metadata
+    last_investigation: Any | None = None
+
+    def __post_init__(self):
         """Ensure reason is a non-empty string."""
-        if not v or not v.strip():
-            raise ValueError("Reason must be a non-empty string")
-        return v.strip()
+        object.__setattr__(self, "reason", _strip_non_empty(self.reason, "Reason"))
 
 
-class RepositoryState(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RepositoryState:
     """Current state of a repository."""
 
-    commit_sha: str = Field(..., description="Current commit SHA")
-    branch_name: str = Field(..., description="Current branch name")
-    has_uncommitted_changes: bool = Field(..., description="Whether there are uncommitted changes")
+    commit_sha: str
+    branch_name: str
+    has_uncommitted_changes: bool
 
-    @field_validator("commit_sha")
-    @classmethod
-    def validate_commit_sha(cls, v):
-        """Ensure commit SHA is a non-empty string."""
-        if not v or not v.strip():
-            raise ValueError("Commit SHA must be a non-empty string")
-        return v.strip()
+    def __post_init__(self):
+        """Ensure commit SHA and branch name are non-empty strings."""
+        object.__setattr__(self, "commit_sha", _strip_non_empty(self.commit_sha, "Commit SHA"))
+        object.__setattr__(
+            self, "branch_name", _strip_non_empty(self.branch_name, "Branch name")
+        )
 
-    @field_validator("branch_name")
-    @classmethod
-    def validate_branch_name(cls, v):
-        """Ensure branch name is a non-empty string."""
-        if not v or not v.strip():
-            raise ValueError("Branch name must be a non-empty string")
-        return v.strip()
+
+# Core validator and serializer bound once, so bulk paths skip the BaseModel.__init__ wrapper
+_INVESTIGATION_VALIDATOR = InvestigationMetadata.__pydantic_validator__
+_INVESTIGATION_SERIALIZER = InvestigationMetadata.__pydantic_serializer__
+
+
+def validate_investigation_metadata(data: dict[str, Any]) -> InvestigationMetadata:
+    """
+    Validate a stored record as InvestigationMetadata with the prebound core validator.
+
+    Use InvestigationMetadata.from_cache instead when the record needs no validation.
+
+    Args:
+        data: Investigation record; a nested prompt_metadata dict is validated too
+
+    Returns:
+        Validated InvestigationMetadata
+
+    Raises:
+        pydantic.ValidationError: If the record is invalid
+    """
+    return _INVESTIGATION_VALIDATOR.validate_python(data)
+
+
+def dump_investigation_metadata(metadata: InvestigationMetadata) -> dict[str, Any]:
+    """Serialize InvestigationMetadata to a dict with the prebound core serializer."""
+    return _INVESTIGATION_SERIALIZER.to_python(metadata)
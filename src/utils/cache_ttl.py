@@ -0,0 +1,47 @@
+"""
+Adaptive TTL calculation for cached investigation data.
+
+Repositories whose investigation state keeps coming back unchanged get
+longer-lived cache entries; any change resets the streak to the base TTL.
+"""
+
+# Unit conversions shared by every TTL computed from a number of days
+MINUTES_PER_DAY = 24 * 60
+SECONDS_PER_DAY = MINUTES_PER_DAY * 60
+
+# Upper bound for any adaptive TTL, in days
+MAX_ADAPTIVE_TTL_DAYS = 365
+
+# The TTL doubles per stable save, up to this many doublings
+MAX_STABLE_STREAK_DOUBLINGS = 4
+
+
+def adaptive_ttl_days(ttl_days: int, stable_streak: int) -> int:
+    """
+    Widen a base TTL exponentially with the number of consecutive unchanged saves.
+
+    Args:
+        ttl_days: Base TTL in days (falsy values disable TTL and are returned as-is)
+        stable_streak: Consecutive saves that found nothing changed
+
+    Returns:
+        ttl_days * 2**min(stable_streak, MAX_STABLE_STREAK_DOUBLINGS), capped at
+        MAX_ADAPTIVE_TTL_DAYS
+    """
+    if not ttl_days or stable_streak <= 0:
+        return ttl_days
+    doublings = min(stable_streak, MAX_STABLE_STREAK_DOUBLINGS)
+    return min(MAX_ADAPTIVE_TTL_DAYS, ttl_days * 2**doublings)
+
+
+def ttl_days_to_minutes(ttl_days: int) -> int:
+    """
+    Convert a TTL in days to the minutes the storage layer expects.
+
+    Args:
+        ttl_days: TTL in days
+
+    Returns:
+        The same TTL in minutes
+    """
+    return ttl_days * MINUTES_PER_DAY
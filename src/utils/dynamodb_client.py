@@ -16,8 +16,20 @@ import boto3
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
+from .cache_ttl import SECONDS_PER_DAY, adaptive_ttl_days
+
 logger = logging.getLogger(__name__)
 
+# Analysis results larger than this are stored gzip-compressed
+RESULT_COMPRESSION_THRESHOLD_BYTES = 4 * 1024
+
+# gzip level for analysis results; level 9 costs far more CPU for a few percent
+RESULT_COMPRESSION_LEVEL = 6
+
+# An unchanged investigation row is only rewritten once less than this fraction
+# of its widened TTL remains; other no-op saves write nothing
+STABLE_ROW_REFRESH_FRACTION = 0.5
+
 
 class DynamoDBClient:
     """Client for interacting with the architecture hub DynamoDB table."""
@@ -130,9 +142,14 @@ class DynamoDBClient:
                 "repository_name": repository_name,
                 "repository_url": repository_url,
                 "analysis_timestamp": current_timestamp,
+                "analysis_timestamp_iso": datetime.fromtimestamp(
+                    current_timestamp, tz=UTC
+                ).isoformat(),
                 "analysis_type": analysis_type,
                 "latest_commit": latest_commit,
                 "branch_name": branch_name,
+                # Consecutive saves that found this state unchanged (see *_if_changed)
+                "stable_streak": 0,
                 "created_at": datetime.now(UTC).isoformat(),
                 "updated_at": datetime.now(UTC).isoformat(),
             }
@@ -140,10 +157,13 @@ class DynamoDBClient:
             # Add analysis data if provided
             if analysis_data:
                 item["analysis_data"] = json.dumps(analysis_data)  # Store as JSON string
+                # Keep prompt metadata top-level so cache checks can project it
+                if "prompt_metadata" in analysis_data:
+                    item["prompt_metadata"] = analysis_data["prompt_metadata"]
 
             # Add TTL if specified
             if ttl_days:
-                ttl_timestamp = current_timestamp + (ttl_days * 24 * 60 * 60)
+                ttl_timestamp = current_timestamp + (ttl_days * SECONDS_PER_DAY)
                 item["ttl_timestamp"] = ttl_timestamp
 
             # Convert floats to Decimal for DynamoDB compatibility
@@ -164,6 +184,120 @@ class DynamoDBClient:
             logger.error("Error saving to DynamoDB: %s", e)
             raise
 
+    def save_investigation_metadata_if_changed(
+        self,
+        repository_name: str,
+        repository_url: str,
+        latest_commit: str,
+        branch_name: str,
+        analysis_type: str = "investigation",
+        analysis_data: dict[str, Any] | None = None,
+        ttl_days: int | None = 90,
+    ) -> dict[str, Any]:
+        """
+        Save investigation metadata unless the latest row already records the same state.
+
+        Each save creates a new row under a fresh analysis_timestamp sort key, so a
+        ConditionExpression on the put cannot see the previous row (and a failed
+        condition is billed as a write anyway); instead the latest row is read with a
+        small projection and the put is skipped when commit, branch and prompt
+        metadata all match. The new analysis_data is then not stored: the existing
+        row keeps the summary it was written with.
+
+        A skipped save writes nothing unless the existing row is close to expiring,
+        in which case its stable_streak is bumped and its TTL extended via
+        adaptive_ttl_days (see STABLE_ROW_REFRESH_FRACTION).
+
+        Args:
+            Same as save_investigation_metadata
+
+        Returns:
+            The saved item, or the existing projected item with "unchanged": True
+        """
+        prompt_metadata = (analysis_data or {}).get("prompt_metadata")
+        latest = self.get_latest_investigation_projection(
+            repository_name,
+            [
+                "latest_commit",
+                "branch_name",
+                "prompt_metadata",
+                "analysis_timestamp",
+                "stable_streak",
+                "ttl_timestamp",
+            ],
+        )
+
+        if (
+            latest
+            and latest.get("latest_commit") == latest_commit
+            and latest.get("branch_name") == branch_name
+            and latest.get("prompt_metadata") == prompt_metadata
+        ):
+            stable_streak = int(latest.get("stable_streak", 0))
+            if self._stable_row_needs_refresh(latest.get("ttl_timestamp"), ttl_days, stable_streak):
+                stable_streak += 1
+                self._touch_stable_investigation(
+                    repository_name, int(latest["analysis_timestamp"]), stable_streak, ttl_days
+                )
+            logger.info(
+                "Investigation metadata for %s unchanged (commit: %s, stable streak: %s), "
+                "skipping write",
+                repository_name,
+                latest_commit[:8],
+                stable_streak,
+            )
+            return {**latest, "stable_streak": stable_streak, "unchanged": True}
+
+        return self.save_investigation_metadata(
+            repository_name=repository_name,
+            repository_url=repository_url,
+            latest_commit=latest_commit,
+            branch_name=branch_name,
+            analysis_type=analysis_type,
+            analysis_data=analysis_data,
+            ttl_days=ttl_days,
+        )
+
+    @staticmethod
+    def _stable_row_needs_refresh(
+        ttl_timestamp: float | None, ttl_days: int | None, stable_streak: int
+    ) -> bool:
+        """Whether an unchanged row's TTL is running out relative to its next widened TTL."""
+        if not ttl_days:
+            return False
+        if ttl_timestamp is None:
+            return True
+        widened_seconds = adaptive_ttl_days(ttl_days, stable_streak + 1) * SECONDS_PER_DAY
+        remaining_seconds = ttl_timestamp - datetime.now(UTC).timestamp()
+        return remaining_seconds < widened_seconds * STABLE_ROW_REFRESH_FRACTION
+
+    def _touch_stable_investigation(
+        self,
+        repository_name: str,
+        analysis_timestamp: int,
+        stable_streak: int,
+        ttl_days: int | None,
+    ) -> None:
+        """Record another unchanged save on an existing row and extend its TTL."""
+        now = datetime.now(UTC)
+        update_expression = "SET stable_streak = :streak, updated_at = :updated"
+        values: dict[str, Any] = {":streak": stable_streak, ":updated": now.isoformat()}
+
+        effective_ttl_days = adaptive_ttl_days(ttl_days, stable_streak) if ttl_days else None
+        if effective_ttl_days:
+            update_expression += ", ttl_timestamp = :ttl"
+            values[":ttl"] = int(now.timestamp()) + effective_ttl_days * SECONDS_PER_DAY
+
+        try:
+            self.table.update_item(
+                Key={"repository_name": repository_name, "analysis_timestamp": analysis_timestamp},
+                UpdateExpression=update_expression,
+                ExpressionAttributeValues=values,
+            )
+        except ClientError as e:
+            logger.error("Error updating DynamoDB: %s", e)
+            raise
+
     def get_latest_investigation(self, repository_name: str) -> dict[str, Any] | None:
         """
         Get the latest investigation metadata for a repository.
@@ -198,6 +332,45 @@ class DynamoDBClient:
             logger.error("Error reading from DynamoDB: %s", e)
             raise
 
+    def get_latest_investigation_projection(
+        self, repository_name: str, attributes: list[str]
+    ) -> dict[str, Any] | None:
+        """
+        Get only the given attributes of the latest investigation for a repository.
+
+        Uses a ProjectionExpression so large analysis_data payloads are not read
+        when a caller only needs a few fields (e.g. commit and branch).
+
+        Args:
+            repository_name: Name of the repository
+            attributes: Top-level attribute names to return
+
+        Returns:
+            The projected investigation metadata or None if not found
+        """
+        try:
+            # Attribute names go through placeholders to avoid reserved-word clashes
+            names = {f"#a{i}": name for i, name in enumerate(attributes)}
+            response = self.table.query(
+                KeyConditionExpression=Key("repository_name").eq(repository_name),
+                ProjectionExpression=", ".join(names),
+                ExpressionAttributeNames=names,
+                ScanIndexForward=False,  # Sort descending by range key (timestamp)
+                Limit=1,
+            )
+
+            items = response.get("Items", [])
+
+            if items:
+                converted_item = self._convert_decimal_to_float(items[0])
+                return converted_item if isinstance(converted_item, dict) else None
+
+            return None
+
+        except ClientError as e:
+            logger.error("Error reading from DynamoDB: %s", e)
+            raise
+
     def get_latest_analysis(
         self, repository_name: str, analysis_type: str | None = None
     ) -> dict[str, Any] | None:
@@ -736,66 +909,9 @@ class DynamoDBClient:
             Dictionary with save status and reference key
         """
         try:
-            # Generate timestamps
-            current_timestamp = int(datetime.now(UTC).timestamp())
-            ttl_timestamp = current_timestamp + (ttl_minutes * 60)
-
-            # Check if result needs compression
-            import base64
-            import gzip
-
-            result_size = len(result_content.encode("utf-8"))
-
-            # If result is large (> 300KB), compress it
-            if result_size > 300 * 1024:  # 300KB threshold
-                logger.info(
-                    "Large result detected (%s bytes), compressing before saving...", result_size
-                )
-
-                # Compress the result
-                compressed_data = gzip.compress(result_content.encode("utf-8"))
-                compressed_b64 = base64.b64encode(compressed_data).decode("utf-8")
-                compressed_size = len(compressed_b64)
-
-                ratio = compressed_size / result_size
-                logger.info(
-                    "Compressed result from %s to %s bytes (ratio: %.2f%%)",
-                    result_size,
-                    compressed_size,
-                    ratio * 100,
-                )
-
-                # Save compressed result
-                item = {
-                    "repository_name": f"_result_{reference_key}",
-                    "analysis_timestamp": current_timestamp,
-                    "analysis_type": "analysis_result",
-                    "reference_key": reference_key,
-                    "compressed_result": compressed_b64,
-                    "is_compressed": True,
-                    "original_size": result_size,
-                    "compressed_size": compressed_size,
-                    "ttl_timestamp": ttl_timestamp,
-                    "created_at": datetime.now(UTC).isoformat(),
-                }
-            else:
-                # Result is small enough, save as-is
-                item = {
-                    "repository_name": f"_result_{reference_key}",
-                    "analysis_timestamp": current_timestamp,
-                    "analysis_type": "analysis_result",
-                    "reference_key": reference_key,
-                    "result_content": result_content,
-                    "is_compressed": False,
-                    "ttl_timestamp": ttl_timestamp,
-                    "created_at": datetime.now(UTC).isoformat(),
-                }
-
-            if step_name:
-                item["step_name"] = step_name
-
-            # Convert floats to Decimal for DynamoDB compatibility
-            item = self._convert_floats_to_decimal(item)
+            item = self._build_analysis_result_item(
+                reference_key, result_content, step_name, ttl_minutes
+            )
 
             # Save to DynamoDB
             self.table.put_item(Item=item)
@@ -812,6 +928,110 @@ class DynamoDBClient:
             logger.error("Error saving analysis result to DynamoDB: %s", e)
             raise
 
+    def save_analysis_results_many(
+        self, entries: list[dict[str, Any]], ttl_minutes: int = 60
+    ) -> list[dict[str, Any]]:
+        """
+        Save several analysis results with batched writes.
+
+        Uses the table's batch writer, which groups puts into BatchWriteItem
+        requests of up to 25 items and resends any unprocessed items.
+
+        Args:
+            entries: Dictionaries with reference_key, result_content and an optional
+                step_name, as accepted by save_analysis_result
+            ttl_minutes: TTL in minutes applied to every result (default 60 minutes)
+
+        Returns:
+            List of save status dictionaries, one per entry and in the same order
+        """
+        try:
+            items = [
+                self._build_analysis_result_item(
+                    entry["reference_key"],
+                    entry["result_content"],
+                    entry.get("step_name"),
+                    ttl_minutes,
+                )
+                for entry in entries
+            ]
+
+            # Repeated keys would make BatchWriteItem reject the whole request
+            with self.table.batch_writer(
+                overwrite_by_pkeys=["repository_name", "analysis_timestamp"]
+            ) as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+
+            logger.info("Saved %s analysis results in batch", len(items))
+            return [
+                {
+                    "status": "success",
+                    "result_key": item["reference_key"],
+                    "ttl_minutes": ttl_minutes,
+                    "is_compressed": item.get("is_compressed", False),
+                }
+                for item in items
+            ]
+
+        except ClientError as e:
+            logger.error("Error saving analysis results to DynamoDB: %s", e)
+            raise
+
+    def _build_analysis_result_item(
+        self, reference_key: str, result_content: str, step_name: str | None, ttl_minutes: int
+    ) -> dict[str, Any]:
+        """Build the DynamoDB item for an analysis result, compressing large results."""
+        # Generate timestamps
+        current_timestamp = int(datetime.now(UTC).timestamp())
+        ttl_timestamp = current_timestamp + (ttl_minutes * 60)
+
+        item = {
+            "repository_name": f"_result_{reference_key}",
+            "analysis_timestamp": current_timestamp,
+            "analysis_type": "analysis_result",
+            "reference_key": reference_key,
+            "is_compressed": False,
+            "ttl_timestamp": ttl_timestamp,
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+
+        result_bytes = result_content.encode("utf-8")
+        result_size = len(result_bytes)
+        compressed_b64 = None
+
+        # Compress anything beyond a few KB; LLM output text shrinks several-fold
+        if result_size > RESULT_COMPRESSION_THRESHOLD_BYTES:
+            import base64
+            import gzip
+
+            compressed_data = gzip.compress(result_bytes, compresslevel=RESULT_COMPRESSION_LEVEL)
+            compressed_b64 = base64.b64encode(compressed_data).decode("utf-8")
+            # base64 adds a third; keep the plain text when compression doesn't pay for it
+            if len(compressed_b64) >= result_size:
+                compressed_b64 = None
+
+        if compressed_b64 is not None:
+            compressed_size = len(compressed_b64)
+            logger.debug(
+                "Compressed result from %s to %s bytes (ratio: %.2f%%)",
+                result_size,
+                compressed_size,
+                compressed_size / result_size * 100,
+            )
+            item["compressed_result"] = compressed_b64
+            item["is_compressed"] = True
+            item["original_size"] = result_size
+            item["compressed_size"] = compressed_size
+        else:
+            item["result_content"] = result_content
+
+        if step_name:
+            item["step_name"] = step_name
+
+        # Convert floats to Decimal for DynamoDB compatibility
+        return self._convert_floats_to_decimal(item)
+
     def get_analysis_result(self, reference_key: str) -> str | None:
         """
         Retrieve analysis result from DynamoDB using reference key.
@@ -7,14 +7,51 @@ allowing different implementations (DynamoDB, file-based, etc.) for different en
 
 import json
 import logging
+import operator
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
+try:
+    # orjson encodes and parses several times faster when it is installed
+    import orjson
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Fields serialized by to_dict, in output order, and a single getter that reads them all
+_DICT_FIELDS = (
+    "repo_name",
+    "step_name",
+    "data_reference_key",
+    "context_reference_keys",
+    "result_reference_key",
+    "prompt_version",
+)
+_get_dict_values = operator.attrgetter(*_DICT_FIELDS)
+
+# Upper bound on concurrent context cleanups; each one is a few storage round-trips
+CLEANUP_MAX_WORKERS = 16
+
+# Reference keys are shown truncated to this many characters in reprs
+REPR_KEY_PREFIX_CHARS = 20
+
+
+def _key_prefix(key: str | None) -> str | None:
+    """Return the leading part of a reference key for display, or None when unset."""
+    return key[:REPR_KEY_PREFIX_CHARS] if key else None
+
 
-@dataclass
+@dataclass(slots=True)
 class PromptContextBase(ABC):
     """
     Abstract base class for managing prompt, repository structure, context, and results.
@@ -28,6 +65,21 @@ class PromptContextBase(ABC):
     context_reference_keys: list[str] = field(default_factory=list)
     result_reference_key: str | None = None
     prompt_version: str = "1"
+    # Set view of context_reference_keys for O(1) duplicate checks, built on first add
+    _keys_seen: set[str] | None = field(default=None, init=False, repr=False, compare=False)
+    # Last to_json output with the field values it was built from
+    _cached_json: tuple[tuple, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Intern the identifying strings; they are compared and used as keys per step."""
+        if isinstance(self.repo_name, str):
+            self.repo_name = sys.intern(self.repo_name)
+        if isinstance(self.step_name, str):
+            self.step_name = sys.intern(self.step_name)
+        if isinstance(self.prompt_version, str):
+            self.prompt_version = sys.intern(self.prompt_version)
 
     @classmethod
     def create_for_step(
@@ -93,9 +145,16 @@ class PromptContextBase(ABC):
         Args:
             reference_key: Reference key of a previous step's result
         """
-        if reference_key and reference_key not in self.context_reference_keys:
+        if not reference_key:
+            return
+        if self._keys_seen is None:
+            # Covers keys passed to the constructor or from_dict
+            self._keys_seen = set(self.context_reference_keys)
+        if reference_key not in self._keys_seen:
+            self._keys_seen.add(reference_key)
             self.context_reference_keys.append(reference_key)
-            logger.debug("Added context reference: %s", reference_key)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Added context reference: %s", reference_key)
 
     def add_context_from_steps(self, step_names: list[str], step_results: dict[str, str]):
         """
@@ -105,11 +164,16 @@ class PromptContextBase(ABC):
             step_names: List of step names to include as context
             step_results: Dictionary mapping step names to their result reference keys
         """
+        missing = []
         for step_name in step_names:
-            if step_name in step_results:
-                self.add_context_reference(step_results[step_name])
+            result_key = step_results.get(step_name)
+            if result_key is not None:
+                self.add_context_reference(result_key)
             else:
-                logger.warning("Step %s not found in results for context", step_name)
+                missing.append(step_name)
+
+        if missing:
+            logger.warning("Steps not found in results for context: %s", ", ".join(missing))
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -118,14 +182,7 @@ class PromptContextBase(ABC):
         Returns:
             Dictionary representation of the context
         """
-        return {
-            "repo_name": self.repo_name,
-            "step_name": self.step_name,
-            "data_reference_key": self.data_reference_key,
-            "context_reference_keys": self.context_reference_keys,
-            "result_reference_key": self.result_reference_key,
-            "prompt_version": self.prompt_version,
-        }
+        return dict(zip(_DICT_FIELDS, _get_dict_values(self), strict=True))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PromptContextBase":
@@ -155,10 +212,28 @@ class PromptContextBase(ABC):
         """
         Convert to JSON string for serialization.
 
+        The string is reused until a serialized field changes.
+
         Returns:
             JSON string representation
         """
-        return json.dumps(self.to_dict())
+        # Subclasses assign the reference keys directly, so compare values rather than
+        # tracking writes
+        snapshot = (
+            self.repo_name,
+            self.step_name,
+            self.data_reference_key,
+            tuple(self.context_reference_keys),
+            self.result_reference_key,
+            self.prompt_version,
+        )
+        cached = self._cached_json
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+
+        json_str = _json_dumps(self.to_dict())
+        self._cached_json = (snapshot, json_str)
+        return json_str
 
     @classmethod
     def from_json(cls, json_str: str) -> "PromptContextBase":
@@ -171,23 +246,27 @@ class PromptContextBase(ABC):
         Returns:
             PromptContext instance
         """
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json_loads(json_str))
 
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
             f"{self.__class__.__name__}(repo={self.repo_name}, step={self.step_name}, "
-            f"data_key={self.data_reference_key[:20] if self.data_reference_key else None}..., "
+            f"data_key={_key_prefix(self.data_reference_key)}..., "
             f"context_keys={len(self.context_reference_keys)}, "
-            f"result_key={self.result_reference_key[:20] if self.result_reference_key else None}...)"
+            f"result_key={_key_prefix(self.result_reference_key)}...)"
         )
 
 
 class PromptContextManagerBase(ABC):
     """
     Abstract base class for managing multiple PromptContexts across analysis steps.
+
+    Subclasses should declare __slots__ for any attributes they add.
     """
 
+    __slots__ = ("contexts", "repo_name", "step_results")
+
     def __init__(self, repo_name: str):
         """
         Initialize the manager for a repository.
@@ -232,8 +311,9 @@ class PromptContextManagerBase(ABC):
             step_name: Name of the completed step
             result_key: Reference key of the step's result
         """
-        self.step_results[step_name] = result_key
-        logger.info("Registered result for %s: %s", result_key, step_name)
+        self.step_results[sys.intern(step_name)] = result_key
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Registered result for %s: %s", step_name, result_key)
 
     def get_all_result_keys(self) -> list[str]:
         """
@@ -245,7 +325,21 @@ class PromptContextManagerBase(ABC):
         return list(self.step_results.values())
 
     def cleanup_all(self):
-        """Clean up all contexts and their associated data."""
-        for context in self.contexts.values():
-            context.cleanup()
+        """
+        Clean up all contexts and their associated data.
+
+        Contexts are cleaned up concurrently since each cleanup waits on storage I/O.
+        """
+        contexts = list(self.contexts.values())
+        if len(contexts) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(CLEANUP_MAX_WORKERS, len(contexts)),
+                thread_name_prefix="context-cleanup",
+            ) as executor:
+                # Consume the results so a failing cleanup still raises here
+                for _ in executor.map(lambda context: context.cleanup(), contexts):
+                    pass
+        else:
+            for context in contexts:
+                context.cleanup()
         logger.info("Cleaned up %s contexts for %s", len(self.contexts), self.repo_name)
@@ -15,7 +15,7 @@ from .prompt_context_base import PromptContextBase, PromptContextManagerBase
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamoDBPromptContext(PromptContextBase):
     """
     DynamoDB implementation of PromptContext.
@@ -27,6 +27,8 @@ class DynamoDBPromptContext(PromptContextBase):
 
     def __post_init__(self):
         """Initialize DynamoDB client after dataclass initialization."""
+        # Zero-argument super() doesn't work in slots dataclasses
+        PromptContextBase.__post_init__(self)
         if self._dynamodb_client is None:
             self._dynamodb_client = get_dynamodb_client()
 
@@ -178,6 +180,8 @@ class DynamoDBPromptContextManager(PromptContextManagerBase):
     DynamoDB implementation of PromptContextManager.
     """
 
+    __slots__ = ()
+
     def create_context_for_step(
         self, step_name: str, context_config: list | None = None
     ) -> DynamoDBPromptContext:
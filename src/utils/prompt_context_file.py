@@ -11,16 +11,17 @@ import os
 import shutil
 import uuid
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from .prompt_context_base import PromptContextBase, PromptContextManagerBase
+from .prompt_context_base import PromptContextBase, PromptContextManagerBase, _json_loads
 from .storage_keys import KeyNameCreator
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileBasedPromptContext(PromptContextBase):
     """
     File-based implementation of PromptContext.
@@ -32,6 +33,8 @@ class FileBasedPromptContext(PromptContextBase):
 
     def __post_init__(self):
         """Initialize storage directory after dataclass initialization."""
+        # Zero-argument super() doesn't work in slots dataclasses
+        PromptContextBase.__post_init__(self)
         # Use the project's temp directory for local file storage
         # Check if PROMPT_CONTEXT_STORAGE_DIR is set, otherwise use project's temp folder
         base_dir_str: str | None = os.environ.get("PROMPT_CONTEXT_STORAGE_DIR")
@@ -194,6 +197,9 @@ class FileBasedPromptContext(PromptContextBase):
                 if self._storage_dir.exists() and not any(self._storage_dir.iterdir()):
                     self._storage_dir.rmdir()
                     logger.info("Removed empty directory: %s", self._storage_dir)
+            except FileNotFoundError:
+                # Another context sharing the directory removed it first
+                pass
             except Exception:
                 logger.warning("Failed to cleanup directory: {str(e)}")
 
@@ -203,6 +209,8 @@ class FileBasedPromptContextManager(PromptContextManagerBase):
     File-based implementation of PromptContextManager.
     """
 
+    __slots__ = ("_storage_dir",)
+
     def __init__(self, repo_name: str):
         """
         Initialize the manager for a repository.
@@ -281,7 +289,7 @@ class FileBasedPromptContextManager(PromptContextManagerBase):
                     else:
                         logger.warning("No content in file for step %s", step_name)
             else:
-                logger.warning("No result file found for step %s: %s", file_path, step_name)
+                logger.warning("No result file found for step %s: %s", step_name, file_path)
 
         return results
 
@@ -345,6 +353,22 @@ class FileBasedPromptContextManager(PromptContextManagerBase):
             logger.error("Failed to save analysis result: {str(e)}")
             return {"status": "error", "message": str(e)}
 
+    def save_analysis_results_many(
+        self, entries: list[dict[str, Any]], ttl_minutes: int = 60
+    ) -> list[dict[str, Any]]:
+        """
+        Save several analysis results to file storage.
+
+        Args:
+            entries: Dictionaries with reference_key, result_content and an optional
+                step_name, as accepted by save_analysis_result
+            ttl_minutes: TTL in minutes (ignored in file implementation)
+
+        Returns:
+            List of save status dictionaries, one per entry and in the same order
+        """
+        return [self.save_analysis_result(**entry, ttl_minutes=ttl_minutes) for entry in entries]
+
     def get_analysis_result(self, reference_key: str) -> str | None:
         """
         Retrieve analysis result from file storage.
@@ -409,13 +433,17 @@ class FileBasedPromptContextManager(PromptContextManagerBase):
             # Prepare metadata
             import time
 
+            analysis_timestamp = time.time()
             metadata = {
                 "repository_name": repository_name,
                 "repository_url": repository_url,
                 "latest_commit": latest_commit,
                 "branch_name": branch_name,
                 "analysis_type": analysis_type,
-                "analysis_timestamp": time.time(),
+                "analysis_timestamp": analysis_timestamp,
+                "analysis_timestamp_iso": datetime.fromtimestamp(
+                    analysis_timestamp, tz=UTC
+                ).isoformat(),
                 "analysis_data": analysis_data or {},
             }
 
@@ -453,13 +481,31 @@ class FileBasedPromptContextManager(PromptContextManagerBase):
             file_safe_key = metadata_key_obj.to_file_safe_key()
 
             file_path = self._storage_dir / f"{file_safe_key}.json"
-            if file_path.exists():
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                    return data if isinstance(data, dict) else None
-            else:
+            try:
+                # Parsed from bytes so orjson, when installed, decodes without a str copy
+                data = _json_loads(file_path.read_bytes())
+            except FileNotFoundError:
                 logger.debug("No investigation metadata found for: %s", repository_name)
                 return None
+            return data if isinstance(data, dict) else None
         except Exception:
             logger.error("Failed to retrieve investigation metadata: {str(e)}")
             return None
+
+    def get_latest_investigation_projection(
+        self, repository_name: str, attributes: list[str]
+    ) -> dict[str, Any] | None:
+        """
+        Get only the given attributes of the latest investigation for a repository.
+
+        Args:
+            repository_name: Name of the repository
+            attributes: Top-level attribute names to return
+
+        Returns:
+            The projected investigation metadata or None if not found
+        """
+        data = self.get_latest_investigation(repository_name)
+        if data is None:
+            return None
+        return {name: data[name] for name in attributes if name in data}
@@ -20,7 +20,7 @@ def validate_environment():
 
     # Import config to access its validation methods
     try:
-        from investigator.core.config import Config
+        from investigator.core.config import Config, parse_use_cli
     except ImportError as e:
         errors.append(f"Cannot import Config: {e}")
         return errors, warnings
@@ -41,7 +41,7 @@ def validate_environment():
         errors.append(f"Invalid max tokens: {e}")
 
     # Claude configuration - check for CLI mode or API key
-    use_claude_cli = os.getenv("USE_CLAUDE_CLI", "false").lower() == "true"
+    use_claude_cli = parse_use_cli(os.getenv("USE_CLAUDE_CLI"))
     if use_claude_cli:
         logger.info("  ✓ Claude CLI mode enabled (subscription-based)")
         # Validate Claude CLI is available
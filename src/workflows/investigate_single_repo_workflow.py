@@ -478,7 +478,7 @@ class InvestigateSingleRepoWorkflow:
 
         # Get statistics for logging
         stats = results_collector.get_statistics()
-        logger.info("Results collection statistics: %s", stats)
+        logger.info("Results collection statistics: %s", dict(stats))
 
         # Note: Cleanup is handled automatically by TTL in DynamoDB
         # We could add explicit cleanup here if needed
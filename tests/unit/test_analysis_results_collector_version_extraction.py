@@ -63,6 +63,18 @@ class AnalysisResultsCollectorVersionExtractionTests(unittest.TestCase):
         
         # Assert
         self.assertEqual(version, "invalid")
+    
+    def test_extract_prompt_version_with_empty_version_value_raises_error(self):
+        """Given a prompt with an empty version= header, when extracting version, then raises ValueError."""
+        # Arrange
+        prompt_content = """version=  
+## Repository Structure"""
+        
+        # Act & Assert
+        with self.assertRaises(ValueError) as context:
+            AnalysisResultsCollector.extract_prompt_version(prompt_content)
+        
+        self.assertIn("Invalid version format", str(context.exception))
 
 
 if __name__ == "__main__":
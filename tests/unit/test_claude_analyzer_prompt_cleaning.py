@@ -5,14 +5,16 @@ These tests verify that version lines and metadata are properly removed
 from prompts before sending to Claude.
 """
 
+import asyncio
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import sys
 import os
 
 # Add the src directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from investigator.core import claude_analyzer
 from investigator.core.claude_analyzer import ClaudeAnalyzer
 
 
@@ -143,7 +145,8 @@ Analyze this repository: {repo_structure}"""
         # Verify that the prompt sent to Claude doesn't contain version
         mock_client.messages.create.assert_called_once()
         call_args = mock_client.messages.create.call_args
-        sent_prompt = call_args[1]["messages"][0]["content"]
+        system_text = "".join(block["text"] for block in call_args[1].get("system", []))
+        sent_prompt = system_text + call_args[1]["messages"][0]["content"]
         
         # Version line should be removed
         self.assertNotIn("version=2", sent_prompt)
@@ -152,6 +155,100 @@ Analyze this repository: {repo_structure}"""
         self.assertIn("Analyze this repository:", sent_prompt)
         self.assertIn("repo structure here", sent_prompt)
     
+    def test_analyze_with_context_async_awaits_async_client(self):
+        """Test that the async variant sends the same cleaned request through AsyncAnthropic."""
+        analyzer = ClaudeAnalyzer("test-key", self.mock_logger)
+        async_client = Mock()
+        async_client.messages.create = AsyncMock(
+            return_value=Mock(content=[Mock(text="Async analysis")])
+        )
+        analyzer._async_client = async_client
+        
+        result = asyncio.run(
+            analyzer.analyze_with_context_async("version=2\nAnalyze: {repo_structure}", "src/")
+        )
+        
+        self.assertEqual(result, "Async analysis")
+        call_kwargs = async_client.messages.create.await_args[1]
+        self.assertNotIn("version=2", call_kwargs["system"][0]["text"])
+        self.assertIn("src/", call_kwargs["messages"][0]["content"])
+    
+    def test_shared_async_http_client_is_closed_when_the_loop_shuts_down(self):
+        """Test that each event loop's shared HTTP pool is closed by asyncio.run()."""
+        async def get_client():
+            client = claude_analyzer._get_shared_async_http_client()
+            self.assertIs(client, claude_analyzer._get_shared_async_http_client())
+            return client
+        
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertTrue(second.is_closed)
+        self.assertEqual(claude_analyzer._shared_async_http_clients, {})
+    
+    def test_analyze_with_context_reuses_cached_analysis_for_identical_request(self):
+        """Test that an identical request is answered from the response cache."""
+        analyzer = ClaudeAnalyzer("test-key", self.mock_logger)
+        analyzer.client = Mock()
+        analyzer.client.messages.create.return_value = Mock(content=[Mock(text="Cached")])
+        prompt = "version=2\nAnalyze: {repo_structure}"
+        
+        first = analyzer.analyze_with_context(prompt, "src/")
+        second = analyzer.analyze_with_context(prompt, "src/")
+        analyzer.analyze_with_context(prompt, "lib/")
+        
+        self.assertEqual(first, "Cached")
+        self.assertEqual(second, "Cached")
+        self.assertEqual(analyzer.client.messages.create.call_count, 2)
+    
+    def test_analyze_with_context_logs_prompt_cache_hit_ratio(self):
+        """Test that prompt cache usage from the response is logged as a hit ratio."""
+        analyzer = ClaudeAnalyzer("test-key", self.mock_logger)
+        analyzer.client = Mock()
+        usage = Mock(input_tokens=100, cache_read_input_tokens=300, cache_creation_input_tokens=0)
+        analyzer.client.messages.create.return_value = Mock(
+            content=[Mock(text="Analysis")], usage=usage
+        )
+        
+        analyzer.analyze_with_context("version=2\nAnalyze: {repo_structure}", "src/")
+        
+        cache_logs = [
+            call for call in self.mock_logger.info.call_args_list
+            if call.kwargs.get("extra", {}).get("event") == "claude_cache"
+        ]
+        self.assertEqual(len(cache_logs), 1)
+        self.assertEqual(cache_logs[0].kwargs["extra"]["hit_ratio"], 0.75)
+        self.assertEqual(cache_logs[0].kwargs["extra"]["read"], 300)
+    
+    def test_analyze_with_context_ignores_whitespace_only_differences_in_cache(self):
+        """Test that trailing spaces and blank lines do not defeat the response cache."""
+        analyzer = ClaudeAnalyzer("test-key", self.mock_logger)
+        analyzer.client = Mock()
+        analyzer.client.messages.create.return_value = Mock(content=[Mock(text="Cached")])
+        prompt = "version=2\nAnalyze: {repo_structure}"
+        
+        analyzer.analyze_with_context(prompt, "src/\n  main.py")
+        analyzer.analyze_with_context(prompt, "src/  \n\n  main.py\n")
+        analyzer.analyze_with_context(prompt, "src/\nmain.py")
+        
+        self.assertEqual(analyzer.client.messages.create.call_count, 2)
+    
+    def test_build_prompt_parts_puts_static_instructions_first(self):
+        """Test that the template becomes a cacheable system prompt and data goes last."""
+        template = "Instructions\n{previous_context}Structure:\n{repo_structure}\nMore rules"
+        
+        system_blocks, user_message = self.analyzer.build_prompt_parts(template, "src/", "\n\nCTX")
+        
+        self.assertEqual(len(system_blocks), 1)
+        self.assertEqual(system_blocks[0]["cache_control"], {"type": "ephemeral"})
+        self.assertIn("Instructions", system_blocks[0]["text"])
+        self.assertIn("More rules", system_blocks[0]["text"])
+        self.assertNotIn("{repo_structure}", system_blocks[0]["text"])
+        self.assertNotIn("{previous_context}", system_blocks[0]["text"])
+        self.assertTrue(user_message.endswith("src/\n\nCTX"))
+    
     def test_clean_prompt_logs_cleaning_info(self):
         """Test that prompt cleaning logs appropriate debug information."""
         prompt = """version=3
@@ -6,214 +6,234 @@ instead of API keys.
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import sys
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 import os
 import subprocess
 
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import pytest
 
-from investigator.core.claude_analyzer import ClaudeAnalyzer, ClaudeCLIError
+from investigator.core import claude_cli_adapter
+from investigator.core.claude_cli_adapter import ClaudeCLIClient
+from investigator.core.claude_analyzer import (
+    ClaudeAnalyzer,
+    ClaudeCLIError,
+    _get_shared_http_client,
+)
 from investigator.core.config import Config
 
 
+def _make_fake_run(stdout=b"", returncode=0, stderr=b"", error=None):
+    """
+    Build a subprocess.run stand-in that records its calls.
+
+    Returns:
+        Tuple of (fake_run, captured) where captured collects (args, kwargs) per call;
+        output is bytes by default, as subprocess.run returns without text=True
+    """
+    captured = []
+
+    def fake_run(*args, **kwargs):
+        captured.append((args, kwargs))
+        if error is not None:
+            raise error
+        return SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+
+    return fake_run, captured
+
+
 class TestClaudeCLIIntegration(unittest.TestCase):
     """Test suite for Claude CLI integration functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Build one CLI-mode analyzer for the tests that only exercise its calls."""
+        # Never spawn the real binary or leave its path in the process-wide verified cache
+        version_run, _ = _make_fake_run(stdout="1.0.0 (Claude Code)")
+        with ExitStack() as stack:
+            stack.enter_context(patch.object(Config, 'USE_CLAUDE_CLI', True))
+            stack.enter_context(patch('shutil.which', return_value="/usr/local/bin/claude"))
+            stack.enter_context(patch('os.access', return_value=True))
+            stack.enter_context(patch('subprocess.run', version_run))
+            stack.enter_context(patch.dict(claude_cli_adapter._VERIFIED_CLI_PATHS, clear=True))
+            cls.cli_analyzer = ClaudeAnalyzer(api_key=None, logger=Mock())
+
+    @pytest.fixture(autouse=True)
+    def _cli_environment(self, monkeypatch):
+        """Put every test in CLI mode with the claude binary found and subprocess.run faked."""
         self.mock_logger = Mock()
+        self.mock_which = Mock(return_value="/usr/local/bin/claude")
+        self.monkeypatch = monkeypatch
+        monkeypatch.setattr(Config, 'USE_CLAUDE_CLI', True)
+        monkeypatch.setattr('shutil.which', self.mock_which)
+        monkeypatch.setattr('os.access', Mock(return_value=True))
+        # Each test starts with an unverified CLI, so detection really consults shutil.which
+        monkeypatch.setattr(claude_cli_adapter, '_VERIFIED_CLI_PATHS', {})
+        self.use_fake_run()
+
+    def use_fake_run(self, **kwargs):
+        """Install a fake subprocess.run for this test and return its captured calls."""
+        fake_run, captured = _make_fake_run(**kwargs)
+        self.monkeypatch.setattr('subprocess.run', fake_run)
+        return captured
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', False)
     def test_api_mode_requires_api_key(self):
         """Test that API mode requires an API key."""
+        self.monkeypatch.setattr(Config, 'USE_CLAUDE_CLI', False)
+
         with self.assertRaises(ValueError) as context:
             ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
 
         self.assertIn("ANTHROPIC_API_KEY required", str(context.exception))
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', False)
     @patch('investigator.core.claude_analyzer.Anthropic')
     def test_api_mode_initializes_client(self, mock_anthropic):
         """Test that API mode initializes the Anthropic client."""
+        self.monkeypatch.setattr(Config, 'USE_CLAUDE_CLI', False)
+
         analyzer = ClaudeAnalyzer(api_key="test-key", logger=self.mock_logger)
 
         self.assertFalse(analyzer.use_cli)
-        mock_anthropic.assert_called_once_with(api_key="test-key")
+        mock_anthropic.assert_called_once_with(
+            api_key="test-key", http_client=_get_shared_http_client()
+        )
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', True)
-    @patch('shutil.which')
-    def test_cli_mode_validates_cli_present(self, mock_which):
+    def test_cli_mode_validates_cli_present(self):
         """Test that CLI mode validates Claude CLI is installed."""
-        mock_which.return_value = "/usr/local/bin/claude"
+        captured = self.use_fake_run(stdout="1.0.0 (Claude Code)")
 
         analyzer = ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
 
         self.assertTrue(analyzer.use_cli)
-        self.assertIsNone(analyzer.client)
-        mock_which.assert_called_with("claude")
+        self.assertIsInstance(analyzer.client, ClaudeCLIClient)
+        self.mock_which.assert_called_with("claude")
+        self.assertEqual(captured[0][0][0], ["/usr/local/bin/claude", "--version"])
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', True)
-    @patch('shutil.which')
-    def test_cli_mode_raises_error_when_cli_missing(self, mock_which):
+    def test_cli_mode_raises_error_when_cli_missing(self):
         """Test that CLI mode raises error when Claude CLI is not installed."""
-        mock_which.return_value = None
+        self.mock_which.return_value = None
 
-        with self.assertRaises(ClaudeCLIError) as context:
+        with self.assertRaises(RuntimeError) as context:
             ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
 
-        self.assertIn("Claude CLI not found", str(context.exception))
+        self.assertIn("Claude CLI binary not found", str(context.exception))
         self.assertIn("npm install", str(context.exception))
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', True)
-    @patch.object(Config, 'CLAUDE_CLI_TIMEOUT', 300)
-    @patch('shutil.which')
-    @patch('subprocess.run')
-    def test_call_claude_cli_success(self, mock_run, mock_which):
+    def test_create_message_success(self):
         """Test successful Claude CLI invocation."""
-        mock_which.return_value = "/usr/local/bin/claude"
-
         # Mock successful CLI response
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="This is Claude's response to your prompt.",
-            stderr=""
-        )
+        captured = self.use_fake_run(stdout=b"This is Claude's response to your prompt.")
 
-        analyzer = ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
-        result = analyzer._call_claude_cli(
-            prompt="Hello Claude",
+        response = self.cli_analyzer.client.messages.create(
             model="claude-opus-4-5-20251101",
-            max_tokens=1000
+            max_tokens=1000,
+            messages=[{"role": "user", "content": "Hello Claude"}],
         )
 
-        self.assertEqual(result, "This is Claude's response to your prompt.")
+        self.assertEqual(response.content[0].text, "This is Claude's response to your prompt.")
 
-        # Verify subprocess was called correctly
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        self.assertIn("claude", call_args[0][0])
-        self.assertEqual(call_args[1]["input"], "Hello Claude")
-        self.assertEqual(call_args[1]["timeout"], 300)
+        # Verify subprocess was called correctly: prompt piped as bytes on stdin
+        self.assertEqual(len(captured), 1)
+        args, kwargs = captured[0]
+        self.assertEqual(args[0][0], "/usr/local/bin/claude")
+        self.assertEqual(kwargs["input"], b"Hello Claude")
+        self.assertEqual(kwargs["timeout"], claude_cli_adapter.CLI_REQUEST_TIMEOUT_SECONDS)
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', True)
-    @patch('shutil.which')
-    @patch('subprocess.run')
-    def test_call_claude_cli_authentication_error(self, mock_run, mock_which):
+    def test_create_message_authentication_error(self):
         """Test Claude CLI authentication error handling."""
-        mock_which.return_value = "/usr/local/bin/claude"
-
         # Mock authentication error
-        mock_run.return_value = Mock(
+        self.use_fake_run(
             returncode=1,
-            stdout="",
-            stderr="Error: Not authenticated. Please run 'claude login'"
+            stderr=b"Error: Not authenticated. Please run 'claude login'"
         )
 
-        analyzer = ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
-
-        with self.assertRaises(ClaudeCLIError) as context:
-            analyzer._call_claude_cli("Hello", "claude-opus-4-5-20251101", 1000)
+        with self.assertRaises(Exception) as context:
+            self.cli_analyzer.client.messages.create(
+                model="claude-opus-4-5-20251101",
+                max_tokens=1000,
+                messages=[{"role": "user", "content": "Hello"}],
+            )
 
+        self.assertIn("exit code 1", str(context.exception))
         self.assertIn("not authenticated", str(context.exception).lower())
         self.assertIn("claude login", str(context.exception))
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', True)
-    @patch.object(Config, 'CLAUDE_CLI_TIMEOUT', 1)
-    @patch('shutil.which')
-    @patch('subprocess.run')
-    def test_call_claude_cli_timeout(self, mock_run, mock_which):
+    def test_create_message_timeout(self):
         """Test Claude CLI timeout handling."""
-        mock_which.return_value = "/usr/local/bin/claude"
-
         # Mock timeout
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="claude", timeout=1)
-
-        analyzer = ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
+        self.use_fake_run(error=subprocess.TimeoutExpired(cmd="claude", timeout=1))
 
-        with self.assertRaises(ClaudeCLIError) as context:
-            analyzer._call_claude_cli("Hello", "claude-opus-4-5-20251101", 1000)
+        with self.assertRaises(Exception) as context:
+            self.cli_analyzer.client.messages.create(
+                model="claude-opus-4-5-20251101",
+                max_tokens=1000,
+                messages=[{"role": "user", "content": "Hello"}],
+            )
 
         self.assertIn("timed out", str(context.exception))
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', True)
-    @patch('shutil.which')
-    def test_model_mapping(self, mock_which):
-        """Test model name mapping from API to CLI format."""
-        mock_which.return_value = "/usr/local/bin/claude"
+    def test_model_passes_through_to_cli(self):
+        """Test that API model names are passed to the CLI unchanged."""
+        models = ("claude-opus-4-5-20251101", "claude-sonnet-4-5-20250929", "unknown-model")
 
-        analyzer = ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
+        for model in models:
+            with self.subTest(model=model):
+                captured = self.use_fake_run(stdout=b"Response")
 
-        # Test known model mappings
-        self.assertEqual(
-            analyzer._map_model_to_cli("claude-opus-4-5-20251101"),
-            "claude-opus-4-5-20251101"
-        )
-        self.assertEqual(
-            analyzer._map_model_to_cli("claude-sonnet-4-5-20250929"),
-            "claude-sonnet-4-5-20250929"
-        )
+                self.cli_analyzer.client.messages.create(
+                    model=model,
+                    max_tokens=1000,
+                    messages=[{"role": "user", "content": "Hello"}],
+                )
 
-        # Test unknown model (should pass through)
-        self.assertEqual(
-            analyzer._map_model_to_cli("unknown-model"),
-            "unknown-model"
-        )
+                argv = captured[0][0][0]
+                self.assertEqual(argv[argv.index("--model") + 1], model)
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', True)
-    @patch('shutil.which')
-    @patch('subprocess.run')
-    def test_analyze_with_context_uses_cli(self, mock_run, mock_which):
+    def test_analyze_with_context_uses_cli(self):
         """Test that analyze_with_context uses CLI when configured."""
-        mock_which.return_value = "/usr/local/bin/claude"
+        captured = self.use_fake_run(stdout=b"Analysis of the repository structure shows...")
 
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="Analysis of the repository structure shows...",
-            stderr=""
-        )
-
-        analyzer = ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
-
-        result = analyzer.analyze_with_context(
+        result = self.cli_analyzer.analyze_with_context(
             prompt_template="Analyze: {repo_structure}",
             repo_structure="src/\n  main.py\n  utils.py"
         )
 
         self.assertIn("Analysis", result)
-        mock_run.assert_called_once()
+        self.assertEqual(len(captured), 1)
+        # The template goes first as system text, then the structure as the user message
+        prompt = captured[0][1]["input"].decode("utf-8")
+        self.assertTrue(prompt.startswith("Analyze:"))
+        self.assertIn("## Repository Structure\n\nsrc/\n  main.py", prompt)
 
-    @patch.object(Config, 'USE_CLAUDE_CLI', True)
-    @patch('shutil.which')
-    @patch('subprocess.run')
-    def test_cli_args_include_correct_flags(self, mock_run, mock_which):
+    def test_cli_args_include_correct_flags(self):
         """Test that CLI invocation includes correct flags."""
-        mock_which.return_value = "/usr/local/bin/claude"
+        captured = self.use_fake_run(stdout=b"Response")
 
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="Response",
-            stderr=""
+        self.cli_analyzer.client.messages.create(
+            model="claude-opus-4-5-20251101",
+            max_tokens=2000,
+            messages=[{"role": "user", "content": "Test prompt"}],
         )
 
-        analyzer = ClaudeAnalyzer(api_key=None, logger=self.mock_logger)
-        analyzer._call_claude_cli("Test prompt", "claude-opus-4-5-20251101", 2000)
-
-        call_args = mock_run.call_args[0][0]
-
-        # Verify required flags are present
-        self.assertIn("--print", call_args)
-        self.assertIn("--model", call_args)
-        self.assertIn("--max-tokens", call_args)
-        self.assertIn("--output-format", call_args)
-
-        # Verify model and max-tokens values
-        model_idx = call_args.index("--model")
-        self.assertEqual(call_args[model_idx + 1], "claude-opus-4-5-20251101")
-
-        tokens_idx = call_args.index("--max-tokens")
-        self.assertEqual(call_args[tokens_idx + 1], "2000")
+        call_args = captured[0][0][0]
+        self.assertEqual(call_args[1], "prompt")
+        # Map each --flag to the argument after it in a single pass over argv
+        flags = {
+            arg: next_arg
+            for arg, next_arg in zip(call_args, [*call_args[1:], None])
+            if arg.startswith("--")
+        }
+
+        # Verify flags and their values
+        expected_values = (
+            ("--model", "claude-opus-4-5-20251101"),
+            ("--max-tokens", "2000"),
+            ("--format", "json"),
+        )
+        for flag, expected in expected_values:
+            with self.subTest(flag=flag):
+                self.assertEqual(flags.get(flag), expected)
 
 
 class TestClaudeCLIErrorHandling(unittest.TestCase):
@@ -249,7 +269,3 @@ class TestConfigCLISettings(unittest.TestCase):
         with patch.dict(os.environ, {}, clear=True):
             result = int(os.getenv("CLAUDE_CLI_TIMEOUT", "300"))
             self.assertEqual(result, 300)
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Unit tests for the DynamoDBClient investigation metadata writes.
+
+These tests run against a mocked table and check the keys and expressions
+the client sends to DynamoDB.
+"""
+
+import sys
+import unittest
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.cache_ttl import SECONDS_PER_DAY
+from utils.dynamodb_client import DynamoDBClient
+
+
+class TestSaveInvestigationMetadataIfChanged(unittest.TestCase):
+    """Test cases for skipping investigation metadata writes when nothing changed."""
+
+    def setUp(self):
+        """Set up a client backed by a mocked table."""
+        with patch("utils.dynamodb_client.boto3"):
+            self.client = DynamoDBClient(table_name="test-table")
+        self.table = Mock()
+        self.client.table = self.table
+
+        self.repo_name = "test-repo"
+        self.commit = "abc123def456789012345678901234567890abcd"
+        self.prompt_metadata = {"count": 1, "versions": {"overview": "1"}}
+
+    def _latest_row(self, ttl_days_left, stable_streak=0):
+        now = int(datetime.now(UTC).timestamp())
+        return {
+            "latest_commit": self.commit,
+            "branch_name": "main",
+            "prompt_metadata": self.prompt_metadata,
+            "analysis_timestamp": now - 60,
+            "stable_streak": stable_streak,
+            "ttl_timestamp": now + ttl_days_left * SECONDS_PER_DAY,
+        }
+
+    def _save(self):
+        return self.client.save_investigation_metadata_if_changed(
+            repository_name=self.repo_name,
+            repository_url="https://github.com/test/test-repo",
+            latest_commit=self.commit,
+            branch_name="main",
+            analysis_data={"summary": "new", "prompt_metadata": self.prompt_metadata},
+            ttl_days=90,
+        )
+
+    def test_unchanged_save_with_fresh_ttl_should_not_write(self):
+        """Test that a no-op save on a row far from expiry issues no write at all."""
+        # Arrange: streak 4 is already at the 365 day cap, with nearly all of it left
+        self.table.query.return_value = {"Items": [self._latest_row(360, stable_streak=4)]}
+
+        # Act
+        result = self._save()
+
+        # Assert
+        self.assertTrue(result["unchanged"])
+        self.assertEqual(result["stable_streak"], 4)
+        self.table.put_item.assert_not_called()
+        self.table.update_item.assert_not_called()
+
+    def test_unchanged_save_near_expiry_should_extend_ttl_on_existing_row(self):
+        """Test that a no-op save on a row close to expiry updates only that row's streak and TTL."""
+        # Arrange
+        row = self._latest_row(10, stable_streak=1)
+        self.table.query.return_value = {"Items": [row]}
+
+        # Act
+        result = self._save()
+
+        # Assert
+        self.assertTrue(result["unchanged"])
+        self.assertEqual(result["stable_streak"], 2)
+        self.table.put_item.assert_not_called()
+        kwargs = self.table.update_item.call_args.kwargs
+        self.assertEqual(
+            kwargs["Key"],
+            {"repository_name": self.repo_name, "analysis_timestamp": row["analysis_timestamp"]},
+        )
+        self.assertEqual(
+            kwargs["UpdateExpression"],
+            "SET stable_streak = :streak, updated_at = :updated, ttl_timestamp = :ttl",
+        )
+        values = kwargs["ExpressionAttributeValues"]
+        self.assertEqual(values[":streak"], 2)
+        # 90 days doubled twice for a streak of 2
+        expected_ttl = int(datetime.now(UTC).timestamp()) + 360 * SECONDS_PER_DAY
+        self.assertAlmostEqual(values[":ttl"], expected_ttl, delta=5)
+
+    def test_changed_commit_should_put_a_new_row(self):
+        """Test that a save with a new commit writes a new row and leaves the old one alone."""
+        # Arrange
+        row = self._latest_row(10)
+        row["latest_commit"] = "0000000000000000000000000000000000000000"
+        self.table.query.return_value = {"Items": [row]}
+
+        # Act
+        result = self._save()
+
+        # Assert
+        self.assertNotIn("unchanged", result)
+        self.table.update_item.assert_not_called()
+        item = self.table.put_item.call_args.kwargs["Item"]
+        self.assertEqual(item["latest_commit"], self.commit)
+        self.assertEqual(item["stable_streak"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
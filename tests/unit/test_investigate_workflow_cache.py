@@ -352,6 +352,9 @@ class TestCacheActivityIntegration:
                         assert 'New commits detected' in result.reason
                         
                         # Case 3: Same commit, no changes
+                        # Storage changed behind the cache's back, so drop the memoized record
+                        from activities.investigation_cache import get_investigation_cache
+                        get_investigation_cache(mock_client).invalidate_last_investigation()
                         mock_client.get_latest_investigation.return_value = {
                             'latest_commit': 'new_commit_123',
                             'branch_name': 'main',
@@ -5,6 +5,7 @@ These tests verify the caching logic for determining when a repository
 needs investigation and managing investigation metadata storage.
 """
 
+import threading
 import unittest
 from unittest.mock import Mock, MagicMock, patch, call
 from datetime import datetime, timezone, timedelta
@@ -79,6 +80,111 @@ class TestInvestigationCache(unittest.TestCase):
         self.assertEqual(decision.branch_name, self.current_branch)
         self.assertIsNone(decision.last_investigation)
     
+    def test_check_needs_investigation_when_called_twice_should_reuse_memoized_lookup(self):
+        """Test that repeated checks for the same repo hit storage only once."""
+        # Arrange
+        self.mock_storage_client.get_latest_investigation.return_value = self.last_investigation
+        
+        # Act
+        first = self.cache.check_needs_investigation(self.repo_name, self.current_state)
+        second = self.cache.check_needs_investigation(self.repo_name, self.current_state)
+        
+        # Assert
+        self.assertFalse(first.needs_investigation)
+        self.assertFalse(second.needs_investigation)
+        self.mock_storage_client.get_latest_investigation.assert_called_once_with(self.repo_name)
+    
+    def test_save_investigation_metadata_should_invalidate_memoized_lookup(self):
+        """Test that saving metadata forces the next check to read from storage."""
+        # Arrange
+        self.mock_storage_client.get_latest_investigation.return_value = self.last_investigation
+        self.mock_storage_client.save_investigation_metadata.return_value = {'analysis_timestamp': 1}
+        self.cache.check_needs_investigation(self.repo_name, self.current_state)
+        
+        # Act
+        self.cache.save_investigation_metadata(
+            repo_name=self.repo_name,
+            repo_url=self.repo_url,
+            commit_sha=self.current_commit,
+            branch_name=self.current_branch
+        )
+        self.cache.check_needs_investigation(self.repo_name, self.current_state)
+        
+        # Assert
+        self.assertEqual(self.mock_storage_client.get_latest_investigation.call_count, 2)
+
+    def test_fetch_last_investigation_should_only_build_models_when_validating(self):
+        """Test that the hot path keeps the raw record and validation is opt-in."""
+        # Arrange
+        from src.activities.investigation_cache import InvestigationMetadata
+        self.last_investigation['prompt_metadata'] = {'count': 1, 'versions': {'overview': '2'}}
+        self.mock_storage_client.get_latest_investigation.return_value = self.last_investigation
+
+        # Act
+        raw = self.cache._fetch_last_investigation(self.repo_name, self.current_state)
+        self.cache.invalidate_last_investigation()
+        validated = self.cache._fetch_last_investigation(
+            self.repo_name, self.current_state, validate=True
+        )
+
+        # Assert
+        self.assertIs(raw, self.last_investigation)
+        self.assertIsInstance(validated, InvestigationMetadata)
+        self.assertEqual(validated.prompt_metadata.versions, {'overview': '2'})
+
+    def test_investigation_metadata_from_cache_should_round_trip_model_dump(self):
+        """Test that rebuilding a dumped record without validation yields an equal model."""
+        # Arrange
+        from src.activities.investigation_cache import InvestigationMetadata
+        self.last_investigation['prompt_metadata'] = {'count': 1, 'versions': {'overview': '2'}}
+        original = InvestigationMetadata(**self.last_investigation)
+
+        # Act
+        rebuilt = InvestigationMetadata.from_cache(original.model_dump())
+
+        # Assert
+        self.assertEqual(rebuilt, original)
+        self.assertEqual(rebuilt.prompt_metadata.versions, {'overview': '2'})
+
+    def test_fetch_last_investigation_when_prompt_version_blank_should_fall_back_to_raw(self):
+        """Test that nested prompt metadata is still validated when the record is parsed."""
+        # Arrange
+        self.last_investigation['prompt_metadata'] = {'count': 1, 'versions': {'overview': '  '}}
+        self.mock_storage_client.get_latest_investigation.return_value = self.last_investigation
+
+        # Act
+        result = self.cache._fetch_last_investigation(
+            self.repo_name, self.current_state, validate=True
+        )
+
+        # Assert
+        self.assertIs(result, self.last_investigation)
+
+    def test_check_needs_investigation_when_client_supports_projection_should_request_checked_fields(self):
+        """Test that clients with a projected read are not asked for the full item."""
+        # Arrange
+        class ProjectingStorage:
+            def __init__(self, record):
+                self.record = record
+                self.requested = None
+
+            def get_latest_investigation_projection(self, repository_name, attributes):
+                self.requested = (repository_name, attributes)
+                return dict(self.record)
+
+        storage = ProjectingStorage(self.last_investigation)
+        cache = InvestigationCache(storage)
+
+        # Act
+        decision = cache.check_needs_investigation(self.repo_name, self.current_state)
+
+        # Assert
+        self.assertFalse(decision.needs_investigation)
+        self.assertEqual(storage.requested[0], self.repo_name)
+        self.assertIn('latest_commit', storage.requested[1])
+        self.assertIn('branch_name', storage.requested[1])
+        self.assertNotIn('analysis_data', storage.requested[1])
+
     def test_check_needs_investigation_when_uncommitted_changes_should_return_needs_investigation(self):
         """Test that uncommitted changes do NOT trigger investigation (feature disabled)."""
         # Arrange
@@ -96,7 +202,21 @@ class TestInvestigationCache(unittest.TestCase):
         self.assertFalse(decision.needs_investigation)
         self.assertIn("No changes since last investigation", decision.reason)
         self.assertEqual(decision.last_investigation, self.last_investigation)
-    
+
+    def test_check_needs_investigation_when_iso_timestamp_stored_should_use_it_verbatim(self):
+        """Test that a stored ISO timestamp is reported without reformatting."""
+        # Arrange
+        stored_iso = "2024-01-02T03:04:05+00:00"
+        self.last_investigation['analysis_timestamp_iso'] = stored_iso
+        self.mock_storage_client.get_latest_investigation.return_value = self.last_investigation
+
+        # Act
+        decision = self.cache.check_needs_investigation(self.repo_name, self.current_state)
+
+        # Assert
+        self.assertFalse(decision.needs_investigation)
+        self.assertTrue(decision.reason.endswith(stored_iso))
+
     def test_check_needs_investigation_when_new_commit_should_return_needs_investigation(self):
         """Test that new commits trigger investigation."""
         # Arrange
@@ -215,6 +335,110 @@ class TestInvestigationCache(unittest.TestCase):
         self.assertIn(error_message, result["message"])
         self.assertIsNone(result["timestamp"])
     
+    def test_save_investigation_metadata_when_client_reports_unchanged_should_skip_write(self):
+        """Test that an unchanged save is reported as success without a new write."""
+        # Arrange
+        class ConditionalStorage:
+            def __init__(self):
+                self.plain_saves = 0
+
+            def save_investigation_metadata(self, **kwargs):
+                self.plain_saves += 1
+                return {'analysis_timestamp': 2}
+
+            def save_investigation_metadata_if_changed(self, **kwargs):
+                return {'analysis_timestamp': 1, 'unchanged': True}
+
+        storage = ConditionalStorage()
+        cache = InvestigationCache(storage)
+
+        # Act
+        result = cache.save_investigation_metadata(
+            repo_name=self.repo_name,
+            repo_url=self.repo_url,
+            commit_sha=self.current_commit,
+            branch_name=self.current_branch,
+            prompt_versions={'overview': '1'}
+        )
+
+        # Assert
+        self.assertEqual(result["status"], "success")
+        self.assertTrue(result["unchanged"])
+        self.assertEqual(result["timestamp"], 1)
+        self.assertEqual(storage.plain_saves, 0)
+
+    def test_save_prompt_result_after_unchanged_saves_should_widen_ttl(self):
+        """Test that prompt results for a stable repository get a longer TTL."""
+        # Arrange - the cache only uses conditional saves defined on the client class
+        class ConditionalStorage(Mock):
+            def save_investigation_metadata_if_changed(self, **kwargs):
+                return {'analysis_timestamp': 1, 'unchanged': True, 'stable_streak': 2}
+
+        storage = ConditionalStorage()
+        storage.save_analysis_result.return_value = {'status': 'success'}
+        cache = InvestigationCache(storage)
+        cache.save_investigation_metadata(
+            repo_name=self.repo_name,
+            repo_url=self.repo_url,
+            commit_sha=self.current_commit,
+            branch_name=self.current_branch
+        )
+
+        # Act
+        cache.save_prompt_result(
+            self.repo_name, "overview", self.current_commit, "content", ttl_days=30
+        )
+
+        # Assert - two stable saves double the TTL twice
+        ttl_minutes = storage.save_analysis_result.call_args.kwargs['ttl_minutes']
+        self.assertEqual(ttl_minutes, 120 * 24 * 60)
+
+    def test_save_prompt_results_should_write_all_results_in_one_call(self):
+        """Test that batched prompt saves go to storage in a single write."""
+        # Arrange
+        class BatchWriteStorage:
+            def __init__(self):
+                self.calls = []
+
+            def save_analysis_results_many(self, entries, ttl_minutes):
+                self.calls.append((list(entries), ttl_minutes))
+                return [{'status': 'success', 'timestamp': 7} for _ in entries]
+
+        storage = BatchWriteStorage()
+        cache = InvestigationCache(storage)
+
+        # Act
+        results = cache.save_prompt_results(self.repo_name, [
+            ("overview", self.current_commit, "overview result", "2"),
+            ("security", self.current_commit, "security result", "1"),
+        ], ttl_days=1)
+
+        # Assert
+        self.assertEqual(len(storage.calls), 1)
+        entries, ttl_minutes = storage.calls[0]
+        self.assertEqual([e['step_name'] for e in entries], ["overview", "security"])
+        self.assertEqual(ttl_minutes, 24 * 60)
+        self.assertEqual([r["status"] for r in results], ["success", "success"])
+        self.assertEqual(results[1]["cache_key"], entries[1]['reference_key'])
+
+    def test_check_prompt_needs_analysis_after_save_should_hit_without_storage_read(self):
+        """Test that a just-saved prompt result is served from the write-through cache."""
+        # Arrange
+        self.mock_storage_client.save_analysis_result.return_value = {'status': 'success'}
+        self.cache.save_prompt_result(
+            self.repo_name, "overview", self.current_commit, "fresh result", prompt_version="2"
+        )
+
+        # Act
+        result = self.cache.check_prompt_needs_analysis(
+            self.repo_name, "overview", self.current_commit, prompt_version="2"
+        )
+
+        # Assert
+        self.assertFalse(result["needs_analysis"])
+        self.assertEqual(result["cached_result"], "fresh result")
+        self.mock_storage_client.get_analysis_result.assert_not_called()
+
     def test_save_investigation_metadata_with_no_analysis_summary_should_save_successfully(self):
         """Test saving metadata without analysis summary."""
         # Arrange
@@ -238,6 +462,32 @@ class TestInvestigationCache(unittest.TestCase):
         # Now creates an empty dict when None is passed
         self.assertEqual(call_args.kwargs['analysis_data'], {})
     
+    def test_save_investigation_metadata_should_not_share_prompt_metadata_between_saves(self):
+        """Test that mutating one save's prompt metadata does not leak into the next save."""
+        # Arrange
+        self.mock_storage_client.save_investigation_metadata.return_value = {'analysis_timestamp': 1}
+        prompt_versions = {'security': '2', 'overview': '1'}
+        
+        # Act
+        self.cache.save_investigation_metadata(
+            self.repo_name, self.repo_url, self.current_commit, self.current_branch,
+            prompt_versions=prompt_versions
+        )
+        first = self.mock_storage_client.save_investigation_metadata.call_args.kwargs['analysis_data']
+        first['prompt_metadata']['versions']['overview'] = 'tampered'
+        first['prompt_metadata']['count'] = 0
+        self.cache.save_investigation_metadata(
+            self.repo_name, self.repo_url, self.current_commit, self.current_branch,
+            prompt_versions=dict(reversed(prompt_versions.items()))
+        )
+        second = self.mock_storage_client.save_investigation_metadata.call_args.kwargs['analysis_data']
+        
+        # Assert
+        self.assertEqual(
+            second['prompt_metadata'],
+            {'count': 2, 'versions': {'overview': '1', 'security': '2'}}
+        )
+    
     def test_save_investigation_metadata_with_custom_ttl_should_use_provided_ttl(self):
         """Test that custom TTL is properly passed to storage."""
         # Arrange
@@ -408,6 +658,25 @@ class TestPromptLevelCaching(unittest.TestCase):
             ttl_minutes=90 * 24 * 60  # 90 days in minutes
         )
     
+    def test_save_prompt_result_should_expose_fields_as_attributes_and_keys(self):
+        """Test that the save result supports attribute and dict-style access."""
+        # Arrange
+        from src.activities.investigation_cache import CacheOpResult
+        self.mock_storage_client.save_analysis_result.return_value = {'timestamp': 123}
+
+        # Act
+        result = self.cache.save_prompt_result(
+            self.repo_name, self.step_name, self.commit_sha, self.result_content
+        )
+
+        # Assert
+        self.assertIsInstance(result, CacheOpResult)
+        self.assertEqual(result.cache_key, result["cache_key"])
+        self.assertEqual(result.get("timestamp"), 123)
+        self.assertIsNone(result.get("reference_key"))
+        with self.assertRaises(KeyError):
+            result["reference_key"]
+
     def test_save_prompt_result_when_storage_error_should_return_error_status(self):
         """Test error handling when saving prompt results fails."""
         # Arrange
@@ -587,5 +856,55 @@ class TestInvestigationCacheEdgeCases(unittest.TestCase):
         self.assertIn("New commits detected", decision.reason)
 
 
+class TestDependenciesCaching(unittest.TestCase):
+    """Test cases for dependencies caching in InvestigationCache."""
+
+    def test_get_dependencies_when_read_twice_should_hit_storage_once(self):
+        """Test that dependencies read from storage are served in-process afterwards."""
+        # Arrange
+        storage = Mock()
+        storage.get_temporary_analysis_data.return_value = {"python": {}}
+        cache = InvestigationCache(storage)
+
+        # Act
+        first = cache.get_dependencies("deps_a")
+        second = cache.get_dependencies("deps_a")
+
+        # Assert
+        self.assertEqual(first, {"python": {}})
+        self.assertEqual(second, {"python": {}})
+        storage.get_temporary_analysis_data.assert_called_once_with("deps_a")
+
+    def test_get_dependencies_when_read_concurrently_should_share_one_storage_call(self):
+        """Test that concurrent misses on the same key are coalesced."""
+        # Arrange
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_read(reference_key):
+            entered.set()
+            release.wait(timeout=5)
+            return {"python": {}}
+
+        storage = Mock()
+        storage.get_temporary_analysis_data.side_effect = slow_read
+        cache = InvestigationCache(storage)
+        results = []
+        first = threading.Thread(target=lambda: results.append(cache.get_dependencies("deps_a")))
+        second = threading.Thread(target=lambda: results.append(cache.get_dependencies("deps_a")))
+
+        # Act
+        first.start()
+        entered.wait(timeout=5)
+        second.start()
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+        # Assert
+        self.assertEqual(results, [{"python": {}}, {"python": {}}])
+        storage.get_temporary_analysis_data.assert_called_once_with("deps_a")
+
+
 if __name__ == '__main__':
     unittest.main()